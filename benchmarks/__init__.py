@@ -0,0 +1 @@
+"""Seeded load benchmarks for PlatformHub; run with ``python -m benchmarks``."""
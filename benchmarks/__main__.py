@@ -0,0 +1,84 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.run import SCENARIOS, BenchConfig, compare, parse_size, run
+from platformhub.config import settings
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark PlatformHub against seeded data."
+    )
+    parser.add_argument("--size", default="10k", help="Seeded rows: 10k, 100k, 1m or a count")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help="SQLite file to seed and reuse (default: one per size in the temp directory)",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run; repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        help="Override the bcrypt cost; only compare runs that used the same value",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Fail if worse than these results")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline (default: 0.25 = 25%%)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        size = parse_size(args.size)
+    except ValueError as exc:
+        _parser().error(str(exc))
+    if args.bcrypt_rounds is not None:
+        settings.bcrypt_rounds = args.bcrypt_rounds
+
+    config = BenchConfig(
+        size=size,
+        db_path=args.db or Path(tempfile.gettempdir()) / f"platformhub-bench-{size}.db",
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        scenarios=tuple(args.scenario or SCENARIOS),
+    )
+    results = asyncio.run(run(config))
+
+    encoded = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(encoded + "\n")
+    print(encoded)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
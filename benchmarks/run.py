@@ -0,0 +1,275 @@
+"""Benchmark runner: drive the app in-process and compare against a baseline.
+
+Requests go through ``httpx.ASGITransport`` exactly like the test suite, so the
+numbers cover routing, auth, validation, the database and serialization but not the
+network or an ASGI server. The database is a real SQLite file using the production
+storage profile (WAL, split reader/writer pools), seeded once and reset
+between runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import platform
+import statistics
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks.seed import APPROVER, DEVELOPER, prepare
+from platformhub.auth import principal_cache
+from platformhub.config import Settings, settings
+from platformhub.database import build_engines, get_db, get_read_db
+from platformhub.main import app
+from platformhub.models import ResourceType
+from platformhub.services.catalog import catalog_registry
+from platformhub.services.generator import generate_manifest, registry
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+SCENARIOS = ("login", "create", "list", "get", "audit", "search", "review", "render")
+# Metrics where a larger value is a regression; throughput regresses when it drops.
+LATENCY_METRICS = ("p50_ms", "p99_ms")
+
+
+@dataclass
+class BenchConfig:
+    size: int
+    db_path: Path
+    iterations: int = 200
+    concurrency: int = 4
+    scenarios: tuple[str, ...] = SCENARIOS
+
+
+def parse_size(value: str) -> int:
+    if value.lower() in SIZES:
+        return SIZES[value.lower()]
+    try:
+        size = int(value)
+    except ValueError:
+        msg = f"Unknown size {value!r}; use one of {', '.join(SIZES)} or a row count"
+        raise ValueError(msg) from None
+    if size < 1:
+        msg = "Size must be positive"
+        raise ValueError(msg)
+    return size
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict[str, float]:
+    """Throughput and latency percentiles (milliseconds) for one scenario."""
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "count": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Describe every metric that is more than ``max_regression`` worse than the baseline.
+
+    Scenarios missing from either side are ignored so new scenarios can be added
+    without invalidating a stored baseline.
+    """
+    if results["meta"]["size"] != baseline["meta"]["size"]:
+        msg = (
+            f"Baseline was recorded with {baseline['meta']['size']} rows, "
+            f"this run used {results['meta']['size']}"
+        )
+        raise ValueError(msg)
+
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric in LATENCY_METRICS:
+            if current[metric] > previous[metric] * (1 + max_regression):
+                regressions.append(
+                    f"{name}.{metric}: {current[metric]} > {previous[metric]} (baseline)"
+                )
+        if current["throughput_rps"] < previous["throughput_rps"] / (1 + max_regression):
+            regressions.append(
+                f"{name}.throughput_rps: {current['throughput_rps']} "
+                f"< {previous['throughput_rps']} (baseline)"
+            )
+    return regressions
+
+
+async def _measure(
+    call: Callable[[int], Awaitable[None]], iterations: int, concurrency: int
+) -> dict[str, float]:
+    counter = itertools.count()
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        while (i := next(counter)) < iterations:
+            started = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def _measure_render(iterations: int) -> dict[str, float]:
+    """Raw ``generate_manifest`` rate; every name is unique so the render memo never hits."""
+    types = tuple(ResourceType)
+    requests = [
+        SimpleNamespace(
+            resource_type=types[i % len(types)],
+            name=f"render-{time.monotonic_ns()}-{i}",
+            environment="dev",
+            parameters={"team": "bench", "region": "eu-west-1", "storage_gb": "20"},
+        )
+        for i in range(iterations)
+    ]
+    latencies = []
+    started = time.perf_counter()
+    for request in requests:
+        t0 = time.perf_counter()
+        generate_manifest(request)
+        latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+@asynccontextmanager
+async def bench_client(config: BenchConfig) -> AsyncIterator[AsyncClient]:
+    """An in-process client bound to the seeded benchmark database."""
+    bench_settings = Settings(
+        database_url=f"sqlite+aiosqlite:///{config.db_path}", storage_profile="production"
+    )
+    writer, reader = build_engines(bench_settings)
+    await prepare(writer, config.size)
+
+    write_session = async_sessionmaker(writer, expire_on_commit=False)
+    read_session = async_sessionmaker(reader, expire_on_commit=False)
+
+    async def _db():
+        async with write_session() as session:
+            yield session
+
+    async def _read_db():
+        async with read_session() as session:
+            yield session
+
+    registry.compile_all()
+    catalog_registry.load()
+    app.dependency_overrides[get_db] = _db
+    app.dependency_overrides[get_read_db] = _read_db
+    principal_cache.clear()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+            yield ac
+    finally:
+        app.dependency_overrides.clear()
+        await writer.dispose()
+        if reader is not writer:
+            await reader.dispose()
+
+
+async def _login(client: AsyncClient, credentials: tuple[str, str]) -> dict[str, str]:
+    username, password = credentials
+    res = await client.post("/api/auth/login", data={"username": username, "password": password})
+    _check(res, 200)
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def _check(res, expected: int) -> None:
+    if res.status_code != expected:
+        msg = f"{res.request.method} {res.request.url.path} -> {res.status_code}: {res.text}"
+        raise RuntimeError(msg)
+
+
+def _pending_ids(size: int) -> Iterator[int]:
+    # The seed leaves every third request pending, starting with id 1.
+    return iter(range(1, size + 1, 3))
+
+
+async def run(config: BenchConfig) -> dict:
+    """Run the selected scenarios and return ``{"meta": ..., "results": ...}``."""
+    results: dict[str, dict[str, float]] = {}
+    async with bench_client(config) as client:
+        dev = await _login(client, DEVELOPER)
+        approver = await _login(client, APPROVER)
+        run_id = time.monotonic_ns()
+        pending = _pending_ids(config.size)
+        n, c = config.iterations, config.concurrency
+
+        async def login(_: int) -> None:
+            await _login(client, DEVELOPER)
+
+        async def create(i: int) -> None:
+            res = await client.post(
+                "/api/requests/",
+                json={
+                    "resource_type": "s3_bucket",
+                    "name": f"bench-new-{run_id}-{i}",
+                    "environment": "dev",
+                },
+                headers=dev,
+            )
+            _check(res, 201)
+
+        async def list_page(_: int) -> None:
+            _check(await client.get("/api/requests/", headers=dev), 200)
+
+        async def get(i: int) -> None:
+            request_id = i * 7919 % config.size + 1
+            _check(await client.get(f"/api/requests/{request_id}", headers=dev), 200)
+
+        async def audit(i: int) -> None:
+            request_id = i * 7919 % config.size + 1
+            _check(await client.get(f"/api/requests/{request_id}/audit", headers=dev), 200)
+
+        async def search(i: int) -> None:
+            # Alternate a selective name lookup with a term shared by 1/40 of the seed.
+            q = f"bench-{i * 7919 % config.size}" if i % 2 else f"team-{i % 40}"
+            _check(await client.get("/api/requests/search", params={"q": q}, headers=dev), 200)
+
+        async def review(_: int) -> None:
+            request_id = next(pending)
+            res = await client.post(
+                f"/api/admin/{request_id}/review",
+                json={"action": "approved", "comment": "bench"},
+                headers=approver,
+            )
+            _check(res, 200)
+
+        calls = {
+            "login": login,
+            "create": create,
+            "list": list_page,
+            "get": get,
+            "audit": audit,
+            "search": search,
+            "review": review,
+        }
+        for name in config.scenarios:
+            if name == "render":
+                results[name] = _measure_render(n * 10)
+            else:
+                results[name] = await _measure(calls[name], n, c)
+
+    return {
+        "meta": {
+            "size": config.size,
+            "iterations": config.iterations,
+            "concurrency": config.concurrency,
+            "bcrypt_rounds": settings.bcrypt_rounds,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(tz=UTC).isoformat(),
+        },
+        "results": results,
+    }
@@ -0,0 +1,180 @@
+"""Seed a benchmark database with users, requests and audit rows via bulk inserts."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, delete, func, insert, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from platformhub.auth import hash_password
+from platformhub.database import Base
+from platformhub.models import AuditLog, RequestStatus, ResourceRequest, ResourceType, Role, User
+from platformhub.services.search import ensure_search_index, rebuild_search_index
+from platformhub.services.stats import rebuild_stats
+
+CHUNK_SIZE = 10_000
+
+DEVELOPER = ("bench-dev", "bench-dev-pass")
+APPROVER = ("bench-approver", "bench-approver-pass")
+
+_PARAMETERS = {
+    ResourceType.K8S_NAMESPACE: lambda i: {
+        "cpu_limit": ("500m", "1", "2", "4")[i % 4],
+        "memory_limit": "1Gi",
+        "team": f"team-{i % 40}",
+    },
+    ResourceType.S3_BUCKET: lambda i: {
+        "versioning": "true",
+        "region": ("eu-west-1", "us-east-1")[i % 2],
+    },
+    ResourceType.RDS_DATABASE: lambda i: {
+        "engine_version": "16",
+        "instance_class": ("db.t3.micro", "db.t3.small", "db.t3.medium")[i % 3],
+        "storage_gb": "20",
+        "multi_az": "false",
+    },
+}
+_TYPES = tuple(_PARAMETERS)
+_ENVIRONMENTS = ("dev", "staging", "production")
+# Two thirds reviewed; every third request (ids 1, 4, 7, ...) stays pending for the
+# review scenario to consume.
+_STATUSES = (RequestStatus.PENDING, RequestStatus.APPROVED, RequestStatus.REJECTED)
+
+
+async def _seeded_rows(engine: AsyncEngine) -> int:
+    async with engine.connect() as conn:
+        if not await conn.run_sync(lambda c: c.dialect.has_table(c, "resource_requests")):
+            return 0
+        return (await conn.execute(select(func.count(ResourceRequest.id)))).scalar_one()
+
+
+async def reset(engine: AsyncEngine, size: int) -> None:
+    """Undo what a previous run wrote, so a seeded database can be reused.
+
+    Drops requests (and their audit rows) created by the benchmark and re-opens the
+    seeded pending requests consumed by the review scenario. Rows beyond ``size``
+    are dropped too, which lets a larger seed serve a smaller run.
+    """
+    reopened = and_(ResourceRequest.id % 3 == 1, ResourceRequest.id <= size)
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(AuditLog).where(
+                or_(
+                    AuditLog.request_id > size,
+                    and_(AuditLog.request_id % 3 == 1, AuditLog.action != "created"),
+                )
+            )
+        )
+        await conn.execute(delete(ResourceRequest).where(ResourceRequest.id > size))
+        await conn.execute(text("DELETE FROM request_search WHERE rowid > :size"), {"size": size})
+        await conn.execute(
+            update(ResourceRequest)
+            .where(reopened, ResourceRequest.status != RequestStatus.PENDING)
+            .values(
+                status=RequestStatus.PENDING,
+                reviewer_id=None,
+                review_comment=None,
+                reviewed_at=None,
+                inline_manifest=None,
+                manifest_digest=None,
+            )
+        )
+
+
+async def prepare(engine: AsyncEngine, size: int) -> bool:
+    """Reuse the database behind ``engine`` if it holds a ``size`` seed, else re-seed.
+
+    Returns True when the database was seeded from scratch.
+    """
+    seeded = True
+    if await _seeded_rows(engine) >= size:
+        # Tables added since the database was seeded.
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await reset(engine, size)
+        seeded = await _seeded_rows(engine) != size
+    if seeded:
+        await seed(engine, size)
+    # The seed and the reset bypass the stat counters; recompute them. The search
+    # index only needs building for a new seed (or one made before search existed):
+    # text a reset leaves behind for reopened requests doesn't change what is measured.
+    async with AsyncSession(engine) as db:
+        await rebuild_stats(db)
+        if seeded:
+            await rebuild_search_index(db)
+        else:
+            await ensure_search_index(db)
+    return seeded
+
+
+async def seed(engine: AsyncEngine, size: int) -> dict[str, int]:
+    """Create the schema, two users and ``size`` requests with 1-2 audit rows each."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        user_ids = {}
+        for (username, password), role in ((DEVELOPER, Role.DEVELOPER), (APPROVER, Role.APPROVER)):
+            result = await conn.execute(
+                insert(User).returning(User.id),
+                [
+                    {
+                        "username": username,
+                        "email": f"{username}@bench.local",
+                        "hashed_password": hash_password(password),
+                        "role": role,
+                    }
+                ],
+            )
+            user_ids[role] = result.scalar_one()
+
+    developer, approver = user_ids[Role.DEVELOPER], user_ids[Role.APPROVER]
+    start = datetime.now(tz=UTC) - timedelta(seconds=size)
+    audit_rows = 0
+    for offset in range(0, size, CHUNK_SIZE):
+        requests, audits = [], []
+        for i in range(offset, min(offset + CHUNK_SIZE, size)):
+            resource_type = _TYPES[i % len(_TYPES)]
+            status = _STATUSES[i % len(_STATUSES)]
+            created_at = start + timedelta(seconds=i)
+            reviewed = status != RequestStatus.PENDING
+            requests.append(
+                {
+                    "id": i + 1,
+                    "resource_type": resource_type,
+                    "name": f"bench-{i}",
+                    "environment": _ENVIRONMENTS[i % len(_ENVIRONMENTS)],
+                    "parameters": _PARAMETERS[resource_type](i),
+                    "status": status,
+                    "requester_id": developer,
+                    "reviewer_id": approver if reviewed else None,
+                    "review_comment": "ok" if reviewed else None,
+                    "created_at": created_at,
+                    "reviewed_at": created_at + timedelta(minutes=5) if reviewed else None,
+                }
+            )
+            audits.append(
+                {
+                    "request_id": i + 1,
+                    "action": "created",
+                    "actor_id": developer,
+                    "details": f"Requested {resource_type.value} 'bench-{i}'",
+                    "created_at": created_at,
+                }
+            )
+            if reviewed:
+                audits.append(
+                    {
+                        "request_id": i + 1,
+                        "action": status.value,
+                        "actor_id": approver,
+                        "details": "ok",
+                        "created_at": created_at + timedelta(minutes=5),
+                    }
+                )
+        async with engine.begin() as conn:
+            await conn.execute(insert(ResourceRequest), requests)
+            await conn.execute(insert(AuditLog), audits)
+        audit_rows += len(audits)
+
+    return {"requests": size, "audit_logs": audit_rows}
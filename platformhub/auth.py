@@ -2,28 +2,98 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TypeVar
 
 import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from platformhub.config import settings
-from platformhub.database import get_db
+from platformhub.database import get_read_db
 from platformhub.models import Role, User
+from platformhub.services.metrics import HASHING, JWT_DECODE
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+_T = TypeVar("_T")
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    with HASHING.time():
+        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+        return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return bcrypt.checkpw(plain.encode(), hashed.encode())
+    with HASHING.time():
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+
+
+def needs_rehash(hashed: str) -> bool:
+    """True if the hash was produced with a bcrypt cost other than the configured one."""
+    try:
+        return int(hashed.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
+
+
+class HashingPool:
+    """Bounded thread pool that keeps bcrypt work off the event loop.
+
+    bcrypt releases the GIL, so a few threads give real parallelism. Work that would
+    push the number of queued + running jobs past ``queue_limit`` is refused with a
+    503 instead of piling up behind a login burst.
+    """
+
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self._workers = workers
+        self._queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+
+    async def run(self, fn: Callable[..., _T], *args) -> _T:
+        if self._pending >= self._queue_limit:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is temporarily overloaded, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="bcrypt"
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(settings.hashing_workers, settings.hashing_queue_limit)
+
+
+async def hash_password_async(password: str) -> str:
+    return await hashing_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await hashing_pool.run(verify_password, plain, hashed)
 
 
 def create_access_token(data: dict) -> str:
@@ -33,34 +103,120 @@ def create_access_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated caller, detached from any session."""
+
+    id: int
+    username: str
+    role: Role
+
+
+class PrincipalCache:
+    """TTL + LRU bounded map of JWT subject to :class:`Principal`.
+
+    Saves the ``users`` lookup on every authenticated call. Entries are dropped when
+    the user's role changes or the user is deleted (see the ORM listeners below); the
+    TTL bounds staleness for changes made by other processes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+
+    def get(self, username: str) -> Principal | None:
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del self._entries[username]
+            return None
+        self._entries.move_to_end(username)
+        return principal
+
+    def put(self, principal: Principal) -> None:
+        self._entries[principal.username] = (time.monotonic() + self._ttl, principal)
+        self._entries.move_to_end(principal.username)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    settings.principal_cache_size, settings.principal_cache_ttl_seconds
+)
+
+
+def _invalidate_user(session: Session, user: User) -> None:
+    # Drop now, and again after commit so a concurrent miss can't re-cache the old row.
+    principal_cache.invalidate(user.username)
+    session.info.setdefault("stale_principals", set()).add(user.username)
+
+
+@event.listens_for(User, "after_update")
+def _on_user_update(_mapper, connection, target: User) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        _invalidate_user(session, target)
+
+
+@event.listens_for(User, "after_delete")
+def _on_user_delete(_mapper, connection, target: User) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        _invalidate_user(session, target)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    for username in session.info.pop("stale_principals", ()):
+        principal_cache.invalidate(username)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_read_db),
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        with JWT_DECODE.time():
+            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         username: str | None = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError as err:
         raise credentials_exception from err
 
-    result = await db.execute(select(User).where(User.username == username))
-    user = result.scalar_one_or_none()
-    if user is None:
+    principal = principal_cache.get(username)
+    if principal is not None:
+        return principal
+
+    result = await db.execute(
+        select(User.id, User.username, User.role).where(User.username == username)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise credentials_exception
-    return user
+    principal = Principal(id=row.id, username=row.username, role=row.role)
+    principal_cache.put(principal)
+    return principal
 
 
 def require_role(*roles: Role):
     """Dependency that checks the current user has one of the required roles."""
 
-    async def _check(current_user: User = Depends(get_current_user)) -> User:
+    async def _check(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
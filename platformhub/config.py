@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,11 +12,50 @@ class Settings(BaseSettings):
     debug: bool = False
 
     database_url: str = "sqlite+aiosqlite:///./platformhub.db"
+    database_read_url: str | None = None
+    storage_profile: Literal["default", "production"] = "default"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
 
     secret_key: str = "change-me-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
 
+    bcrypt_rounds: int = 12
+    hashing_workers: int = 4
+    hashing_queue_limit: int = 64
+
+    principal_cache_ttl_seconds: float = 60.0
+    principal_cache_size: int = 10_000
+
+    catalog_dir: str | None = None
+    catalog_reload_interval_seconds: float = 2.0
+
+    template_cache_dir: str | None = None
+    manifest_render_cache_size: int = 1024
+    manifest_render_mode: Literal["inline", "background"] = "inline"
+    render_workers: int = 2
+    render_max_attempts: int = 3
+    render_retry_backoff_seconds: float = 0.5
+
+    audit_mode: Literal["transactional", "buffered"] = "transactional"
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+    audit_spool_path: str = "./platformhub-audit.spool.jsonl"
+    audit_archive_dir: str | None = None
+    audit_retention_days: int = 90
+    audit_archive_segment_rows: int = 100_000
+
+    event_history_size: int = 1000
+    event_queue_size: int = 100
+    event_heartbeat_seconds: float = 15.0
+
+    metrics_enabled: bool = True
+
     model_config = {"env_prefix": "PLATFORMHUB_"}
 
 
@@ -4,13 +4,86 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Connection, event, inspect, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateColumn, CreateIndex
 
-from platformhub.config import settings
+from platformhub.config import Settings, settings
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _is_memory_db(url: str) -> bool:
+    database = make_url(url).database or ""
+    return database in ("", ":memory:") or ":memory:" in database or "mode=memory" in url
+
+
+def _install_sqlite_pragmas(engine: AsyncEngine, config: Settings, *, read_only: bool) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(config.sqlite_cache_size_kib)}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def build_engines(config: Settings) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the ``(writer, reader)`` engines for the configured storage profile.
+
+    The default profile uses one engine for both. The production profile splits them:
+    on SQLite every connection runs in WAL mode with tuned pragmas, the writer pool
+    holds a single connection (writes queue in-process instead of failing with
+    "database is locked") and readers get their own pool, so reads never wait on
+    writes. On other backends the reader may point at a replica via
+    ``database_read_url``.
+    """
+    url = config.database_url
+    pool_kwargs = {}
+    if not _is_memory_db(url):
+        pool_kwargs = {
+            "pool_size": config.db_pool_size,
+            "max_overflow": config.db_max_overflow,
+            "pool_recycle": config.db_pool_recycle_seconds,
+        }
+
+    if config.storage_profile == "default":
+        writer = create_async_engine(url, echo=config.debug, **pool_kwargs)
+        return writer, writer
+
+    if _is_sqlite(url) and not _is_memory_db(url):
+        writer = create_async_engine(
+            url, echo=config.debug, **{**pool_kwargs, "pool_size": 1, "max_overflow": 0}
+        )
+        reader = create_async_engine(url, echo=config.debug, **pool_kwargs)
+        _install_sqlite_pragmas(writer, config, read_only=False)
+        _install_sqlite_pragmas(reader, config, read_only=True)
+        return writer, reader
+
+    writer = create_async_engine(url, echo=config.debug, pool_pre_ping=True, **pool_kwargs)
+    if config.database_read_url is None:
+        return writer, writer
+    reader = create_async_engine(
+        config.database_read_url, echo=config.debug, pool_pre_ping=True, **pool_kwargs
+    )
+    return writer, reader
+
+
+engine, read_engine = build_engines(settings)
 async_session = async_sessionmaker(engine, expire_on_commit=False)
+read_session = async_sessionmaker(read_engine, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
@@ -22,6 +95,44 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
         yield session
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    """Session for read-only endpoints; served by the reader pool when one is configured."""
+    async with read_session() as session:
+        yield session
+
+
+def _upgrade_existing_tables(conn: Connection) -> None:
+    """Add columns and indexes introduced after a table was first created.
+
+    ``create_all`` never alters existing tables. Only additive changes are handled:
+    nullable (or server-defaulted) columns and new indexes; anything else needs a
+    real migration.
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable and column.server_default is None:
+                msg = f"Cannot add non-nullable column {table.name}.{column.name} in place"
+                raise RuntimeError(msg)
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+        # Expression indexes are not reflected, so let the database skip existing ones.
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def create_schema(conn: Connection) -> None:
+    """Create missing tables, then add missing columns and indexes to existing ones."""
+    Base.metadata.create_all(conn)
+    _upgrade_existing_tables(conn)
+
+
 async def init_db() -> None:
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_schema)
@@ -0,0 +1,31 @@
+"""HTTP conditional-request helpers (ETag / If-None-Match)."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response, status
+
+
+def strong_etag(data: bytes | str) -> str:
+    """Quoted strong ETag for a representation."""
+    if isinstance(data, str):
+        data = data.encode()
+    return f'"{hashlib.sha256(data).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an ``If-None-Match`` header value matches ``etag`` (RFC 9110 weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
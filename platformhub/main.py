@@ -5,14 +5,21 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from platformhub import __version__
-from platformhub.database import init_db
-from platformhub.routers import admin, auth, catalog, requests
+from platformhub.auth import hashing_pool
+from platformhub.config import settings
+from platformhub.database import engine, read_engine
+from platformhub.routers import admin, auth, catalog, events, requests, stats
+from platformhub.services.audit import audit_sink
+from platformhub.services.metrics import CONTENT_TYPE, MetricsMiddleware, metrics
+from platformhub.services.query_stats import ServerTimingMiddleware
+from platformhub.services.rendering import pipeline
+from platformhub.services.startup import Phase, prepare_database, readiness, warm_up
 
 TEMPLATES_DIR = Path(__file__).parent / "templates" / "pages"
 STATIC_DIR = Path(__file__).parent.parent / "static"
@@ -20,8 +27,20 @@ STATIC_DIR = Path(__file__).parent.parent / "static"
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
+    readiness.phase = Phase.STARTING
+    await prepare_database(engine)
+    await warm_up((engine, read_engine), templates.env)
+    if settings.audit_mode == "buffered":
+        await audit_sink.start()
+    if settings.manifest_render_mode == "background":
+        await pipeline.start()
+    readiness.phase = Phase.READY
     yield
+    # Fail health checks first so load balancers drain this worker.
+    readiness.phase = Phase.STOPPING
+    await pipeline.stop()
+    await audit_sink.stop()
+    hashing_pool.shutdown()
 
 
 app = FastAPI(
@@ -31,6 +50,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if settings.debug:
+    app.add_middleware(ServerTimingMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
@@ -38,13 +61,29 @@ app.include_router(auth.router)
 app.include_router(catalog.router)
 app.include_router(requests.router)
 app.include_router(admin.router)
+app.include_router(events.router)
+app.include_router(stats.router)
 
 
 @app.get("/health")
 async def health():
+    """200 once this worker has started and warmed up; 503 while starting or stopping."""
+    if not readiness.ready:
+        return JSONResponse(
+            {"status": readiness.phase.value, "version": __version__},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
     return {"status": "ok", "version": __version__}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus text exposition of this process's metrics."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     return templates.TemplateResponse(request, "index.html")
@@ -3,9 +3,23 @@
 from __future__ import annotations
 
 import enum
+import zlib
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    bindparam,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from platformhub.database import Base
@@ -23,6 +37,7 @@ class Role(enum.StrEnum):
 
 class RequestStatus(enum.StrEnum):
     PENDING = "pending"
+    RENDERING = "rendering"
     APPROVED = "approved"
     REJECTED = "rejected"
 
@@ -43,23 +58,43 @@ class User(Base):
     role: Mapped[Role] = mapped_column(Enum(Role), default=Role.DEVELOPER)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
 
+    # Relationships raise instead of lazy loading: an implicit per-row SELECT is the
+    # N+1 pattern, so endpoints select the columns they need or load eagerly.
     requests: Mapped[list[ResourceRequest]] = relationship(
-        back_populates="requester", foreign_keys="ResourceRequest.requester_id"
+        back_populates="requester",
+        foreign_keys="ResourceRequest.requester_id",
+        lazy="raise_on_sql",
     )
 
 
 class ResourceRequest(Base):
     __tablename__ = "resource_requests"
+    # Keyset pagination walks (created_at, id); each filter gets its own prefix so
+    # filtered pages stay index range scans instead of sorting the whole table.
+    __table_args__ = (
+        Index("ix_resource_requests_created", "created_at", "id"),
+        Index("ix_resource_requests_status_created", "status", "created_at", "id"),
+        Index("ix_resource_requests_type_created", "resource_type", "created_at", "id"),
+        Index("ix_resource_requests_env_created", "environment", "created_at", "id"),
+        Index("ix_resource_requests_requester_created", "requester_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     resource_type: Mapped[ResourceType] = mapped_column(Enum(ResourceType))
     name: Mapped[str] = mapped_column(String(100))
     environment: Mapped[str] = mapped_column(String(20))
-    parameters: Mapped[str] = mapped_column(Text, default="{}")
+    parameters: Mapped[dict[str, str]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), default=dict
+    )
     status: Mapped[RequestStatus] = mapped_column(
         Enum(RequestStatus), default=RequestStatus.PENDING
     )
-    generated_manifest: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Manifests live in manifest_blobs; the inline column only holds rows written before
+    # the blob store existed (see services.manifest_store.migrate_inline_manifests).
+    inline_manifest: Mapped[str | None] = mapped_column("generated_manifest", Text, nullable=True)
+    manifest_digest: Mapped[str | None] = mapped_column(
+        ForeignKey("manifest_blobs.digest"), nullable=True
+    )
 
     requester_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     reviewer_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
@@ -67,14 +102,83 @@ class ResourceRequest(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
     reviewed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Latest background rendering job (services.rendering); null if none was queued.
+    render_attempts: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    render_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    render_enqueued_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Set when a worker picks the job up, cleared while it waits to retry.
+    render_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    render_finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Bumped by the ORM on every UPDATE: cheap ETags, and a concurrent review of the
+    # same row fails with StaleDataError instead of silently overwriting.
+    version: Mapped[int] = mapped_column(Integer, server_default="1")
+    __mapper_args__ = {"version_id_col": version}
+
+    requester: Mapped[User] = relationship(
+        back_populates="requests", foreign_keys=[requester_id], lazy="raise_on_sql"
+    )
+    reviewer: Mapped[User | None] = relationship(foreign_keys=[reviewer_id], lazy="raise_on_sql")
+    audit_logs: Mapped[list[AuditLog]] = relationship(back_populates="request", lazy="raise_on_sql")
+    manifest_blob: Mapped[ManifestBlob | None] = relationship(lazy="raise_on_sql")
+
+    @property
+    def generated_manifest(self) -> str | None:
+        """Manifest text; requires ``manifest_blob`` to be loaded when a digest is set."""
+        if self.manifest_blob is not None:
+            return self.manifest_blob.text
+        return self.inline_manifest
+
+
+# Parameters that list/search endpoints commonly filter on get expression indexes.
+INDEXED_PARAMETERS = ("team", "region", "instance_class")
+
+
+def parameter_value(key: str):
+    """SQL expression for ``parameters[key]`` as text.
+
+    The JSON path is rendered inline rather than bound so the expression matches the
+    expression indexes below (SQLite only uses them on an exact textual match).
+    """
+    path = bindparam(None, key, type_=JSON.JSONIndexType, literal_execute=True)
+    return ResourceRequest.parameters[path].as_string()
+
+
+for _key in INDEXED_PARAMETERS:
+    Index(f"ix_resource_requests_param_{_key}", parameter_value(_key))
+
+
+class ManifestBlob(Base):
+    """A rendered manifest, compressed and keyed by the SHA-256 of its text."""
+
+    __tablename__ = "manifest_blobs"
 
-    requester: Mapped[User] = relationship(back_populates="requests", foreign_keys=[requester_id])
-    reviewer: Mapped[User | None] = relationship(foreign_keys=[reviewer_id])
-    audit_logs: Mapped[list[AuditLog]] = relationship(back_populates="request")
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(10), default="zlib")
+    size: Mapped[int] = mapped_column(Integer)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+
+    @property
+    def text(self) -> str:
+        if self.codec != "zlib":
+            msg = f"Unsupported manifest codec: {self.codec}"
+            raise ValueError(msg)
+        return zlib.decompress(self.data).decode()
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_request_created", "request_id", "created_at"),
+        Index("ix_audit_logs_actor_created", "actor_id", "created_at"),
+        Index("ix_audit_logs_created", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     request_id: Mapped[int] = mapped_column(ForeignKey("resource_requests.id"))
@@ -83,5 +187,51 @@ class AuditLog(Base):
     details: Mapped[str] = mapped_column(Text, default="")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
 
-    request: Mapped[ResourceRequest] = relationship(back_populates="audit_logs")
-    actor: Mapped[User] = relationship()
+    request: Mapped[ResourceRequest] = relationship(
+        back_populates="audit_logs", lazy="raise_on_sql"
+    )
+    actor: Mapped[User] = relationship(lazy="raise_on_sql")
+
+
+class RequestCounter(Base):
+    """Number of requests per requester, type, environment and status.
+
+    Maintained in the same transaction as every status change (see
+    ``services.stats``), so dashboard totals never need to scan ``resource_requests``.
+    """
+
+    __tablename__ = "request_counters"
+
+    requester_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    resource_type: Mapped[ResourceType] = mapped_column(Enum(ResourceType), primary_key=True)
+    environment: Mapped[str] = mapped_column(String(20), primary_key=True)
+    status: Mapped[RequestStatus] = mapped_column(Enum(RequestStatus), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ReviewLeadTime(Base):
+    """Histogram of submission-to-review time per environment.
+
+    ``bucket`` indexes ``services.stats.LEAD_TIME_BUCKETS``; the last bucket is +Inf.
+    """
+
+    __tablename__ = "review_lead_times"
+
+    environment: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    total_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+
+
+class SchemaVersion(Base):
+    """Fingerprint of the schema last applied to this database (a single row).
+
+    Lets a starting worker confirm the schema is current with one primary-key read
+    instead of running DDL (see ``services.startup``).
+    """
+
+    __tablename__ = "schema_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64))
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
@@ -2,43 +2,223 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
-from platformhub.auth import require_role
-from platformhub.database import get_db
-from platformhub.models import RequestStatus, ResourceRequest, Role, User
-from platformhub.schemas import ResourceRequestResponse, ReviewAction
-from platformhub.services.approval import review_request
+from platformhub.auth import Principal, require_role
+from platformhub.config import settings
+from platformhub.database import get_db, get_read_db
+from platformhub.models import RequestStatus, ResourceRequest, ResourceType, Role
+from platformhub.schemas import (
+    AuditArchiveReport,
+    BulkReviewAction,
+    BulkReviewItem,
+    ManifestMigrationReport,
+    ResourceRequestResponse,
+    ResourceRequestSummary,
+    ReviewAction,
+    SearchRebuildReport,
+    StatsRebuildReport,
+)
+from platformhub.services.approval import review_request, review_requests_bulk
+from platformhub.services.archive import archive_audit_logs, audit_archive
+from platformhub.services.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    requests_export_query,
+    stream_audit_export,
+    stream_export,
+)
+from platformhub.services.filters import parameter_filters
+from platformhub.services.manifest_store import migrate_inline_manifests
+from platformhub.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    paginate_requests,
+    split_page,
+)
+from platformhub.services.search import rebuild_search_index
+from platformhub.services.serialization import (
+    FastJSONResponse,
+    select_summaries,
+    summaries_response,
+)
+from platformhub.services.stats import rebuild_stats
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+CONFLICT = "Request was modified concurrently; reload it and try again"
+
 
-@router.get("/pending", response_model=list[ResourceRequestResponse])
+@router.get(
+    "/pending", response_model=list[ResourceRequestSummary], response_class=FastJSONResponse
+)
 async def list_pending_requests(
-    _current_user: User = Depends(require_role(Role.APPROVER, Role.ADMIN)),
+    resource_type: ResourceType | None = None,
+    environment: str | None = None,
+    requester_id: int | None = None,
+    param: list[str] = Query([], description="Parameter filter as key:value, repeatable"),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    _current_user: Principal = Depends(require_role(Role.APPROVER, Role.ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """List pending resource requests awaiting review, oldest first.
+
+    Keyset-paginated like ``GET /api/requests/``; follow ``X-Next-Cursor`` for more.
+    """
+    query = select_summaries().where(ResourceRequest.status == RequestStatus.PENDING)
+    if resource_type is not None:
+        query = query.where(ResourceRequest.resource_type == resource_type)
+    if environment is not None:
+        query = query.where(ResourceRequest.environment == environment)
+    if requester_id is not None:
+        query = query.where(ResourceRequest.requester_id == requester_id)
+
+    try:
+        query = query.where(*parameter_filters(param))
+        query = paginate_requests(query, cursor, limit, descending=False)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    result = await db.execute(query)
+    page, next_cursor = split_page(result.all(), limit)
+    return summaries_response(page, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {})
+
+
+@router.post("/review", response_model=list[BulkReviewItem])
+async def bulk_review(
+    payload: BulkReviewAction,
+    current_user: Principal = Depends(require_role(Role.APPROVER, Role.ADMIN)),
+    read_db: AsyncSession = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
+):
+    """Approve or reject many requests at once, reporting the outcome of each.
+
+    A request changed by someone else in the meantime is skipped with ``conflict``.
+    """
+    try:
+        return await review_requests_bulk(
+            payload.request_ids, current_user, payload.action, payload.comment, db, read_db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.post("/manifests/migrate", response_model=ManifestMigrationReport)
+async def migrate_manifests(
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    """Move inline manifests into the content-addressed blob store and report savings."""
+    return await migrate_inline_manifests(db)
+
+
+@router.post("/audit/archive", response_model=AuditArchiveReport)
+async def archive_audit(
+    older_than_days: int = Query(
+        settings.audit_retention_days, ge=0, description="Archive entries older than this"
+    ),
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all pending resource requests awaiting review."""
-    result = await db.execute(
-        select(ResourceRequest)
-        .where(ResourceRequest.status == RequestStatus.PENDING)
-        .order_by(ResourceRequest.created_at)
+    """Move old audit entries out of the database into compressed archive segments."""
+    try:
+        return await archive_audit_logs(
+            db,
+            audit_archive,
+            timedelta(days=older_than_days),
+            settings.audit_archive_segment_rows,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.post("/stats/rebuild", response_model=StatsRebuildReport)
+async def rebuild_request_stats(
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    """Recompute the dashboard counters and lead-time histograms from the requests."""
+    return await rebuild_stats(db)
+
+
+@router.post("/search/rebuild", response_model=SearchRebuildReport)
+async def rebuild_request_search(
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    """Recreate the full-text search index from the requests and their audit trail."""
+    try:
+        return await rebuild_search_index(db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+def _export_response(
+    body: AsyncIterator[bytes], fmt: ExportFormat, basename: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{basename}.{fmt}"'},
     )
-    return result.scalars().all()
+
+
+@router.get(
+    "/export/requests",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media: {} for media in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_requests(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    since: datetime | None = Query(None, description="Include rows created at or after"),
+    until: datetime | None = Query(None, description="Include rows created before"),
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Stream every resource request created in ``[since, until)`` as NDJSON or CSV."""
+    return _export_response(
+        stream_export(db, requests_export_query(since, until), fmt), fmt, "requests"
+    )
+
+
+@router.get(
+    "/export/audit",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media: {} for media in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_audit(
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    since: datetime | None = Query(None, description="Include entries created at or after"),
+    until: datetime | None = Query(None, description="Include entries created before"),
+    _current_user: Principal = Depends(require_role(Role.ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Stream every audit entry recorded in ``[since, until)``, archived ones included."""
+    return _export_response(stream_audit_export(db, audit_archive, since, until, fmt), fmt, "audit")
 
 
 @router.post("/{request_id}/review", response_model=ResourceRequestResponse)
 async def review(
     request_id: int,
     payload: ReviewAction,
-    current_user: User = Depends(require_role(Role.APPROVER, Role.ADMIN)),
+    current_user: Principal = Depends(require_role(Role.APPROVER, Role.ADMIN)),
+    read_db: AsyncSession = Depends(get_read_db),
     db: AsyncSession = Depends(get_db),
 ):
     """Approve or reject a resource request. Generates manifests on approval."""
-    result = await db.execute(select(ResourceRequest).where(ResourceRequest.id == request_id))
+    result = await read_db.execute(select(ResourceRequest).where(ResourceRequest.id == request_id))
     req = result.scalar_one_or_none()
+    # Detach the request; the writer adopts it once the manifest is rendered.
+    await read_db.close()
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
 
@@ -46,5 +226,7 @@ async def review(
         updated = await review_request(req, current_user, payload.action, payload.comment, db)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except StaleDataError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CONFLICT) from e
 
     return updated
@@ -1,52 +1,93 @@
-"""Authentication routes: register and login."""
+"""Authentication routes: register and login.
+
+bcrypt takes a few hundred milliseconds, and in the production profile the writer
+pool holds a single connection. Lookups therefore go through the reader session,
+which is closed before hashing, and the writer is only touched for the INSERT or the
+rehash UPDATE once the hash is ready.
+"""
 
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from platformhub.auth import create_access_token, hash_password, verify_password
-from platformhub.database import get_db
+from platformhub.auth import (
+    create_access_token,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from platformhub.database import get_db, get_read_db
 from platformhub.models import User
 from platformhub.schemas import Token, UserCreate, UserResponse
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+_ALREADY_REGISTERED = "Username or email already registered"
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(User).where((User.username == payload.username) | (User.email == payload.email))
+async def register(
+    payload: UserCreate,
+    read_db: AsyncSession = Depends(get_read_db),
+    db: AsyncSession = Depends(get_db),
+):
+    taken = await read_db.scalar(
+        select(User.id)
+        .where((User.username == payload.username) | (User.email == payload.email))
+        .limit(1)
     )
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Username or email already registered")
+    await read_db.close()
+    if taken is not None:
+        raise HTTPException(status_code=400, detail=_ALREADY_REGISTERED)
 
     user = User(
         username=payload.username,
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
     )
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    try:
+        await db.commit()
+    except IntegrityError as err:
+        # Someone registered the same name while we were hashing.
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=_ALREADY_REGISTERED) from err
     return user
 
 
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
+    read_db: AsyncSession = Depends(get_read_db),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(User).where(User.username == form_data.username))
-    user = result.scalar_one_or_none()
+    result = await read_db.execute(
+        select(User.id, User.username, User.role, User.hashed_password).where(
+            User.username == form_data.username
+        )
+    )
+    user = result.one_or_none()
+    await read_db.close()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
         )
 
+    if needs_rehash(user.hashed_password):
+        rehashed = await hash_password_async(form_data.password)
+        # Skip the write if the password changed since the lookup.
+        await db.execute(
+            update(User)
+            .where(User.id == user.id, User.hashed_password == user.hashed_password)
+            .values(hashed_password=rehashed)
+        )
+        await db.commit()
+
     token = create_access_token(data={"sub": user.username, "role": user.role.value})
     return Token(access_token=token)
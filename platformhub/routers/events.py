@@ -0,0 +1,39 @@
+"""Server-sent events stream of request status changes."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.auth import Principal, get_current_user
+from platformhub.database import get_read_db
+from platformhub.services.events import event_bus
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_events(
+    last_event_id: str | None = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Stream ``request.created`` / ``request.updated`` events visible to the caller.
+
+    Each event's data is the request as listed by ``GET /api/requests/``. Reconnect with
+    ``Last-Event-ID`` to resume; a ``reset`` event means the gap could not be replayed
+    and the client should reload its lists.
+    """
+    # The stream may stay open for hours; don't pin the connection used for auth.
+    await db.close()
+    subscription = event_bus.subscribe(current_user, last_event_id)
+    return StreamingResponse(
+        event_bus.stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,73 +2,335 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from platformhub.auth import get_current_user
-from platformhub.database import get_db
-from platformhub.models import AuditLog, ResourceRequest, User
-from platformhub.schemas import ResourceRequestCreate, ResourceRequestResponse
+from platformhub.auth import Principal, get_current_user
+from platformhub.database import get_db, get_read_db
+from platformhub.http_cache import etag_matches, not_modified, strong_etag
+from platformhub.models import (
+    AuditLog,
+    ManifestBlob,
+    RequestStatus,
+    ResourceRequest,
+    ResourceType,
+    User,
+)
+from platformhub.schemas import (
+    RenderJobResponse,
+    RequestSearchHit,
+    ResourceRequestBatchCreate,
+    ResourceRequestBatchItem,
+    ResourceRequestCreate,
+    ResourceRequestResponse,
+    ResourceRequestSummary,
+)
+from platformhub.services.archive import audit_archive
+from platformhub.services.audit import audit_entry, audit_sink
+from platformhub.services.catalog import catalog_registry
+from platformhub.services.events import REQUEST_CREATED, event_bus
+from platformhub.services.filters import parameter_filters
+from platformhub.services.generator import MANIFEST_MEDIA_TYPES
+from platformhub.services.metrics import requests_created
+from platformhub.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    decode_offset_cursor,
+    encode_offset_cursor,
+    paginate_requests,
+    split_page,
+)
+from platformhub.services.rendering import RENDER_JOB_COLUMNS, render_job
+from platformhub.services.search import index_created
+from platformhub.services.search import search_requests as search_index
+from platformhub.services.serialization import (
+    FastJSONResponse,
+    select_summaries,
+    summaries_response,
+)
+from platformhub.services.stats import record_created
 
 router = APIRouter(prefix="/api/requests", tags=["requests"])
 
 
+def _created_details(payload: ResourceRequestCreate) -> str:
+    return f"Requested {payload.resource_type.value} '{payload.name}' in {payload.environment}"
+
+
+def _validated_parameters(
+    items: list[ResourceRequestCreate], *, batch: bool = False
+) -> list[dict[str, str]]:
+    """Check parameters against the catalog and fill in defaults, before touching the DB.
+
+    Errors are raised as a 422 whose ``loc`` points at the offending parameter (and,
+    for a batch, the item index), like FastAPI's own validation errors.
+    """
+    snapshot = catalog_registry.snapshot()
+    normalized: list[dict[str, str]] = []
+    errors: list[dict] = []
+    for index, item in enumerate(items):
+        item_loc = ("body", "requests", index) if batch else ("body",)
+        validator = snapshot.validators.get(item.resource_type)
+        if validator is None:
+            normalized.append(item.parameters)
+            continue
+        params, problems = validator.validate(item.parameters)
+        normalized.append(params)
+        errors.extend(
+            {
+                "type": "value_error",
+                "loc": (*item_loc, "parameters", problem.name),
+                "msg": problem.message,
+                "input": problem.value,
+            }
+            for problem in problems
+        )
+    if errors:
+        raise RequestValidationError(errors)
+    return normalized
+
+
 @router.post("/", response_model=ResourceRequestResponse, status_code=status.HTTP_201_CREATED)
 async def create_request(
     payload: ResourceRequestCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Submit a new infrastructure resource request."""
+    (parameters,) = _validated_parameters([payload])
     resource_request = ResourceRequest(
         resource_type=payload.resource_type,
         name=payload.name,
         environment=payload.environment,
-        parameters=json.dumps(payload.parameters),
+        parameters=parameters,
         requester_id=current_user.id,
     )
     db.add(resource_request)
     await db.flush()
 
-    audit = AuditLog(
-        request_id=resource_request.id,
-        action="created",
-        actor_id=current_user.id,
-        details=f"Requested {payload.resource_type.value} '{payload.name}' "
-        f"in {payload.environment}",
-    )
-    db.add(audit)
+    audits = [
+        audit_entry(resource_request.id, "created", current_user.id, _created_details(payload))
+    ]
+    await audit_sink.record(db, audits)
+    await record_created(db, [(current_user.id, payload.resource_type, payload.environment)])
+    await index_created(db, [(resource_request.id, payload.name, parameters)], audits)
     await db.commit()
-    await db.refresh(resource_request)
+    requests_created.labels(payload.resource_type.value).inc()
+    event_bus.publish(REQUEST_CREATED, [resource_request])
     return resource_request
 
 
-@router.get("/", response_model=list[ResourceRequestResponse])
-async def list_requests(
-    current_user: User = Depends(get_current_user),
+@router.post(
+    "/batch",
+    response_model=list[ResourceRequestBatchItem],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_requests_batch(
+    payload: ResourceRequestBatchCreate,
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List resource requests. Developers see their own; approvers/admins see all."""
-    query = select(ResourceRequest).order_by(ResourceRequest.created_at.desc())
+    """Submit many resource requests at once.
+
+    All requests and their audit entries are written with two multi-row INSERTs in a
+    single transaction: either every item is created or none is.
+    """
+    parameters = _validated_parameters(payload.requests, batch=True)
+    result = await db.execute(
+        insert(ResourceRequest).returning(
+            ResourceRequest.id,
+            ResourceRequest.status,
+            ResourceRequest.created_at,
+            sort_by_parameter_order=True,
+        ),
+        [
+            {
+                "resource_type": item.resource_type,
+                "name": item.name,
+                "environment": item.environment,
+                "parameters": params,
+                "requester_id": current_user.id,
+            }
+            for item, params in zip(payload.requests, parameters, strict=True)
+        ],
+    )
+    created = result.all()
+
+    audits = [
+        audit_entry(row.id, "created", current_user.id, _created_details(item))
+        for item, row in zip(payload.requests, created, strict=True)
+    ]
+    await audit_sink.record(db, audits)
+    await record_created(
+        db, [(current_user.id, item.resource_type, item.environment) for item in payload.requests]
+    )
+    await index_created(
+        db,
+        [
+            (row.id, item.name, params)
+            for item, params, row in zip(payload.requests, parameters, created, strict=True)
+        ],
+        audits,
+    )
+    await db.commit()
+    for item in payload.requests:
+        requests_created.labels(item.resource_type.value).inc()
+
+    event_bus.publish(
+        REQUEST_CREATED,
+        [
+            ResourceRequestSummary(
+                id=row.id,
+                resource_type=item.resource_type,
+                name=item.name,
+                environment=item.environment,
+                parameters=params,
+                status=row.status,
+                requester_id=current_user.id,
+                reviewer_id=None,
+                review_comment=None,
+                created_at=row.created_at,
+                reviewed_at=None,
+            )
+            for item, params, row in zip(payload.requests, parameters, created, strict=True)
+        ],
+    )
+    return [
+        ResourceRequestBatchItem(index=i, id=row.id, name=item.name, status=row.status)
+        for i, (item, row) in enumerate(zip(payload.requests, created, strict=True))
+    ]
+
+
+@router.get("/", response_model=list[ResourceRequestSummary], response_class=FastJSONResponse)
+async def list_requests(
+    status_filter: RequestStatus | None = Query(None, alias="status"),
+    resource_type: ResourceType | None = None,
+    environment: str | None = None,
+    requester_id: int | None = None,
+    param: list[str] = Query([], description="Parameter filter as key:value, repeatable"),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """List resource requests, newest first. Developers see their own; approvers/admins see all.
+
+    Results are keyset-paginated: when more rows exist, the ``X-Next-Cursor`` response
+    header carries the value to pass as ``cursor`` for the next page. Manifests are not
+    loaded; use ``GET /api/requests/{id}/manifest``.
+    """
+    query = select_summaries()
     if current_user.role.value == "developer":
         query = query.where(ResourceRequest.requester_id == current_user.id)
+    elif requester_id is not None:
+        query = query.where(ResourceRequest.requester_id == requester_id)
+    if status_filter is not None:
+        query = query.where(ResourceRequest.status == status_filter)
+    if resource_type is not None:
+        query = query.where(ResourceRequest.resource_type == resource_type)
+    if environment is not None:
+        query = query.where(ResourceRequest.environment == environment)
+
+    try:
+        query = query.where(*parameter_filters(param))
+        query = paginate_requests(query, cursor, limit, descending=True)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
     result = await db.execute(query)
-    return result.scalars().all()
+    page, next_cursor = split_page(result.all(), limit)
+    return summaries_response(page, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {})
+
+
+@router.get("/search", response_model=list[RequestSearchHit], response_class=FastJSONResponse)
+async def search_requests(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for"),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Full-text search over names, parameter values, review comments and audit details.
 
+    Every word must match, as a prefix. Hits are ranked best first, with name matches
+    weighted highest. Developers only find their own requests. Paginated like
+    ``GET /api/requests/``: follow ``X-Next-Cursor`` for the next page.
+    """
+    try:
+        offset = decode_offset_cursor(cursor) if cursor else 0
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-@router.get("/{request_id}", response_model=ResourceRequestResponse)
+    requester_id = current_user.id if current_user.role.value == "developer" else None
+    rows = await search_index(db, q, requester_id, limit, offset)
+    if rows is None:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Full-text search is not available on this database",
+        )
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(offset + limit)
+    return summaries_response(rows, headers)
+
+
+ROW_CACHE_CONTROL = "private, no-cache"
+
+
+def _version_etag(kind: str, request_id: int, version: int) -> str:
+    return f'"{kind}-{request_id}-v{version}"'
+
+
+async def _check_version(db: AsyncSession, request_id: int, current_user: Principal) -> int:
+    """Authorize access to a request and return its version via one primary-key lookup."""
+    result = await db.execute(
+        select(ResourceRequest.requester_id, ResourceRequest.version).where(
+            ResourceRequest.id == request_id
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+    if current_user.role.value == "developer" and row.requester_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this request")
+    return row.version
+
+
+@router.get(
+    "/{request_id}",
+    response_model=ResourceRequestResponse,
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    if_none_match: str | None = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get a specific resource request by ID."""
-    result = await db.execute(select(ResourceRequest).where(ResourceRequest.id == request_id))
+    """Get a specific resource request by ID. Supports ``If-None-Match``.
+
+    The ETag is derived from the row's version, so a poll that finds nothing changed
+    costs a single primary-key lookup and never loads the row or its manifest.
+    """
+    if if_none_match:
+        version = await _check_version(db, request_id, current_user)
+        etag = _version_etag("request", request_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, ROW_CACHE_CONTROL)
+
+    result = await db.execute(
+        select(ResourceRequest)
+        .options(joinedload(ResourceRequest.manifest_blob))
+        .where(ResourceRequest.id == request_id)
+    )
     req = result.scalar_one_or_none()
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
@@ -76,30 +338,144 @@ async def get_request(
     if current_user.role.value == "developer" and req.requester_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this request")
 
+    response.headers["ETag"] = _version_etag("request", req.id, req.version)
+    response.headers["Cache-Control"] = ROW_CACHE_CONTROL
     return req
 
 
-@router.get("/{request_id}/audit")
+@router.get(
+    "/{request_id}/manifest",
+    response_class=Response,
+    responses={200: {"content": {"application/yaml": {}, "text/plain": {}}}, 304: {}},
+)
+async def get_request_manifest(
+    request_id: int,
+    if_none_match: str | None = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Download the generated manifest as raw YAML/HCL. Supports ``If-None-Match``.
+
+    Blob-stored manifests are content-addressed, so the ETag is the stored digest and a
+    304 is answered without reading or decompressing the manifest body.
+    """
+    result = await db.execute(
+        select(
+            ResourceRequest.requester_id,
+            ResourceRequest.resource_type,
+            ResourceRequest.manifest_digest,
+        ).where(ResourceRequest.id == request_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+
+    if current_user.role.value == "developer" and row.requester_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this request")
+
+    cache_control = "private, no-cache"
+    if row.manifest_digest is not None:
+        etag = f'"{row.manifest_digest}"'
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, cache_control)
+        manifest = (await db.get(ManifestBlob, row.manifest_digest)).text
+    else:
+        result = await db.execute(
+            select(ResourceRequest.inline_manifest).where(ResourceRequest.id == request_id)
+        )
+        manifest = result.scalar_one()
+        if manifest is None:
+            raise HTTPException(status_code=404, detail="No manifest generated for this request")
+        etag = strong_etag(manifest)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, cache_control)
+
+    return Response(
+        content=manifest,
+        media_type=MANIFEST_MEDIA_TYPES.get(row.resource_type, "text/plain"),
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+@router.get("/{request_id}/render", response_model=RenderJobResponse)
+async def get_render_job(
+    request_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get the status of the background manifest rendering job for a request."""
+    result = await db.execute(
+        select(ResourceRequest.requester_id, *RENDER_JOB_COLUMNS).where(
+            ResourceRequest.id == request_id
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+
+    if current_user.role.value == "developer" and row.requester_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this request")
+
+    job = render_job(row)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No render job for this request")
+    return job
+
+
+@router.get(
+    "/{request_id}/audit",
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_request_audit(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    if_none_match: str | None = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get audit trail for a resource request."""
+    """Get audit trail for a resource request, including entries moved to the archive.
+
+    Every audit entry is written together with a change to the request, so the
+    request's version also versions its audit trail. In buffered audit mode entries
+    land after the version changes, so no ETag is offered.
+    """
+    version = await _check_version(db, request_id, current_user)
+    if not audit_sink.running:
+        etag = _version_etag("audit", request_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, ROW_CACHE_CONTROL)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ROW_CACHE_CONTROL
+
     result = await db.execute(
-        select(AuditLog)
+        select(
+            AuditLog.id,
+            AuditLog.action,
+            User.username.label("actor"),
+            AuditLog.details,
+            AuditLog.created_at,
+        )
+        .join(User, User.id == AuditLog.actor_id)
         .where(AuditLog.request_id == request_id)
-        .options(selectinload(AuditLog.actor))
         .order_by(AuditLog.created_at)
     )
-    logs = result.scalars().all()
-    return [
+    logs = [
         {
             "id": log.id,
             "action": log.action,
-            "actor": log.actor.username,
+            "actor": log.actor,
             "details": log.details,
             "created_at": log.created_at.isoformat(),
         }
-        for log in logs
+        for log in result
     ]
+    if not audit_archive.enabled:
+        return logs
+
+    archived = await asyncio.to_thread(audit_archive.entries_for, request_id)
+    hot = {(log["id"], log["created_at"]) for log in logs}
+    return [
+        {key: entry[key] for key in ("id", "action", "actor", "details", "created_at")}
+        for entry in archived
+        if (entry["id"], entry["created_at"]) not in hot
+    ] + logs
@@ -0,0 +1,27 @@
+"""Dashboard statistics served from the incrementally maintained counters."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.auth import Principal, get_current_user
+from platformhub.database import get_read_db
+from platformhub.schemas import RequestStats
+from platformhub.services.stats import get_stats
+
+router = APIRouter(prefix="/api/stats", tags=["stats"])
+
+
+@router.get("", response_model=RequestStats)
+async def request_stats(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Request counts by type, environment and status, plus review lead times.
+
+    Developers get counts for their own requests; approvers and admins for everyone.
+    Lead-time histograms always cover all requests.
+    """
+    requester_id = current_user.id if current_user.role.value == "developer" else None
+    return await get_stats(db, requester_id)
@@ -65,16 +65,28 @@ class ResourceRequestCreate(BaseModel):
     parameters: dict[str, str] = Field(default_factory=dict)
 
 
-class ResourceRequestResponse(BaseModel):
+class ResourceRequestBatchCreate(BaseModel):
+    requests: list[ResourceRequestCreate] = Field(min_length=1, max_length=1000)
+
+
+class ResourceRequestBatchItem(BaseModel):
+    index: int
+    id: int
+    name: str
+    status: RequestStatus
+
+
+class ResourceRequestSummary(BaseModel):
+    """List view of a request; the generated manifest is fetched separately."""
+
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     resource_type: ResourceType
     name: str
     environment: str
-    parameters: str
+    parameters: dict[str, str]
     status: RequestStatus
-    generated_manifest: str | None
     requester_id: int
     reviewer_id: int | None
     review_comment: str | None
@@ -82,6 +94,95 @@ class ResourceRequestResponse(BaseModel):
     reviewed_at: datetime | None
 
 
+class RequestSearchHit(ResourceRequestSummary):
+    score: float | None = Field(
+        description="Relevance, higher first; null when the query matched too many "
+        "requests to rank and hits are newest first"
+    )
+    snippet: str = Field(description="Matching text with the hits in [brackets]")
+
+
+class ResourceRequestResponse(ResourceRequestSummary):
+    generated_manifest: str | None
+
+
+class RenderJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    request_id: int
+    status: str
+    attempts: int
+    error: str | None
+    enqueued_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+
 class ReviewAction(BaseModel):
     action: RequestStatus = Field(description="Must be 'approved' or 'rejected'")
     comment: str = ""
+
+
+class BulkReviewAction(BaseModel):
+    request_ids: list[int] = Field(min_length=1, max_length=500)
+    action: RequestStatus = Field(description="Must be 'approved' or 'rejected'")
+    comment: str = ""
+
+
+class BulkReviewItem(BaseModel):
+    request_id: int
+    ok: bool
+    status: RequestStatus | None = None
+    error: str | None = None
+
+
+class ManifestMigrationReport(BaseModel):
+    migrated_rows: int
+    distinct_manifests: int
+    inline_bytes: int
+    stored_bytes: int
+    saved_bytes: int
+
+
+class AuditArchiveReport(BaseModel):
+    archived_rows: int
+    segments: int
+    archived_bytes: int
+    cutoff: datetime
+
+
+class StatusCount(BaseModel):
+    resource_type: ResourceType
+    environment: str
+    status: RequestStatus
+    count: int
+
+
+class LeadTimeBucket(BaseModel):
+    le_seconds: int | None = Field(description="Upper bound of the bucket; null is +Inf")
+    count: int
+
+
+class LeadTimeHistogram(BaseModel):
+    environment: str
+    count: int
+    mean_seconds: float
+    buckets: list[LeadTimeBucket]
+
+
+class RequestStats(BaseModel):
+    totals: dict[RequestStatus, int]
+    counts: list[StatusCount]
+    lead_times: list[LeadTimeHistogram] = Field(
+        description="Time from submission to review, per environment"
+    )
+
+
+class StatsRebuildReport(BaseModel):
+    requests: int
+    reviewed: int
+    counter_rows: int
+
+
+class SearchRebuildReport(BaseModel):
+    indexed: int
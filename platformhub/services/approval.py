@@ -2,45 +2,220 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from platformhub.models import AuditLog, RequestStatus, ResourceRequest, User
+from platformhub.auth import Principal
+from platformhub.config import settings
+from platformhub.models import RequestStatus, ResourceRequest
+from platformhub.schemas import BulkReviewItem
+from platformhub.services.audit import audit_entry, audit_sink
+from platformhub.services.events import REQUEST_UPDATED, event_bus
 from platformhub.services.generator import generate_manifest
+from platformhub.services.manifest_store import store_manifest, store_manifests
+from platformhub.services.metrics import requests_reviewed
+from platformhub.services.rendering import mark_queued, pipeline
+from platformhub.services.search import index_changes
+from platformhub.services.stats import record_reviews
+
+
+def _render_in_background(action: RequestStatus) -> bool:
+    return action == RequestStatus.APPROVED and settings.manifest_render_mode == "background"
+
+
+def _check_action(action: RequestStatus) -> None:
+    if action not in (RequestStatus.APPROVED, RequestStatus.REJECTED):
+        msg = "Action must be 'approved' or 'rejected'"
+        raise ValueError(msg)
+
+
+def _apply_review(
+    request: ResourceRequest,
+    reviewer: Principal,
+    action: RequestStatus,
+    comment: str,
+    reviewed_at: datetime,
+) -> dict:
+    request.status = action
+    request.reviewer_id = reviewer.id
+    request.review_comment = comment
+    request.reviewed_at = reviewed_at
+    return audit_entry(
+        request.id,
+        action.value,
+        reviewer.id,
+        comment or f"Request {action.value} by {reviewer.username}",
+    )
 
 
 async def review_request(
     request: ResourceRequest,
-    reviewer: User,
+    reviewer: Principal,
     action: RequestStatus,
     comment: str,
     db: AsyncSession,
 ) -> ResourceRequest:
-    """Approve or reject a resource request."""
+    """Approve or reject a resource request.
+
+    ``request`` may be loaded by another (reader) session: the manifest is rendered
+    before ``db``, the writer, runs its first statement, and the version column still
+    rejects the UPDATE if the request changed since it was read.
+    """
     if request.status != RequestStatus.PENDING:
         msg = f"Request is already {request.status.value}"
         raise ValueError(msg)
 
-    if action not in (RequestStatus.APPROVED, RequestStatus.REJECTED):
-        msg = "Action must be 'approved' or 'rejected'"
-        raise ValueError(msg)
+    _check_action(action)
 
-    request.status = action
-    request.reviewer_id = reviewer.id
-    request.review_comment = comment
-    request.reviewed_at = datetime.now(tz=UTC)
+    background = _render_in_background(action)
+    manifest = None
+    if action == RequestStatus.APPROVED and not background:
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(None, generate_manifest, request)
 
-    if action == RequestStatus.APPROVED:
-        request.generated_manifest = generate_manifest(request)
+    db.add(request)
+    # Store the manifest before touching the request: the blob queries autoflush, and
+    # a clean request means the review is written as a single UPDATE.
+    blob = None
+    if manifest is not None:
+        blob = await store_manifest(db, manifest)
 
-    audit = AuditLog(
-        request_id=request.id,
-        action=action.value,
-        actor_id=reviewer.id,
-        details=comment or f"Request {action.value} by {reviewer.username}",
-    )
-    db.add(audit)
+    reviewed_at = datetime.now(tz=UTC)
+    audit = _apply_review(request, reviewer, action, comment, reviewed_at)
+    if background:
+        mark_queued(request, reviewed_at)
+    elif blob is not None:
+        request.manifest_blob = blob
+
+    await audit_sink.record(db, [audit])
+    await record_reviews(db, [request])
+    await index_changes(db, [audit], {request.id: comment})
     await db.commit()
-    await db.refresh(request)
+    requests_reviewed.labels(action.value).inc()
+    event_bus.publish(REQUEST_UPDATED, [request])
+    if background:
+        pipeline.submit(request.id)
     return request
+
+
+async def _write_review(db: AsyncSession, request: ResourceRequest) -> bool:
+    """UPDATE a detached, reviewed ``request`` unless its row changed since it was read.
+
+    Returns False on a conflict (someone else reviewed or edited it first).
+    """
+    result = await db.execute(
+        update(ResourceRequest)
+        .where(ResourceRequest.id == request.id, ResourceRequest.version == request.version)
+        .values(
+            status=request.status,
+            reviewer_id=request.reviewer_id,
+            review_comment=request.review_comment,
+            reviewed_at=request.reviewed_at,
+            manifest_digest=request.manifest_digest,
+            render_attempts=request.render_attempts,
+            render_error=request.render_error,
+            render_enqueued_at=request.render_enqueued_at,
+            render_started_at=request.render_started_at,
+            render_finished_at=request.render_finished_at,
+            version=request.version + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+    request.version += 1
+    return True
+
+
+async def review_requests_bulk(
+    request_ids: list[int],
+    reviewer: Principal,
+    action: RequestStatus,
+    comment: str,
+    db: AsyncSession,
+    read_db: AsyncSession,
+) -> list[BulkReviewItem]:
+    """Approve or reject many requests in one transaction.
+
+    Targets are loaded with a single query on ``read_db``, which is closed before
+    approved manifests are rendered concurrently in the default executor (or handed to
+    the background pipeline); ``db``, the writer, is only used afterwards. Items that
+    are missing, no longer pending or changed concurrently (``conflict``) are reported
+    individually and skipped; the rest are committed together.
+    """
+    _check_action(action)
+
+    ids = list(dict.fromkeys(request_ids))
+    result = await read_db.execute(select(ResourceRequest).where(ResourceRequest.id.in_(ids)))
+    by_id = {req.id: req for req in result.scalars()}
+    # Detach the targets: each review is written by its own version-guarded UPDATE
+    # (see _write_review), so the ORM must not flush these rows as well.
+    await read_db.close()
+
+    outcomes: dict[int, BulkReviewItem] = {}
+    reviewable: list[ResourceRequest] = []
+    for request_id in ids:
+        req = by_id.get(request_id)
+        if req is None:
+            outcomes[request_id] = BulkReviewItem(
+                request_id=request_id, ok=False, error="Request not found"
+            )
+        elif req.status != RequestStatus.PENDING:
+            outcomes[request_id] = BulkReviewItem(
+                request_id=request_id,
+                ok=False,
+                status=req.status,
+                error=f"Request is already {req.status.value}",
+            )
+        else:
+            reviewable.append(req)
+
+    background = _render_in_background(action)
+    manifests: list[str | BaseException | None] = [None] * len(reviewable)
+    if action == RequestStatus.APPROVED and not background:
+        loop = asyncio.get_running_loop()
+        manifests = await asyncio.gather(
+            *(loop.run_in_executor(None, generate_manifest, req) for req in reviewable),
+            return_exceptions=True,
+        )
+
+    # Blobs are stored first: each review's UPDATE points at its digest.
+    blobs = iter(await store_manifests(db, [m for m in manifests if isinstance(m, str)]))
+
+    reviewed_at = datetime.now(tz=UTC)
+    audits: list[dict] = []
+    for req, manifest in zip(reviewable, manifests, strict=True):
+        if isinstance(manifest, BaseException):
+            outcomes[req.id] = BulkReviewItem(
+                request_id=req.id,
+                ok=False,
+                status=req.status,
+                error=f"Manifest generation failed: {manifest}",
+            )
+            continue
+        audit = _apply_review(req, reviewer, action, comment, reviewed_at)
+        if background:
+            mark_queued(req, reviewed_at)
+        elif manifest is not None:
+            req.manifest_blob = next(blobs)
+            req.manifest_digest = req.manifest_blob.digest
+        if not await _write_review(db, req):
+            outcomes[req.id] = BulkReviewItem(request_id=req.id, ok=False, error="conflict")
+            continue
+        audits.append(audit)
+        outcomes[req.id] = BulkReviewItem(request_id=req.id, ok=True, status=req.status)
+
+    reviewed = [req for req in reviewable if outcomes[req.id].ok]
+    await audit_sink.record(db, audits)
+    await record_reviews(db, reviewed)
+    await index_changes(db, audits, dict.fromkeys((req.id for req in reviewed), comment))
+    await db.commit()
+    requests_reviewed.labels(action.value).inc(len(reviewed))
+    event_bus.publish(REQUEST_UPDATED, reviewed)
+    if background:
+        for req in reviewed:
+            pipeline.submit(req.id)
+    return [outcomes[request_id] for request_id in ids]
@@ -0,0 +1,334 @@
+"""Archival of old audit entries into compressed, indexed segment files.
+
+A retention run moves audit rows older than the cutoff out of ``audit_logs`` into a
+new segment in ``audit_archive_dir``. Segments are written once and never modified:
+
+* ``audit-<seq>.jsonl.z`` holds one zlib-compressed block of JSONL per request, so a
+  single request's history is decompressed without touching the rest;
+* ``audit-<seq>.idx`` is the sidecar index: a fixed-size header, then one record per
+  request (request_id, first/last timestamp, byte offset and length of its block),
+  sorted by request_id. It is memory-mapped and binary-searched on lookup.
+
+The index is written last (via rename), so only complete segments are ever read. If
+a run dies after writing a segment but before deleting the rows, the next run archives
+them again; readers drop duplicates by ``(id, created_at)``. The timestamp is part of the
+key because SQLite may hand a deleted row's id to a new row.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.config import settings
+from platformhub.models import AuditLog, User
+from platformhub.schemas import AuditArchiveReport
+
+MAGIC = b"PHAUDIX1"
+_HEADER = struct.Struct("<8sQqq")  # magic, record count, first and last timestamp (µs)
+_RECORD = struct.Struct("<qqqQQ")  # request_id, first_us, last_us, offset, length
+COMPRESSION_LEVEL = 6
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() * 1_000_000)
+
+
+@dataclass(frozen=True)
+class IndexRecord:
+    request_id: int
+    first_us: int
+    last_us: int
+    offset: int
+    length: int
+
+
+class Segment:
+    """One archived segment: an mmap'd sidecar index over a compressed data file."""
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = index_path
+        self.data_path = index_path.with_suffix(".jsonl.z")
+        with index_path.open("rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.first_us, self.last_us = _HEADER.unpack_from(self._index, 0)
+        if magic != MAGIC:
+            msg = f"{index_path.name} is not an audit segment index"
+            raise ValueError(msg)
+
+    def close(self) -> None:
+        self._index.close()
+
+    def _record(self, position: int) -> IndexRecord:
+        return IndexRecord(
+            *_RECORD.unpack_from(self._index, _HEADER.size + position * _RECORD.size)
+        )
+
+    def find(self, request_id: int) -> IndexRecord | None:
+        """Binary-search the mapped index; only O(log n) records are ever unpacked."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle).request_id < request_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and (record := self._record(low)).request_id == request_id:
+            return record
+        return None
+
+    def read(self, record: IndexRecord) -> list[dict]:
+        with self.data_path.open("rb") as f:
+            block = os.pread(f.fileno(), record.length, record.offset)
+        return [json.loads(line) for line in zlib.decompress(block).splitlines()]
+
+    def overlaps(self, since_us: int | None, until_us: int | None) -> bool:
+        """True if the header's timestamp range meets ``[since_us, until_us)``."""
+        return (since_us is None or self.last_us >= since_us) and (
+            until_us is None or self.first_us < until_us
+        )
+
+    def entries_between(self, since_us: int | None, until_us: int | None) -> list[dict]:
+        """Entries created in ``[since_us, until_us)``, oldest first, with parsed timestamps.
+
+        Blocks whose index record lies outside the range are not decompressed.
+        """
+        entries = []
+        with self.data_path.open("rb") as f:
+            for position in range(self.count):
+                record = self._record(position)
+                if (since_us is not None and record.last_us < since_us) or (
+                    until_us is not None and record.first_us >= until_us
+                ):
+                    continue
+                block = os.pread(f.fileno(), record.length, record.offset)
+                for line in zlib.decompress(block).splitlines():
+                    entry = json.loads(line)
+                    entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+                    created_us = _micros(entry["created_at"])
+                    if (since_us is None or created_us >= since_us) and (
+                        until_us is None or created_us < until_us
+                    ):
+                        entries.append(entry)
+        return sorted(entries, key=lambda e: (_micros(e["created_at"]), e["id"]))
+
+
+def write_segment(directory: Path, sequence: int, entries: list[dict]) -> Path:
+    """Write ``entries`` (dicts with at least ``request_id`` and ``created_at``) as a segment.
+
+    Returns the index path. Data goes to temporary files that are renamed into place,
+    data first, so a crash never leaves an index pointing at a partial data file.
+    """
+    stem = directory / f"audit-{sequence:08d}"
+    data_path, index_path = stem.with_suffix(".jsonl.z"), stem.with_suffix(".idx")
+    ordered = sorted(entries, key=lambda e: (e["request_id"], e["created_at"], e["id"]))
+
+    records: list[IndexRecord] = []
+    offset = 0
+    tmp_data = data_path.with_suffix(".z.tmp")
+    with tmp_data.open("wb") as f:
+        for request_id, group in itertools.groupby(ordered, key=lambda e: e["request_id"]):
+            rows = list(group)
+            block = zlib.compress(
+                "".join(
+                    json.dumps({**row, "created_at": row["created_at"].isoformat()}) + "\n"
+                    for row in rows
+                ).encode(),
+                COMPRESSION_LEVEL,
+            )
+            f.write(block)
+            records.append(
+                IndexRecord(
+                    request_id,
+                    _micros(rows[0]["created_at"]),
+                    _micros(rows[-1]["created_at"]),
+                    offset,
+                    len(block),
+                )
+            )
+            offset += len(block)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_data.replace(data_path)
+
+    tmp_index = index_path.with_suffix(".idx.tmp")
+    with tmp_index.open("wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                len(records),
+                min(r.first_us for r in records),
+                max(r.last_us for r in records),
+            )
+        )
+        for record in records:
+            f.write(
+                _RECORD.pack(
+                    record.request_id,
+                    record.first_us,
+                    record.last_us,
+                    record.offset,
+                    record.length,
+                )
+            )
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_index.replace(index_path)
+    return index_path
+
+
+class AuditArchive:
+    """Read access to every complete segment in a directory.
+
+    Segments are opened lazily and kept mapped. The directory is only re-listed when
+    its mtime changes, so segments written by other processes are picked up at the
+    cost of one ``stat`` per lookup.
+    """
+
+    def __init__(self, directory: Path | None) -> None:
+        self.directory = directory
+        self._segments: dict[str, Segment] = {}
+        self._listing: list[Segment] = []
+        self._listed_mtime: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def segments(self) -> list[Segment]:
+        if self.directory is None:
+            return []
+        try:
+            mtime = self.directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        with self._lock:
+            # Directory mtimes are coarse: a listing taken in the same tick as a rename
+            # could miss it, so keep re-listing until the mtime is safely in the past.
+            if mtime != self._listed_mtime or time.time_ns() - mtime < 1_000_000_000:
+                names = sorted(path.name for path in self.directory.glob("audit-*.idx"))
+                for name in names:
+                    if name not in self._segments:
+                        self._segments[name] = Segment(self.directory / name)
+                self._listing = [self._segments[name] for name in names]
+                self._listed_mtime = mtime
+            return self._listing
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._listed_mtime = None
+
+    def next_sequence(self) -> int:
+        names = [segment.index_path.stem for segment in self.segments()]
+        return int(names[-1].removeprefix("audit-")) + 1 if names else 1
+
+    def entries_for(self, request_id: int) -> list[dict]:
+        """All archived entries of one request, oldest first, without duplicates."""
+        seen: dict[tuple[int, str], dict] = {}
+        for segment in self.segments():
+            record = segment.find(request_id)
+            if record is not None:
+                for entry in segment.read(record):
+                    seen.setdefault((entry["id"], entry["created_at"]), entry)
+        return sorted(seen.values(), key=lambda e: (e["created_at"], e["id"]))
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+            self._listing = []
+            self._listed_mtime = None
+
+
+def _as_entries(rows: Iterable) -> list[dict]:
+    return [
+        {
+            "id": row.id,
+            "request_id": row.request_id,
+            "action": row.action,
+            "actor_id": row.actor_id,
+            "actor": row.actor,
+            "details": row.details,
+            "created_at": row.created_at,
+        }
+        for row in rows
+    ]
+
+
+async def archive_audit_logs(
+    db: AsyncSession,
+    archive: AuditArchive,
+    older_than: timedelta,
+    segment_rows: int,
+) -> AuditArchiveReport:
+    """Move audit entries older than ``older_than`` into new segments, one per batch.
+
+    Each batch is written to disk before its rows are deleted, and committed before the
+    next batch starts, so the job can be interrupted and re-run.
+    """
+    if archive.directory is None:
+        msg = "Audit archival is disabled; set PLATFORMHUB_AUDIT_ARCHIVE_DIR"
+        raise ValueError(msg)
+    archive.directory.mkdir(parents=True, exist_ok=True)
+
+    cutoff = datetime.now(tz=UTC) - older_than
+    archived_rows = segments = archived_bytes = 0
+    while True:
+        result = await db.execute(
+            select(
+                AuditLog.id,
+                AuditLog.request_id,
+                AuditLog.action,
+                AuditLog.actor_id,
+                User.username.label("actor"),
+                AuditLog.details,
+                AuditLog.created_at,
+            )
+            .join(User, User.id == AuditLog.actor_id)
+            .where(AuditLog.created_at < cutoff)
+            .order_by(AuditLog.created_at, AuditLog.id)
+            .limit(segment_rows)
+        )
+        entries = _as_entries(result.all())
+        if not entries:
+            break
+
+        index_path = write_segment(archive.directory, archive.next_sequence(), entries)
+        archive.invalidate()
+        ids = [entry["id"] for entry in entries]
+        for start in range(0, len(ids), 500):
+            await db.execute(delete(AuditLog).where(AuditLog.id.in_(ids[start : start + 500])))
+        await db.commit()
+
+        archived_rows += len(entries)
+        segments += 1
+        archived_bytes += index_path.with_suffix(".jsonl.z").stat().st_size
+
+    return AuditArchiveReport(
+        archived_rows=archived_rows,
+        segments=segments,
+        archived_bytes=archived_bytes,
+        cutoff=cutoff,
+    )
+
+
+audit_archive = AuditArchive(
+    Path(settings.audit_archive_dir) if settings.audit_archive_dir else None
+)
@@ -0,0 +1,306 @@
+"""Audit log writer with an optional buffered, batched sink.
+
+In the default ``transactional`` mode audit rows are inserted in the caller's
+transaction, exactly like the state change they describe. In ``buffered`` mode rows
+are handed to the sink when that transaction commits (and dropped if it rolls back),
+then written by a background task in multi-row INSERTs whenever ``audit_batch_size``
+entries are waiting or ``audit_flush_interval_seconds`` has passed. Entries that can't
+be written are appended to this process's JSONL spool file (``audit_spool_path`` with
+the pid before the suffix) and replayed on the next flush or start, so nothing is lost
+on shutdown or a database outage. Spools left by exited workers are replayed too, each
+under a file lock so that only one process writes them. Entries the database rejects
+for good are moved to a quarantine file next to the spools.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from platformhub.config import settings
+from platformhub.database import async_session
+from platformhub.models import AuditLog
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, and exited workers' spools are not adopted.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_audit"
+
+
+def audit_entry(request_id: int, action: str, actor_id: int, details: str = "") -> dict:
+    """Build an audit row, timestamped when the event happens rather than when written."""
+    return {
+        "request_id": request_id,
+        "action": action,
+        "actor_id": actor_id,
+        "details": details,
+        "created_at": datetime.now(tz=UTC),
+    }
+
+
+class AuditSink:
+    """Buffers committed audit entries and writes them in batches."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int,
+        flush_interval: float,
+        spool_path: Path,
+    ) -> None:
+        self.session_factory = session_factory
+        self.spool_path = spool_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._buffer: list[dict] = []
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def record(self, db: AsyncSession, entries: Sequence[dict]) -> None:
+        """Write ``entries`` with ``db``'s transaction, or buffer them until it commits."""
+        if not entries:
+            return
+        if not self.running:
+            await db.execute(insert(AuditLog), list(entries))
+            return
+        db.sync_session.info.setdefault(_PENDING_KEY, []).extend(entries)
+
+    def _enqueue(self, entries: Sequence[dict]) -> None:
+        self._buffer.extend(entries)
+        if len(self._buffer) >= self._batch_size and self._wake is not None:
+            self._wake.set()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        if self._spools():
+            await self.flush()
+
+    async def stop(self) -> None:
+        """Stop the flusher after writing (or spooling) everything still buffered."""
+        if self._task is None:
+            return
+        self._stopping = True
+        assert self._wake is not None
+        self._wake.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            self._wake.clear()
+            await self.flush()
+        await self.flush()
+
+    @property
+    def own_spool(self) -> Path:
+        """This process's spool file: ``spool_path`` with the pid before the suffix."""
+        return self._sibling(str(os.getpid()))
+
+    @property
+    def quarantine_path(self) -> Path:
+        return self._sibling("quarantine")
+
+    def _sibling(self, tag: str) -> Path:
+        return self.spool_path.with_name(f"{self.spool_path.stem}.{tag}{self.spool_path.suffix}")
+
+    def _spools(self) -> list[Path]:
+        """Spool files this process replays: its own and those of exited processes."""
+        own = self.own_spool
+        spools = [own] if own.exists() else []
+        if self.spool_path.exists():
+            spools.append(self.spool_path)  # Shared spool written by earlier versions.
+        if fcntl is None:
+            return spools
+        prefix, suffix = f"{self.spool_path.stem}.", self.spool_path.suffix
+        for path in sorted(self.spool_path.parent.glob(f"{prefix}*{suffix}")):
+            pid = path.name[len(prefix) : len(path.name) - len(suffix)]
+            if pid.isdigit() and path != own and not _process_alive(int(pid)):
+                spools.append(path)
+        return spools
+
+    async def flush(self) -> int:
+        """Write spooled and buffered entries now; returns how many rows were inserted."""
+        async with self._lock:
+            written = 0
+            for path in self._spools():
+                written += await self._replay(path)
+            entries, self._buffer = self._buffer, []
+            if entries:
+                count, unwritten = await self._write(entries)
+                written += count
+                if unwritten:
+                    self._append(self.own_spool, unwritten)
+            return written
+
+    async def _replay(self, path: Path) -> int:
+        # Hold the lock while writing, so no other worker replays the same entries.
+        handle = _open_locked(path, "r+", wait=False)
+        if handle is None:
+            return 0
+        with handle:
+            written, unwritten = await self._write(_load(handle.read()))
+            if unwritten:
+                handle.seek(0)
+                handle.write(_dump(unwritten))
+                handle.truncate()
+            else:
+                path.unlink()
+        return written
+
+    async def _write(self, entries: list[dict]) -> tuple[int, list[dict]]:
+        """Insert ``entries``; returns how many were written and which to retry later.
+
+        If the database rejects the batch itself (an integrity or data error, such as
+        an entry for a deleted request), entries are retried one at a time and those
+        that still fail go to the quarantine file instead of blocking every later flush.
+        """
+        try:
+            await self._insert(entries)
+            return len(entries), []
+        except (IntegrityError, DataError):
+            pass
+        except Exception:
+            logger.exception("Audit flush failed; spooling %d entries", len(entries))
+            return 0, entries
+
+        written = 0
+        for position, entry in enumerate(entries):
+            try:
+                await self._insert([entry])
+            except (IntegrityError, DataError):
+                logger.exception(
+                    "Audit entry for request %s rejected; moved to %s",
+                    entry["request_id"],
+                    self.quarantine_path,
+                )
+                self._append(self.quarantine_path, [entry])
+            except Exception:
+                logger.exception("Audit flush failed; spooling %d entries", len(entries[position:]))
+                return written, entries[position:]
+            else:
+                written += 1
+        return written, []
+
+    async def _insert(self, entries: list[dict]) -> None:
+        async with self.session_factory() as db:
+            try:
+                for start in range(0, len(entries), self._batch_size):
+                    await db.execute(insert(AuditLog), entries[start : start + self._batch_size])
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    @staticmethod
+    def _append(path: Path, entries: Sequence[dict]) -> None:
+        handle = _open_locked(path, "a", wait=True)
+        assert handle is not None
+        with handle:
+            handle.write(_dump(entries))
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by someone else.
+    return True
+
+
+def _open_locked(path: Path, mode: str, *, wait: bool) -> IO[str] | None:
+    """Open ``path`` holding an exclusive ``flock``.
+
+    Returns None if the file doesn't exist or, with ``wait=False``, is locked. A file
+    unlinked while we waited for its lock has just been replayed by someone else: it is
+    skipped for reading and recreated for appending.
+    """
+    while True:
+        try:
+            handle = path.open(mode)
+        except FileNotFoundError:
+            if "a" in mode:
+                raise
+            return None
+        if fcntl is not None:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                handle.close()
+                return None
+        if os.fstat(handle.fileno()).st_nlink:
+            return handle
+        handle.close()
+        if "a" not in mode:
+            return None
+
+
+def _load(text: str) -> list[dict]:
+    entries = []
+    for line in text.splitlines():
+        if line:
+            entry = json.loads(line)
+            entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+            entries.append(entry)
+    return entries
+
+
+def _dump(entries: Sequence[dict]) -> str:
+    return "".join(
+        json.dumps({**entry, "created_at": entry["created_at"].isoformat()}) + "\n"
+        for entry in entries
+    )
+
+
+audit_sink = AuditSink(
+    async_session,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    spool_path=Path(settings.audit_spool_path),
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    entries = session.info.pop(_PENDING_KEY, None)
+    if entries:
+        audit_sink._enqueue(entries)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_rollback(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,127 @@
+"""Resource catalog registry loaded from YAML definitions."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+from pydantic import TypeAdapter
+
+from platformhub.config import settings
+from platformhub.http_cache import strong_etag
+from platformhub.models import ResourceType
+from platformhub.schemas import CatalogItem
+from platformhub.services.parameters import ParameterValidator
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIR = Path(__file__).parent.parent / "catalog"
+
+_items_adapter = TypeAdapter(list[CatalogItem])
+
+
+@dataclass(frozen=True)
+class SerializedBody:
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """An immutable, fully serialized view of the catalog."""
+
+    items: dict[ResourceType, CatalogItem]
+    listing: SerializedBody
+    details: dict[ResourceType, SerializedBody]
+    validators: dict[ResourceType, ParameterValidator]
+    signature: tuple
+
+
+def _directory_signature(directory: Path) -> tuple:
+    signature = []
+    for path in sorted(directory.glob("*.yaml")):
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _serialize(data: bytes) -> SerializedBody:
+    return SerializedBody(body=data, etag=strong_etag(data))
+
+
+def load_snapshot(directory: Path) -> CatalogSnapshot:
+    """Parse every ``*.yaml`` definition in ``directory`` and pre-serialize responses."""
+    signature = _directory_signature(directory)
+    items: dict[ResourceType, CatalogItem] = {}
+    for path in sorted(directory.glob("*.yaml")):
+        item = CatalogItem.model_validate(yaml.safe_load(path.read_text()))
+        if item.resource_type in items:
+            msg = f"Duplicate catalog definition for {item.resource_type.value} in {path.name}"
+            raise ValueError(msg)
+        items[item.resource_type] = item
+
+    ordered = [items[rt] for rt in ResourceType if rt in items]
+    return CatalogSnapshot(
+        items={item.resource_type: item for item in ordered},
+        listing=_serialize(_items_adapter.dump_json(ordered)),
+        details={
+            item.resource_type: _serialize(item.model_dump_json().encode()) for item in ordered
+        },
+        validators={item.resource_type: ParameterValidator(item.parameters) for item in ordered},
+        signature=signature,
+    )
+
+
+class CatalogRegistry:
+    """Catalog definitions indexed by resource type, with atomic hot reload.
+
+    Readers always see one complete snapshot. At most once per ``reload_interval``
+    the definition directory is stat'ed; if anything changed, a new snapshot is built
+    and swapped in. A broken definition leaves the previous snapshot in place.
+    """
+
+    def __init__(self, directory: Path, reload_interval: float) -> None:
+        self.directory = directory
+        self._reload_interval = reload_interval
+        self._snapshot: CatalogSnapshot | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self) -> CatalogSnapshot:
+        snapshot = load_snapshot(self.directory)
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        return snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                return self._snapshot or self.load()
+
+        now = time.monotonic()
+        if self._reload_interval >= 0 and now - self._checked_at >= self._reload_interval:
+            self._checked_at = now
+            if _directory_signature(self.directory) != snapshot.signature:
+                try:
+                    snapshot = self.load()
+                    logger.info("Reloaded catalog from %s", self.directory)
+                except Exception:
+                    logger.exception("Catalog reload failed; keeping previous definitions")
+        return snapshot
+
+    def get(self, resource_type: ResourceType) -> CatalogItem | None:
+        return self.snapshot().items.get(resource_type)
+
+    def validator(self, resource_type: ResourceType) -> ParameterValidator | None:
+        return self.snapshot().validators.get(resource_type)
+
+
+catalog_registry = CatalogRegistry(
+    Path(settings.catalog_dir) if settings.catalog_dir else CATALOG_DIR,
+    reload_interval=settings.catalog_reload_interval_seconds,
+)
@@ -0,0 +1,158 @@
+"""In-process pub/sub bus behind the ``/api/events`` server-sent events stream.
+
+Request creation, review and background rendering publish an event once their
+transaction has committed. Each connected client holds a bounded queue filled only
+with events it may see: developers get their own requests, approvers and admins get
+everything. A client that falls ``event_queue_size`` events behind is disconnected
+rather than buffered without limit; it reconnects with ``Last-Event-ID`` and is
+replayed from a ring buffer of recent events, or told to reload if it fell off the end.
+
+The bus lives in one process. With several workers each serves its own subscribers,
+so a multi-worker deployment needs a shared broker in front of ``publish``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import secrets
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+
+from platformhub.auth import Principal
+from platformhub.config import settings
+from platformhub.models import ResourceRequest
+from platformhub.schemas import ResourceRequestSummary
+
+REQUEST_CREATED = "request.created"
+REQUEST_UPDATED = "request.updated"
+RESET = "reset"
+RETRY_MS = 3000
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    seq: int
+    type: str
+    requester_id: int
+    data: str
+
+    def encode(self, epoch: str) -> bytes:
+        return f"id: {epoch}-{self.seq}\nevent: {self.type}\ndata: {self.data}\n\n".encode()
+
+
+def _visible(principal: Principal, event: Event) -> bool:
+    return principal.role.value != "developer" or event.requester_id == principal.id
+
+
+@dataclass(eq=False)
+class Subscription:
+    principal: Principal
+    queue: asyncio.Queue[Event]
+    overflowed: bool = False
+    replay: list[Event] = field(default_factory=list)
+    reset: bool = False
+
+
+class EventBus:
+    def __init__(self, history_size: int, queue_size: int, heartbeat: float) -> None:
+        # A fresh epoch per process makes IDs from a previous run unambiguous.
+        self.epoch = secrets.token_hex(4)
+        self.heartbeat = heartbeat
+        self._queue_size = queue_size
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._subscribers: set[Subscription] = set()
+        self._seq = itertools.count(1)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def publish(
+        self,
+        event_type: str,
+        requests: Iterable[ResourceRequest | ResourceRequestSummary],
+    ) -> None:
+        """Fan request events out to every subscriber allowed to see them.
+
+        The payload has the same fields as a ``GET /api/requests/`` item. Call only
+        after the change has been committed.
+        """
+        for request in requests:
+            summary = (
+                request
+                if isinstance(request, ResourceRequestSummary)
+                else ResourceRequestSummary.model_validate(request)
+            )
+            event = Event(
+                seq=next(self._seq),
+                type=event_type,
+                requester_id=summary.requester_id,
+                data=summary.model_dump_json(),
+            )
+            self._history.append(event)
+            for sub in list(self._subscribers):
+                if not _visible(sub.principal, event):
+                    continue
+                try:
+                    sub.queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    sub.overflowed = True
+                    self._subscribers.discard(sub)
+
+    def _parse_last_event_id(self, last_event_id: str | None) -> int | None:
+        if not last_event_id:
+            return None
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return -1
+        return int(seq)
+
+    def subscribe(self, principal: Principal, last_event_id: str | None = None) -> Subscription:
+        sub = Subscription(principal, asyncio.Queue(maxsize=self._queue_size))
+        after = self._parse_last_event_id(last_event_id)
+        if after is not None:
+            oldest = self._history[0].seq if self._history else None
+            if after < 0 or (oldest is not None and after < oldest - 1):
+                sub.reset = True
+            else:
+                sub.replay = [
+                    event
+                    for event in self._history
+                    if event.seq > after and _visible(principal, event)
+                ]
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+
+    async def stream(self, sub: Subscription) -> AsyncIterator[bytes]:
+        """Encode ``sub``'s events as SSE frames, with comment heartbeats when idle."""
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode()
+            if sub.reset:
+                seq = self._history[-1].seq if self._history else 0
+                yield Event(seq, RESET, 0, json.dumps({})).encode(self.epoch)
+            for event in sub.replay:
+                yield event.encode(self.epoch)
+            while True:
+                if sub.overflowed and sub.queue.empty():
+                    return
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=self.heartbeat)
+                except TimeoutError:
+                    yield b": heartbeat\n\n"
+                    continue
+                yield event.encode(self.epoch)
+        finally:
+            self.unsubscribe(sub)
+
+
+event_bus = EventBus(
+    history_size=settings.event_history_size,
+    queue_size=settings.event_queue_size,
+    heartbeat=settings.event_heartbeat_seconds,
+)
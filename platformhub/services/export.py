@@ -0,0 +1,186 @@
+"""Streaming NDJSON/CSV exports of requests and audit entries.
+
+Rows are read with a server-side cursor (``AsyncSession.stream`` with ``yield_per``)
+as plain column tuples and encoded one partition at a time, so memory use depends on
+``EXPORT_CHUNK_SIZE``, not on how many rows are exported. The audit export streams
+archived entries first, one segment at a time, then the rows still in ``audit_logs``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import enum
+import io
+import json
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.models import AuditLog, ResourceRequest, User
+from platformhub.services.archive import AuditArchive
+
+EXPORT_CHUNK_SIZE = 1000
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _utc(value: datetime) -> datetime:
+    # Timestamps are stored in UTC; naive bounds are taken to be UTC as well.
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _epoch_us(value: datetime | None) -> int | None:
+    return None if value is None else int(_utc(value).timestamp() * 1_000_000)
+
+
+def _in_range(column, since: datetime | None, until: datetime | None) -> list:
+    predicates = []
+    if since is not None:
+        predicates.append(column >= _utc(since))
+    if until is not None:
+        predicates.append(column < _utc(until))
+    return predicates
+
+
+def requests_export_query(since: datetime | None, until: datetime | None) -> Select:
+    return (
+        select(
+            ResourceRequest.id,
+            ResourceRequest.resource_type,
+            ResourceRequest.name,
+            ResourceRequest.environment,
+            ResourceRequest.status,
+            ResourceRequest.parameters,
+            ResourceRequest.requester_id,
+            ResourceRequest.reviewer_id,
+            ResourceRequest.review_comment,
+            ResourceRequest.created_at,
+            ResourceRequest.reviewed_at,
+        )
+        .where(*_in_range(ResourceRequest.created_at, since, until))
+        .order_by(ResourceRequest.created_at, ResourceRequest.id)
+    )
+
+
+def audit_export_query(since: datetime | None, until: datetime | None) -> Select:
+    return (
+        select(
+            AuditLog.id,
+            AuditLog.request_id,
+            AuditLog.action,
+            AuditLog.actor_id,
+            User.username.label("actor"),
+            AuditLog.details,
+            AuditLog.created_at,
+        )
+        .join(User, User.id == AuditLog.actor_id)
+        .where(*_in_range(AuditLog.created_at, since, until))
+        .order_by(AuditLog.created_at, AuditLog.id)
+    )
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True)
+    if value is None:
+        return ""
+    return _json_value(value)
+
+
+def _ndjson_encoder(columns: list[str]) -> tuple[bytes, Callable[[list], bytes]]:
+    def encode(rows: list) -> bytes:
+        return "".join(
+            json.dumps(dict(zip(columns, map(_json_value, row), strict=True))) + "\n"
+            for row in rows
+        ).encode()
+
+    return b"", encode
+
+
+def _csv_encoder(columns: list[str]) -> tuple[bytes, Callable[[list], bytes]]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(rows: list) -> bytes:
+        for row in rows:
+            writer.writerow([_csv_value(value) for value in row])
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(columns)
+    header = encode([])
+    return header, encode
+
+
+def _encoder(query: Select, fmt: ExportFormat) -> tuple[bytes, Callable[[list], bytes]]:
+    columns = [column.name for column in query.selected_columns]
+    return (_csv_encoder if fmt == "csv" else _ndjson_encoder)(columns)
+
+
+async def stream_export(db: AsyncSession, query: Select, fmt: ExportFormat) -> AsyncIterator[bytes]:
+    """Yield the encoded rows of ``query``, one chunk per ``EXPORT_CHUNK_SIZE`` rows."""
+    header, encode = _encoder(query, fmt)
+    if header:
+        yield header
+
+    result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+    async for partition in result.partitions():
+        yield encode(partition)
+
+
+async def stream_audit_export(
+    db: AsyncSession,
+    archive: AuditArchive,
+    since: datetime | None,
+    until: datetime | None,
+    fmt: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """Yield every audit entry in ``[since, until)``: archived segments, then hot rows.
+
+    Only segments whose header range overlaps the window are read, one at a time and
+    off the event loop. An interrupted archival run can leave the same entries in two
+    consecutive segments, or in the last segment and ``audit_logs``; each is exported once.
+    """
+    query = audit_export_query(since, until)
+    header, encode = _encoder(query, fmt)
+    if header:
+        yield header
+
+    columns = [column.name for column in query.selected_columns]
+    since_us, until_us = _epoch_us(since), _epoch_us(until)
+    previous: set[tuple[int, datetime]] = set()
+    for segment in archive.segments():
+        if not segment.overlaps(since_us, until_us):
+            continue
+        entries = await asyncio.to_thread(segment.entries_between, since_us, until_us)
+        rows = [
+            tuple(entry[column] for column in columns)
+            for entry in entries
+            if (entry["id"], entry["created_at"]) not in previous
+        ]
+        previous = {(entry["id"], entry["created_at"]) for entry in entries}
+        for start in range(0, len(rows), EXPORT_CHUNK_SIZE):
+            yield encode(rows[start : start + EXPORT_CHUNK_SIZE])
+
+    result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+    async for partition in result.partitions():
+        yield encode([row for row in partition if (row.id, row.created_at) not in previous])
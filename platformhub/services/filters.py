@@ -0,0 +1,26 @@
+"""Server-side filters shared by the request list endpoints."""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import ColumnElement
+
+from platformhub.models import parameter_value
+
+_PARAMETER_KEY = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def parameter_filters(raw: list[str]) -> list[ColumnElement[bool]]:
+    """Turn ``key:value`` query arguments into SQL predicates on the JSON parameters.
+
+    Raises ValueError for malformed arguments.
+    """
+    clauses = []
+    for item in raw:
+        key, sep, value = item.partition(":")
+        if not sep or not _PARAMETER_KEY.match(key):
+            msg = f"Invalid parameter filter '{item}', expected key:value"
+            raise ValueError(msg)
+        clauses.append(parameter_value(key) == value)
+    return clauses
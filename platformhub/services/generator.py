@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+from platformhub.config import settings
 from platformhub.models import ResourceRequest, ResourceType
+from platformhub.services.metrics import RENDER
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates" / "manifests"
 
+TEMPLATE_MAP: dict[ResourceType, str] = {
+    ResourceType.K8S_NAMESPACE: "k8s_namespace.yaml.j2",
+    ResourceType.S3_BUCKET: "s3_bucket.tf.j2",
+    ResourceType.RDS_DATABASE: "rds_database.tf.j2",
+}
+
+MANIFEST_MEDIA_TYPES: dict[ResourceType, str] = {
+    ResourceType.K8S_NAMESPACE: "application/yaml",
+    ResourceType.S3_BUCKET: "text/plain",
+    ResourceType.RDS_DATABASE: "text/plain",
+}
+
 _env = Environment(
     loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    bytecode_cache=FileSystemBytecodeCache(settings.template_cache_dir),
     autoescape=False,
     keep_trailing_newline=True,
     trim_blocks=True,
@@ -20,23 +38,87 @@ _env = Environment(
 )
 
 
+class TemplateRegistry:
+    """Compiled manifest templates plus a bounded memo of rendered output.
+
+    Templates are compiled once (Jinja persists the bytecode on disk so other workers
+    skip the parse). Renders are keyed by a SHA-256 of the template version and every
+    render input, so an identical request is only ever rendered once per process.
+    """
+
+    def __init__(self, env: Environment, cache_size: int) -> None:
+        self._env = env
+        self._cache_size = cache_size
+        self._templates: dict[ResourceType, tuple[Template, str]] = {}
+        self._renders: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile_all(self) -> None:
+        """Compile every manifest template up front instead of on the first approval."""
+        for resource_type in TEMPLATE_MAP:
+            self.get(resource_type)
+
+    def get(self, resource_type: ResourceType) -> tuple[Template, str] | None:
+        """Return ``(template, version)`` for a resource type, compiling on first use."""
+        entry = self._templates.get(resource_type)
+        if entry is None:
+            template_name = TEMPLATE_MAP.get(resource_type)
+            if template_name is None:
+                return None
+            source, _, _ = self._env.loader.get_source(self._env, template_name)
+            version = hashlib.sha256(source.encode()).hexdigest()
+            entry = self._templates[resource_type] = (
+                self._env.get_template(template_name),
+                version,
+            )
+        return entry
+
+    def render(self, resource_type: ResourceType, name: str, environment: str, params: dict) -> str:
+        entry = self.get(resource_type)
+        if entry is None:
+            return f"# No template available for {resource_type.value}"
+        template, version = entry
+
+        key = hashlib.sha256(
+            json.dumps(
+                [version, resource_type.value, name, environment, params], sort_keys=True
+            ).encode()
+        ).hexdigest()
+        with self._lock:
+            cached = self._renders.get(key)
+            if cached is not None:
+                self._renders.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        rendered = template.render(name=name, environment=environment, params=params)
+        with self._lock:
+            self._renders[key] = rendered
+            while len(self._renders) > self._cache_size:
+                self._renders.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._renders.clear()
+            self.hits = self.misses = 0
+
+
+registry = TemplateRegistry(_env, settings.manifest_render_cache_size)
+
+
 def generate_manifest(request: ResourceRequest) -> str:
     """Render the infrastructure manifest for an approved request."""
-    template_map = {
-        ResourceType.K8S_NAMESPACE: "k8s_namespace.yaml.j2",
-        ResourceType.S3_BUCKET: "s3_bucket.tf.j2",
-        ResourceType.RDS_DATABASE: "rds_database.tf.j2",
-    }
-
-    template_name = template_map.get(request.resource_type)
-    if not template_name:
-        return f"# No template available for {request.resource_type.value}"
-
-    template = _env.get_template(template_name)
-    params = json.loads(request.parameters) if request.parameters else {}
-
-    return template.render(
-        name=request.name,
-        environment=request.environment,
-        params=params,
-    )
+    with RENDER.time():
+        return registry.render(
+            request.resource_type, request.name, request.environment, request.parameters or {}
+        )
+
+
+def render_manifest(resource_type: str, name: str, environment: str, parameters: dict) -> str:
+    """Picklable entry point for rendering in a worker process."""
+    return registry.render(ResourceType(resource_type), name, environment, parameters or {})
@@ -0,0 +1,132 @@
+"""Content-addressed, compressed storage for generated manifests.
+
+Manifests are stored once per distinct text in ``manifest_blobs``, keyed by the
+SHA-256 of the text and zlib-compressed. Requests reference a blob by digest, so
+identical manifests share a row and list scans over ``resource_requests`` never drag
+manifest bodies along.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections.abc import Sequence
+
+from sqlalchemy import Insert, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.models import ManifestBlob, ResourceRequest
+from platformhub.schemas import ManifestMigrationReport
+
+CODEC = "zlib"
+COMPRESSION_LEVEL = 6
+
+
+def manifest_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _insert_ignoring_duplicates(dialect: str) -> Insert | None:
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert(ManifestBlob).on_conflict_do_nothing(index_elements=["digest"])
+
+
+async def store_manifests(db: AsyncSession, texts: Sequence[str]) -> list[ManifestBlob]:
+    """Persist manifests (deduplicated) and return their blobs in input order.
+
+    Uses one multi-row ``INSERT ... ON CONFLICT DO NOTHING`` and one ``SELECT``
+    regardless of how many manifests are passed, and is safe against a concurrent
+    writer storing the same text.
+    """
+    digests = [manifest_digest(text) for text in texts]
+    unique = dict(zip(digests, texts, strict=True))
+    if not unique:
+        return []
+
+    stmt = _insert_ignoring_duplicates(db.get_bind().dialect.name)
+    if stmt is None:
+        existing = await db.execute(
+            select(ManifestBlob.digest).where(ManifestBlob.digest.in_(unique))
+        )
+        for digest in existing.scalars():
+            unique.pop(digest)
+        stmt = insert(ManifestBlob)
+
+    if unique:
+        await db.execute(
+            stmt,
+            [
+                {
+                    "digest": digest,
+                    "codec": CODEC,
+                    "size": len(text.encode()),
+                    "data": zlib.compress(text.encode(), COMPRESSION_LEVEL),
+                }
+                for digest, text in unique.items()
+            ],
+        )
+
+    result = await db.execute(select(ManifestBlob).where(ManifestBlob.digest.in_(set(digests))))
+    by_digest = {blob.digest: blob for blob in result.scalars()}
+    return [by_digest[digest] for digest in digests]
+
+
+async def store_manifest(db: AsyncSession, text: str) -> ManifestBlob:
+    return (await store_manifests(db, [text]))[0]
+
+
+async def migrate_inline_manifests(
+    db: AsyncSession, batch_size: int = 500
+) -> ManifestMigrationReport:
+    """Move manifests still stored inline on ``resource_requests`` into the blob store.
+
+    Runs in batches, committing after each, so it can be interrupted and resumed.
+    """
+    migrated_rows = inline_bytes = 0
+    stored: dict[str, int] = {}
+    while True:
+        result = await db.execute(
+            select(ResourceRequest.id, ResourceRequest.version, ResourceRequest.inline_manifest)
+            .where(
+                ResourceRequest.inline_manifest.is_not(None),
+                ResourceRequest.manifest_digest.is_(None),
+            )
+            .order_by(ResourceRequest.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        blobs = await store_manifests(db, [row.inline_manifest for row in rows])
+        await db.execute(
+            update(ResourceRequest),
+            [
+                {
+                    "id": row.id,
+                    "version": row.version,
+                    "manifest_digest": blob.digest,
+                    "inline_manifest": None,
+                }
+                for row, blob in zip(rows, blobs, strict=True)
+            ],
+        )
+        await db.commit()
+
+        migrated_rows += len(rows)
+        inline_bytes += sum(len(row.inline_manifest.encode()) for row in rows)
+        stored.update((blob.digest, len(blob.data)) for blob in blobs)
+
+    stored_bytes = sum(stored.values())
+    return ManifestMigrationReport(
+        migrated_rows=migrated_rows,
+        distinct_manifests=len(stored),
+        inline_bytes=inline_bytes,
+        stored_bytes=stored_bytes,
+        saved_bytes=inline_bytes - stored_bytes,
+    )
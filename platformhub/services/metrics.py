@@ -0,0 +1,297 @@
+"""In-process Prometheus metrics: counters, histograms and the ``/metrics`` exposition.
+
+Kept dependency-free and cheap: label values resolve to a child once (a dict lookup),
+an observation is a ``bisect`` plus two additions under a per-child lock, and request
+timing is a plain ASGI middleware rather than ``BaseHTTPMiddleware``. Values are per
+process; with several workers, scrape each one or use a multiprocess-aware exporter.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from platformhub.services.query_stats import record_query
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans a sub-millisecond cache hit up to a slow bcrypt or export.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                msg = f"{self.name} expects labels {self.labelnames}, got {values}"
+                raise ValueError(msg)
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self, values: tuple[str, ...], child) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in sorted(self._children.items()):
+            yield from self._samples(values, child)
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _samples(self, values: tuple[str, ...], child: _CounterChild) -> Iterable[str]:
+        labels = _format_labels(self.labelnames, values)
+        yield f"{self.name}_total{labels} {_format_number(child.value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_lock", "buckets", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+class _Timer:
+    """``with histogram.labels(...).time():`` records the block's wall time in seconds."""
+
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child: _HistogramChild) -> None:
+        self._child = child
+
+    def __enter__(self) -> _Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._child.observe(time.perf_counter() - self._started)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _samples(self, values: tuple[str, ...], child: _HistogramChild) -> Iterable[str]:
+        with child._lock:
+            counts, total, count = list(child.buckets), child.sum, child.count
+        cumulative = 0
+        for bound, bucket in zip((*self.buckets, float("inf")), counts, strict=True):
+            cumulative += bucket
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            labels = _format_labels(self.labelnames, values, f'le="{le}"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, values)
+        yield f"{self.name}_sum{labels} {_format_number(total)}"
+        yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, **kwargs))
+
+    def render(self) -> str:
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_request_duration = metrics.histogram(
+    "platformhub_http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    ("method", "route", "status"),
+)
+stage_duration = metrics.histogram(
+    "platformhub_stage_duration_seconds",
+    "Time spent in instrumented stages of request handling.",
+    ("stage",),
+)
+requests_created = metrics.counter(
+    "platformhub_requests_created",
+    "Resource requests created, by resource type.",
+    ("resource_type",),
+)
+requests_reviewed = metrics.counter(
+    "platformhub_requests_reviewed",
+    "Resource requests approved or rejected.",
+    ("action",),
+)
+
+# Stage children are resolved once so the hot paths skip the label lookup.
+HASHING = stage_duration.labels("hashing")
+JWT_DECODE = stage_duration.labels("jwt_decode")
+DB_EXECUTE = stage_duration.labels("db_execute")
+DB_COMMIT = stage_duration.labels("db_commit")
+RENDER = stage_duration.labels("render")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    DB_EXECUTE.observe(elapsed)
+    record_query(statement, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _on_execute_error(context) -> None:
+    started = context.connection.info.get("query_started") if context.connection else None
+    if started:
+        elapsed = time.perf_counter() - started.pop()
+        DB_EXECUTE.observe(elapsed)
+        record_query(context.statement or "", elapsed)
+
+
+# Session-level so the flush that precedes COMMIT is part of the commit stage.
+@event.listens_for(Session, "before_commit")
+def _before_commit(session: Session) -> None:
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT.observe(time.perf_counter() - started)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _after_rollback(session: Session, _previous_transaction) -> None:
+    session.info.pop("commit_started", None)
+
+
+class MetricsMiddleware:
+    """Record every HTTP request in ``http_request_duration`` by its route template.
+
+    The route is read from the scope after routing, so ``/api/requests/42`` is
+    reported as ``/api/requests/{request_id}`` and unknown paths share one label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.labels(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            ).observe(time.perf_counter() - started)
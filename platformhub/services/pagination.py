@@ -0,0 +1,87 @@
+"""Keyset (cursor) pagination over ``(created_at, id)``.
+
+Ranked search results have no stable keyset (scores change as documents are indexed),
+so they page by offset behind the same opaque cursor and ``X-Next-Cursor`` header.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, Select, tuple_
+
+from platformhub.models import ResourceRequest
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as err:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from err
+
+
+def paginate_requests(
+    query: Select,
+    cursor: str | None,
+    limit: int,
+    *,
+    descending: bool,
+) -> Select:
+    """Apply keyset ordering, the cursor bound and ``limit + 1`` to a request query.
+
+    One extra row is fetched so the caller can tell whether a next page exists
+    without issuing a ``COUNT``.
+    """
+    key = tuple_(ResourceRequest.created_at, ResourceRequest.id)
+    if cursor:
+        bound = decode_cursor(cursor)
+        query = query.where(key < bound if descending else key > bound)
+
+    if descending:
+        query = query.order_by(ResourceRequest.created_at.desc(), ResourceRequest.id.desc())
+    else:
+        query = query.order_by(ResourceRequest.created_at, ResourceRequest.id)
+    return query.limit(limit + 1)
+
+
+def split_page(rows: Sequence[Row], limit: int) -> tuple[Sequence[Row], str | None]:
+    """Trim the look-ahead row and return ``(page, next_cursor)``."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """Encode the position of the next page of a ranked result."""
+    return base64.urlsafe_b64encode(f"offset|{offset}".encode()).decode().rstrip("=")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """Decode a cursor produced by :func:`encode_offset_cursor`. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, offset = base64.urlsafe_b64decode(padded).decode().split("|")
+        if kind != "offset" or int(offset) < 0:
+            raise ValueError(cursor)
+        return int(offset)
+    except (ValueError, UnicodeDecodeError) as err:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from err
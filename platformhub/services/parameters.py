@@ -0,0 +1,101 @@
+"""Request parameter validation compiled from catalog ``ParameterSpec`` definitions."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from platformhub.schemas import ParameterSpec
+
+_NUMBER = re.compile(r"^-?\d+(\.\d+)?$")
+_BOOLEANS = {"true": "true", "false": "false"}
+
+
+def _check_string(value: str) -> str | None:
+    return value
+
+
+def _check_number(value: str) -> str | None:
+    value = value.strip()
+    return value if _NUMBER.match(value) else None
+
+
+def _check_boolean(value: str) -> str | None:
+    return _BOOLEANS.get(value.strip().lower())
+
+
+_TYPE_CHECKS: dict[str, tuple[Callable[[str], str | None], str]] = {
+    "string": (_check_string, "a string"),
+    "number": (_check_number, "a number"),
+    "boolean": (_check_boolean, "'true' or 'false'"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledParameter:
+    name: str
+    required: bool
+    default: str | None
+    options: frozenset[str] | None
+    check: Callable[[str], str | None]
+    expected: str
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterError:
+    name: str
+    message: str
+    value: str | None = None
+
+
+class ParameterValidator:
+    """Validates and normalizes the parameters for one resource type.
+
+    Built once per catalog load so each request only does dict lookups and set
+    membership checks: unknown keys, values outside ``options``, malformed numbers or
+    booleans and missing required parameters are reported; defaults are filled in.
+    """
+
+    def __init__(self, specs: list[ParameterSpec]) -> None:
+        self._params: dict[str, _CompiledParameter] = {}
+        for spec in specs:
+            check, expected = _TYPE_CHECKS.get(spec.type, _TYPE_CHECKS["string"])
+            self._params[spec.name] = _CompiledParameter(
+                name=spec.name,
+                required=spec.required,
+                default=spec.default,
+                options=frozenset(spec.options) if spec.options else None,
+                check=check,
+                expected=expected,
+            )
+
+    def validate(self, params: dict[str, str]) -> tuple[dict[str, str], list[ParameterError]]:
+        """Return ``(normalized_params, errors)``."""
+        errors = [
+            ParameterError(name, "Unknown parameter", value)
+            for name, value in params.items()
+            if name not in self._params
+        ]
+        normalized: dict[str, str] = {}
+        for name, spec in self._params.items():
+            value = params.get(name)
+            if value is None or value == "":
+                if spec.default is not None:
+                    normalized[name] = spec.default
+                elif spec.required:
+                    errors.append(ParameterError(name, "Parameter is required"))
+                continue
+            if spec.options is not None:
+                if value not in spec.options:
+                    allowed = ", ".join(sorted(spec.options))
+                    errors.append(ParameterError(name, f"Must be one of: {allowed}", value))
+                    continue
+                normalized[name] = value
+                continue
+            checked = spec.check(value)
+            if checked is None:
+                errors.append(ParameterError(name, f"Must be {spec.expected}", value))
+                continue
+            normalized[name] = checked
+        return normalized, errors
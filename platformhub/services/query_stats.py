@@ -0,0 +1,74 @@
+"""Per-request SQL statement counts and database time.
+
+The engine-level cursor listeners in :mod:`platformhub.services.metrics` report every
+statement to :func:`record_query`, which adds it to each :class:`QueryStats` opened
+with :func:`track_queries` in the current context. Scopes nest, so a test can put a
+budget around a request that the debug middleware is also timing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: list[str] = field(default_factory=list)
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value: DB time in milliseconds plus the statement count."""
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed by this task (and tasks it starts) inside the block."""
+    stats = QueryStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def record_query(statement: str, elapsed: float) -> None:
+    for stats in _active.get():
+        stats.count += 1
+        stats.duration += elapsed
+        stats.statements.append(statement)
+
+
+class ServerTimingMiddleware:
+    """Add a ``Server-Timing`` header with the request's statement count and DB time.
+
+    Only installed in debug mode: the header exposes internals, and statements that
+    run after the response starts (streaming bodies) are not included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
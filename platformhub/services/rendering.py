@@ -0,0 +1,297 @@
+"""Background manifest rendering, decoupled from the review call.
+
+When ``manifest_render_mode`` is ``background``, approving a request moves it to
+``rendering`` and enqueues a job here. Worker tasks pull jobs off an in-process queue,
+render in a process pool (template rendering is CPU-bound) and flip the request to
+``approved`` once the manifest is stored. Failures are retried with exponential backoff;
+after the last attempt the request goes back to ``pending`` so it can be approved (and
+rendered) again.
+
+The job's state lives on the request row (``render_*`` columns), so any worker can
+report it, and ``start`` re-queues requests a previous process left in ``rendering``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from platformhub.config import settings
+from platformhub.database import async_session
+from platformhub.models import RequestStatus, ResourceRequest
+from platformhub.schemas import RenderJobResponse
+from platformhub.services.audit import audit_entry, audit_sink
+from platformhub.services.events import REQUEST_UPDATED, event_bus
+from platformhub.services.generator import render_manifest
+from platformhub.services.manifest_store import store_manifest
+from platformhub.services.metrics import RENDER
+from platformhub.services.search import index_changes
+from platformhub.services.stats import record_reopened, record_transitions
+
+logger = logging.getLogger(__name__)
+
+
+class RenderJobStatus(enum.StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+RENDER_JOB_COLUMNS = (
+    ResourceRequest.id,
+    ResourceRequest.status,
+    ResourceRequest.render_attempts,
+    ResourceRequest.render_error,
+    ResourceRequest.render_enqueued_at,
+    ResourceRequest.render_started_at,
+    ResourceRequest.render_finished_at,
+)
+
+
+def mark_queued(request: ResourceRequest, enqueued_at: datetime) -> None:
+    """Move ``request`` to ``rendering`` with a fresh job; submit it after commit."""
+    request.status = RequestStatus.RENDERING
+    request.render_attempts = 0
+    request.render_error = None
+    request.render_enqueued_at = enqueued_at
+    request.render_started_at = None
+    request.render_finished_at = None
+
+
+def render_job(row: Row) -> RenderJobResponse | None:
+    """The latest rendering job of a request selected with ``RENDER_JOB_COLUMNS``."""
+    if row.render_enqueued_at is None:
+        return None
+    if row.status == RequestStatus.RENDERING:
+        running = row.render_started_at is not None
+        status = RenderJobStatus.RUNNING if running else RenderJobStatus.QUEUED
+    elif row.render_error is None and row.render_finished_at is not None:
+        status = RenderJobStatus.SUCCEEDED
+    else:
+        status = RenderJobStatus.FAILED
+    return RenderJobResponse(
+        request_id=row.id,
+        status=status,
+        attempts=row.render_attempts or 0,
+        error=row.render_error,
+        enqueued_at=row.render_enqueued_at,
+        started_at=row.render_started_at,
+        finished_at=row.render_finished_at,
+    )
+
+
+def _process_pool(workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class RenderPipeline:
+    """In-process job queue feeding a pool of rendering workers."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        workers: int,
+        max_attempts: int,
+        backoff: float,
+        executor_factory: Callable[[int], Executor] = _process_pool,
+    ) -> None:
+        self.session_factory = session_factory
+        self.executor_factory = executor_factory
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._executor: Executor | None = None
+        self._queue: asyncio.Queue[int] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the workers and re-queue requests left in ``rendering`` by a restart.
+
+        With several workers each one re-queues them; the version check on the request
+        row lets only one of them store the result.
+        """
+        if self.running:
+            return
+        self._executor = self.executor_factory(self._workers)
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+        async with self.session_factory() as db:
+            # Jobs a dead worker had picked up are waiting again.
+            await db.execute(
+                update(ResourceRequest)
+                .where(ResourceRequest.status == RequestStatus.RENDERING)
+                .values(render_started_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            result = await db.scalars(
+                select(ResourceRequest.id)
+                .where(ResourceRequest.status == RequestStatus.RENDERING)
+                .order_by(ResourceRequest.id)
+            )
+            pending = result.all()
+        for request_id in pending:
+            self.submit(request_id)
+        if pending:
+            logger.info("Re-queued %d requests left in rendering", len(pending))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def submit(self, request_id: int) -> None:
+        if self._queue is None or not self.running:
+            msg = "Render pipeline is not running"
+            raise RuntimeError(msg)
+        self._queue.put_nowait(request_id)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            request_id = await self._queue.get()
+            try:
+                await self._run(request_id)
+            except Exception:
+                logger.exception("Render job for request %s crashed", request_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, request_id: int) -> None:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                await self._render_and_store(request_id, attempts)
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if isinstance(e, BrokenProcessPool):
+                    self._executor = self.executor_factory(self._workers)
+                if attempts >= self._max_attempts:
+                    break
+                await self._record_retry(request_id, error)
+                await asyncio.sleep(self._backoff * 2 ** (attempts - 1))
+            else:
+                return
+
+        await self._record_failure(request_id, attempts, error)
+
+    async def _render_and_store(self, request_id: int, attempts: int) -> None:
+        # Read the job's inputs and record the pickup in a short-lived session, so no
+        # connection is held while the pool renders; the writer pool may have just one.
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ResourceRequest).where(ResourceRequest.id == request_id)
+            )
+            req = result.scalar_one_or_none()
+            if req is None or req.status != RequestStatus.RENDERING:
+                return
+            await self._update_job(
+                db, request_id, render_attempts=attempts, render_started_at=datetime.now(tz=UTC)
+            )
+
+        with RENDER.time():
+            manifest = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                render_manifest,
+                req.resource_type.value,
+                req.name,
+                req.environment,
+                req.parameters,
+            )
+
+        # The version column rejects the UPDATE if the request changed while rendering.
+        async with self.session_factory() as db:
+            db.add(req)
+            req.manifest_blob = await store_manifest(db, manifest)
+            req.status = RequestStatus.APPROVED
+            req.render_attempts = attempts
+            req.render_error = None
+            req.render_finished_at = datetime.now(tz=UTC)
+            await record_transitions(db, [req], RequestStatus.RENDERING)
+            try:
+                await db.commit()
+            except StaleDataError:
+                # Another worker finished (or failed) this job first.
+                await db.rollback()
+                return
+            event_bus.publish(REQUEST_UPDATED, [req])
+
+    @staticmethod
+    async def _update_job(db: AsyncSession, request_id: int, **values: object) -> None:
+        # Job bookkeeping only: the request itself is unchanged, so its version is too.
+        await db.execute(
+            update(ResourceRequest)
+            .where(
+                ResourceRequest.id == request_id,
+                ResourceRequest.status == RequestStatus.RENDERING,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def _record_retry(self, request_id: int, error: str) -> None:
+        """Put the job back to waiting while it backs off before the next attempt."""
+        async with self.session_factory() as db:
+            await self._update_job(db, request_id, render_error=error, render_started_at=None)
+
+    async def _record_failure(self, request_id: int, attempts: int, error: str) -> None:
+        """Send the request back to ``pending`` with the error kept on its row."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ResourceRequest).where(ResourceRequest.id == request_id)
+            )
+            req = result.scalar_one_or_none()
+            if req is None or req.status != RequestStatus.RENDERING:
+                return
+            details = f"Manifest rendering failed after {attempts} attempts: {error}"
+            audits = [audit_entry(request_id, "render_failed", req.reviewer_id, details)]
+            await audit_sink.record(db, audits)
+            await index_changes(db, audits)
+            await record_reopened(db, [req])
+            req.status = RequestStatus.PENDING
+            req.reviewer_id = None
+            req.review_comment = None
+            req.reviewed_at = None
+            req.render_attempts = attempts
+            req.render_error = error
+            req.render_finished_at = datetime.now(tz=UTC)
+            try:
+                await db.commit()
+            except StaleDataError:
+                await db.rollback()
+                return
+            event_bus.publish(REQUEST_UPDATED, [req])
+
+
+pipeline = RenderPipeline(
+    async_session,
+    workers=settings.render_workers,
+    max_attempts=settings.render_max_attempts,
+    backoff=settings.render_retry_backoff_seconds,
+)
@@ -0,0 +1,325 @@
+"""Full-text search over requests: name, parameter values, review comment and audit trail.
+
+SQLite keeps one row per request in an FTS5 table (``rowid`` = request id, one column
+per field, ranked with ``bm25`` weighted towards the name). PostgreSQL keeps the same
+text in a plain table with a weighted ``tsvector`` under a GIN index, ranked with
+``ts_rank``. Other backends have no search index. Ranking is skipped for queries that
+match more than ``RANKED_MATCH_LIMIT`` requests, so a broad word costs about as much as
+a precise one however large the table grows.
+
+The index is written incrementally in the caller's transaction: a row on create, then
+appended text as reviews and other audit entries happen. Reviews happen once per
+request, so the comment is only ever set, never replaced. ``rebuild_search_index``
+recomputes everything from the tables; entries already moved to the audit archive are
+not part of a rebuild.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Row,
+    TableClause,
+    column,
+    event,
+    func,
+    literal_column,
+    null,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.database import Base
+from platformhub.models import ResourceRequest
+from platformhub.schemas import SearchRebuildReport
+from platformhub.services.serialization import SUMMARY_COLUMNS
+
+SEARCH_TABLE = "request_search"
+# bm25 weights for (name, parameters, review_comment, audit).
+SQLITE_WEIGHTS = (10.0, 4.0, 2.0, 1.0)
+# Queries matching more requests than this are returned newest first instead of ranked.
+RANKED_MATCH_LIMIT = 2_000
+# Shortest trailing token searched as a prefix.
+MIN_PREFIX = 2
+# Letters and digits, like the FTS5 unicode61 tokenizer (which splits on ``_``).
+_TOKEN = re.compile(r"[^\W_]+")
+
+_DDL = {
+    "sqlite": [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS request_search USING fts5(
+            name, parameters, review_comment, audit, prefix='2 3'
+        )""",
+    ],
+    "postgresql": [
+        """CREATE TABLE IF NOT EXISTS request_search (
+            request_id INTEGER PRIMARY KEY REFERENCES resource_requests (id),
+            content TEXT NOT NULL DEFAULT '',
+            document TSVECTOR NOT NULL DEFAULT ''::tsvector
+        )""",
+        """CREATE INDEX IF NOT EXISTS ix_request_search_document
+            ON request_search USING GIN (document)""",
+    ],
+}
+
+_INSERT = {
+    "sqlite": """INSERT INTO request_search (rowid, name, parameters, review_comment, audit)
+        VALUES (:id, :name, :parameters, :review_comment, :audit)""",
+    "postgresql": """INSERT INTO request_search (request_id, content, document)
+        VALUES (
+            :id,
+            concat_ws(E'\\n', :name, :parameters, :review_comment, :audit),
+            setweight(to_tsvector('simple', :name), 'A')
+            || setweight(to_tsvector('simple', :parameters), 'B')
+            || setweight(to_tsvector('simple', :review_comment), 'C')
+            || setweight(to_tsvector('simple', :audit), 'D')
+        )""",
+}
+
+_APPEND = {
+    "sqlite": """UPDATE request_search
+        SET review_comment = review_comment || char(10) || :review_comment,
+            audit = audit || char(10) || :audit
+        WHERE rowid = :id""",
+    "postgresql": """UPDATE request_search
+        SET content = concat_ws(E'\\n', content, :review_comment, :audit),
+            document = document
+                || setweight(to_tsvector('simple', :review_comment), 'C')
+                || setweight(to_tsvector('simple', :audit), 'D')
+        WHERE request_id = :id""",
+}
+
+# Rebuild straight from the tables: parameter values and audit details are aggregated
+# in SQL, so no row is materialized in Python.
+_REBUILD = {
+    "sqlite": """INSERT INTO request_search (rowid, name, parameters, review_comment, audit)
+        SELECT r.id, r.name,
+            coalesce((SELECT group_concat(value, ' ') FROM json_each(r.parameters)), ''),
+            coalesce(r.review_comment, ''),
+            coalesce((SELECT group_concat(details, char(10)) FROM audit_logs a
+                      WHERE a.request_id = r.id), '')
+        FROM resource_requests r""",
+    "postgresql": """INSERT INTO request_search (request_id, content, document)
+        SELECT id,
+            concat_ws(E'\\n', name, parameters, review_comment, audit),
+            setweight(to_tsvector('simple', name), 'A')
+            || setweight(to_tsvector('simple', parameters), 'B')
+            || setweight(to_tsvector('simple', review_comment), 'C')
+            || setweight(to_tsvector('simple', audit), 'D')
+        FROM (
+            SELECT r.id, r.name,
+                coalesce((SELECT string_agg(value, ' ') FROM jsonb_each_text(r.parameters)), '')
+                    AS parameters,
+                coalesce(r.review_comment, '') AS review_comment,
+                coalesce((SELECT string_agg(details, E'\\n') FROM audit_logs a
+                          WHERE a.request_id = r.id), '') AS audit
+            FROM resource_requests r
+        ) AS docs""",
+}
+
+
+def _backend(dialect: str) -> str | None:
+    return dialect if dialect in _DDL else None
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_table(_metadata, connection: Connection, **_kw) -> None:
+    # Runs on every create_all, so databases created before search existed get it too.
+    for statement in _DDL.get(connection.dialect.name, ()):
+        connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_table(_metadata, connection: Connection, **_kw) -> None:
+    if _backend(connection.dialect.name):
+        connection.execute(text("DROP TABLE IF EXISTS request_search"))
+
+
+def _dialect(db: AsyncSession) -> str | None:
+    return _backend(db.get_bind().dialect.name)
+
+
+def _audit_text(audits: Iterable[dict]) -> dict[int, str]:
+    by_request: dict[int, list[str]] = defaultdict(list)
+    for entry in audits:
+        if entry["details"]:
+            by_request[entry["request_id"]].append(entry["details"])
+    return {request_id: "\n".join(details) for request_id, details in by_request.items()}
+
+
+async def index_created(
+    db: AsyncSession,
+    requests: Iterable[tuple[int, str, dict[str, str]]],
+    audits: Iterable[dict] = (),
+) -> None:
+    """Add new requests, given as ``(id, name, parameters)``, with their first audit entries."""
+    dialect = _dialect(db)
+    if dialect is None:
+        return
+    audit = _audit_text(audits)
+    rows = [
+        {
+            "id": request_id,
+            "name": name,
+            "parameters": " ".join(str(value) for value in parameters.values()),
+            "review_comment": "",
+            "audit": audit.get(request_id, ""),
+        }
+        for request_id, name, parameters in requests
+    ]
+    if rows:
+        await db.execute(text(_INSERT[dialect]), rows)
+
+
+async def index_changes(
+    db: AsyncSession, audits: Iterable[dict], comments: dict[int, str] | None = None
+) -> None:
+    """Append new audit details, and review comments by request id, to indexed requests."""
+    dialect = _dialect(db)
+    if dialect is None:
+        return
+    audit = _audit_text(audits)
+    comments = {request_id: comment for request_id, comment in (comments or {}).items() if comment}
+    rows = [
+        {
+            "id": request_id,
+            "review_comment": comments.get(request_id, ""),
+            "audit": audit.get(request_id, ""),
+        }
+        for request_id in audit.keys() | comments.keys()
+    ]
+    if rows:
+        await db.execute(text(_APPEND[dialect]), rows)
+
+
+def match_expression(query: str) -> str | None:
+    """FTS5 query for free text: every word must match, the last one as a prefix.
+
+    Each word is quoted, which keeps user input from being parsed as FTS5 syntax and
+    turns a word like ``payments-db`` into the phrase ``payments db``. Only the last
+    word is a prefix (search as you type), and only if it ends in at least
+    ``MIN_PREFIX`` characters: a prefix query merges the postings of every token it
+    covers, and a single character covers a large part of the vocabulary.
+    Returns None if the text has nothing searchable.
+    """
+    words = [word for word in query.split() if _TOKEN.search(word)]
+    if not words:
+        return None
+    expression = " ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+    if len(_TOKEN.findall(words[-1])[-1]) >= MIN_PREFIX:
+        expression += "*"
+    return expression
+
+
+class _Match(NamedTuple):
+    source: TableClause
+    key: ColumnElement
+    condition: ColumnElement
+    best_first: ColumnElement
+    score: ColumnElement
+    snippet: ColumnElement
+
+
+def _match(dialect: str, query: str) -> _Match | None:
+    if dialect == "sqlite":
+        expression = match_expression(query)
+        if expression is None:
+            return None
+        fts = table(SEARCH_TABLE, column("rowid"))
+        bm25 = literal_column(f"bm25({SEARCH_TABLE}, {', '.join(map(str, SQLITE_WEIGHTS))})")
+        return _Match(
+            source=fts,
+            key=fts.c.rowid,
+            condition=literal_column(SEARCH_TABLE).op("MATCH")(expression),
+            best_first=bm25,
+            score=-bm25,
+            snippet=literal_column(f"snippet({SEARCH_TABLE}, -1, '[', ']', '…', 12)"),
+        )
+    docs = table(SEARCH_TABLE, column("request_id"), column("content"), column("document"))
+    tsquery = func.websearch_to_tsquery("simple", query)
+    rank = func.ts_rank(docs.c.document, tsquery)
+    return _Match(
+        source=docs,
+        key=docs.c.request_id,
+        condition=docs.c.document.op("@@")(tsquery),
+        best_first=rank.desc(),
+        score=rank,
+        snippet=func.ts_headline(
+            "simple", docs.c.content, tsquery, "StartSel=[, StopSel=], MaxWords=24"
+        ),
+    )
+
+
+async def search_requests(
+    db: AsyncSession, query: str, requester_id: int | None, limit: int, offset: int
+) -> Sequence[Row] | None:
+    """Up to ``limit + 1`` hits (the extra row signals a next page), best first.
+
+    Scoring needs statistics over every match, so its cost grows with the number of
+    matches rather than the page size. A cheap probe checks whether the query matches
+    more than ``RANKED_MATCH_LIMIT`` requests; if so, hits come newest first with a
+    None ``score``, which the index returns without looking at the other matches.
+
+    Returns None when the backend has no search index.
+    """
+    dialect = _dialect(db)
+    if dialect is None:
+        return None
+    match = _match(dialect, query)
+    if match is None:
+        return []
+
+    probe = select(match.key).select_from(match.source).where(match.condition)
+    if requester_id is not None:
+        # Count only the caller's matches: others' don't make their results any broader.
+        probe = probe.join(ResourceRequest, ResourceRequest.id == match.key).where(
+            ResourceRequest.requester_id == requester_id
+        )
+    broad = await db.scalar(probe.limit(1).offset(RANKED_MATCH_LIMIT)) is not None
+    if broad:
+        score, order = null(), (match.key.desc(),)
+    else:
+        score, order = match.score, (match.best_first, ResourceRequest.id)
+
+    stmt = (
+        select(*SUMMARY_COLUMNS, score.label("score"), match.snippet.label("snippet"))
+        .select_from(match.source)
+        .join(ResourceRequest, ResourceRequest.id == match.key)
+        .where(match.condition)
+        .order_by(*order)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    if requester_id is not None:
+        stmt = stmt.where(ResourceRequest.requester_id == requester_id)
+    return (await db.execute(stmt)).all()
+
+
+async def rebuild_search_index(db: AsyncSession) -> SearchRebuildReport:
+    """Recreate every search row from requests and hot audit entries, in one transaction."""
+    dialect = _dialect(db)
+    if dialect is None:
+        msg = f"Full-text search is not supported on {db.get_bind().dialect.name}"
+        raise ValueError(msg)
+    await db.execute(text("DELETE FROM request_search"))
+    result = await db.execute(text(_REBUILD[dialect]))
+    await db.commit()
+    return SearchRebuildReport(indexed=result.rowcount)
+
+
+async def ensure_search_index(db: AsyncSession) -> SearchRebuildReport | None:
+    """Build the index if requests exist but none are indexed yet."""
+    if _dialect(db) is None:
+        return None
+    has_requests = await db.scalar(select(ResourceRequest.id).limit(1))
+    has_index = await db.scalar(text("SELECT 1 FROM request_search LIMIT 1"))
+    if has_requests is not None and has_index is None:
+        return await rebuild_search_index(db)
+    return None
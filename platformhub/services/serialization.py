@@ -0,0 +1,40 @@
+"""Fast JSON path for list endpoints.
+
+List pages are selected as plain column tuples and encoded straight to bytes with
+orjson, skipping ORM object construction and per-row pydantic validation. The
+columns are taken from ``ResourceRequestSummary`` so the payload stays identical to
+what the declared ``response_model`` would produce (and documents in OpenAPI).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from sqlalchemy import Row, Select, select
+
+from platformhub.models import ResourceRequest
+from platformhub.schemas import ResourceRequestSummary
+
+# Matches pydantic's JSON output: ``Z`` for UTC datetimes, enums as their values.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+SUMMARY_COLUMNS = tuple(
+    getattr(ResourceRequest, name) for name in ResourceRequestSummary.model_fields
+)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def select_summaries() -> Select:
+    """Column-only select of the fields in ``ResourceRequestSummary``."""
+    return select(*SUMMARY_COLUMNS)
+
+
+def summaries_response(rows: Sequence[Row], headers: dict[str, str]) -> FastJSONResponse:
+    return FastJSONResponse([row._asdict() for row in rows], headers=headers)
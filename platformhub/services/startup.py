@@ -0,0 +1,190 @@
+"""Coordinated startup for multi-worker deployments.
+
+Every worker runs the app's lifespan. Schema work happens once: a worker first reads
+the fingerprint stored in ``schema_version`` (one primary-key lookup) and, if it
+matches the models, skips DDL entirely. Otherwise it takes a cross-process lock, a
+PostgreSQL advisory lock or a file lock next to the SQLite database, checks again
+(another worker may have just finished), then creates and upgrades tables, runs the
+startup backfills and stores the new fingerprint, all in one transaction.
+
+Each worker then warms its own caches and connection pool, and only afterwards
+does ``/health`` report it ready.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import hashlib
+import logging
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from jinja2 import Environment
+from sqlalchemy import Connection, inspect, select
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from platformhub.database import Base, create_schema
+from platformhub.models import SchemaVersion
+from platformhub.services.catalog import catalog_registry
+from platformhub.services.generator import registry
+from platformhub.services.search import ensure_search_index
+from platformhub.services.stats import ensure_stats
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock; workers there are not forked from one master.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Bump for schema changes the models don't show, such as extra DDL or a new backfill.
+SCHEMA_REVISION = 1
+# pg_advisory_lock key shared by every PlatformHub process ("phschema").
+ADVISORY_LOCK_KEY = int.from_bytes(b"phschema", "big")
+
+
+class Phase(enum.StrEnum):
+    STARTING = "starting"
+    READY = "ready"
+    STOPPING = "stopping"
+
+
+class Readiness:
+    """This worker's lifecycle as reported by ``/health``."""
+
+    def __init__(self) -> None:
+        self.phase = Phase.STARTING
+
+    @property
+    def ready(self) -> bool:
+        return self.phase == Phase.READY
+
+
+readiness = Readiness()
+
+
+def schema_fingerprint(dialect: Dialect) -> str:
+    """SHA-256 of the DDL the models compile to on ``dialect``, plus ``SCHEMA_REVISION``."""
+    ddl = [f"revision {SCHEMA_REVISION}"]
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+async def _stored_fingerprint(conn: AsyncConnection) -> str | None:
+    return await conn.scalar(select(SchemaVersion.fingerprint).where(SchemaVersion.id == 1))
+
+
+async def schema_is_current(engine: AsyncEngine) -> bool:
+    """The fast path: one read, no inspection. False if the table doesn't exist yet."""
+    try:
+        async with engine.connect() as conn:
+            return await _stored_fingerprint(conn) == schema_fingerprint(engine.dialect)
+    except DBAPIError:
+        return False
+
+
+def _lock_path(engine: AsyncEngine) -> Path | None:
+    url = engine.url
+    if url.get_backend_name() == "sqlite":
+        database = url.database or ""
+        if database in ("", ":memory:") or "mode=memory" in str(url) or "memory:" in database:
+            return None  # Private to this process.
+        return Path(database).with_name(Path(database).name + ".init-lock")
+    digest = hashlib.sha256(url.render_as_string(hide_password=True).encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / f"platformhub-{digest[:16]}.init-lock"
+
+
+@asynccontextmanager
+async def schema_lock(engine: AsyncEngine) -> AsyncIterator[None]:
+    """Hold a lock shared by every process that initializes this database."""
+    if engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(f"SELECT pg_advisory_lock({ADVISORY_LOCK_KEY})")
+            try:
+                yield
+            finally:
+                await conn.exec_driver_sql(f"SELECT pg_advisory_unlock({ADVISORY_LOCK_KEY})")
+        return
+
+    path = _lock_path(engine)
+    if path is None or fcntl is None:
+        yield
+        return
+    with path.open("a") as lock_file:
+        # Waiting for another worker's migration must not block this event loop.
+        await asyncio.to_thread(fcntl.flock, lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _stamp(conn: Connection, fingerprint: str) -> None:
+    conn.execute(SchemaVersion.__table__.delete())
+    conn.execute(SchemaVersion.__table__.insert().values(id=1, fingerprint=fingerprint))
+
+
+async def prepare_database(engine: AsyncEngine) -> bool:
+    """Bring the schema up to date once across all workers.
+
+    Returns True if this process did the work, False if the schema was already current.
+    """
+    if await schema_is_current(engine):
+        return False
+
+    fingerprint = schema_fingerprint(engine.dialect)
+    async with schema_lock(engine), engine.begin() as conn:
+        has_table = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(SchemaVersion.__tablename__)
+        )
+        if has_table and await _stored_fingerprint(conn) == fingerprint:
+            return False
+        await conn.run_sync(create_schema)
+        async with AsyncSession(bind=conn) as db:
+            await ensure_stats(db)
+            await ensure_search_index(db)
+        await conn.run_sync(_stamp, fingerprint)
+    logger.info("Initialized database schema %s", fingerprint[:12])
+    return True
+
+
+async def _open_connections(engine: AsyncEngine) -> int:
+    """Check out a full pool's worth of connections at once, then return them."""
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, AsyncConnection):
+            await result.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return size
+
+
+async def warm_up(engines: tuple[AsyncEngine, ...], pages: Environment) -> None:
+    """Do this worker's first-request costs now: templates, catalog and connections."""
+    started = time.perf_counter()
+    registry.compile_all()
+    catalog_registry.load()
+    for name in pages.list_templates():
+        pages.get_template(name)
+    connections = 0
+    for engine in dict.fromkeys(engines):
+        connections += await _open_connections(engine)
+    logger.info(
+        "Worker warmed up in %.0f ms (%d connections opened)",
+        (time.perf_counter() - started) * 1000,
+        connections,
+    )
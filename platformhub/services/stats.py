@@ -0,0 +1,280 @@
+"""Incrementally maintained request statistics.
+
+Every status change adds signed deltas to ``request_counters`` and, for reviews, a
+lead-time observation to ``review_lead_times``, in the caller's transaction: the
+counters commit or roll back together with the change they describe. Reads are a
+``GROUP BY`` over these small tables, independent of how many requests exist.
+
+Writes are upserts (``INSERT ... ON CONFLICT DO UPDATE``) that add to the stored value,
+so concurrent writers never overwrite each other's increments.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.models import (
+    RequestCounter,
+    RequestStatus,
+    ResourceRequest,
+    ResourceType,
+    ReviewLeadTime,
+)
+from platformhub.schemas import (
+    LeadTimeBucket,
+    LeadTimeHistogram,
+    RequestStats,
+    StatsRebuildReport,
+    StatusCount,
+)
+
+# Upper bounds in seconds: 5m, 15m, 1h, 4h, 1d, 3d, 7d; anything slower lands in +Inf.
+LEAD_TIME_BUCKETS = (300, 900, 3600, 4 * 3600, 86400, 3 * 86400, 7 * 86400)
+REBUILD_CHUNK_SIZE = 10_000
+
+CounterKey = tuple[int, ResourceType, str, RequestStatus]
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+async def _upsert_add(
+    db: AsyncSession, model, keys: tuple[str, ...], fields: tuple[str, ...], rows: list[dict]
+) -> None:
+    """Add ``fields`` of each row to the stored row with the same ``keys``, creating it."""
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={field: getattr(model, field) + getattr(stmt.excluded, field) for field in fields},
+        )
+        await db.execute(stmt, rows)
+        return
+
+    for row in rows:
+        result = await db.execute(
+            update(model)
+            .where(*(getattr(model, key) == row[key] for key in keys))
+            .values({field: getattr(model, field) + row[field] for field in fields})
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            await db.execute(insert(model), [row])
+
+
+async def _add_counts(db: AsyncSession, deltas: Counter[CounterKey]) -> None:
+    await _upsert_add(
+        db,
+        RequestCounter,
+        ("requester_id", "resource_type", "environment", "status"),
+        ("count",),
+        [
+            {
+                "requester_id": requester_id,
+                "resource_type": resource_type,
+                "environment": environment,
+                "status": status,
+                "count": delta,
+            }
+            for (requester_id, resource_type, environment, status), delta in deltas.items()
+            if delta
+        ],
+    )
+
+
+LeadTimes = defaultdict[tuple[str, int], list[float]]
+
+
+def _lead_times() -> LeadTimes:
+    return defaultdict(lambda: [0, 0.0])
+
+
+def _observe(
+    lead_times: LeadTimes, environment: str, created: datetime, reviewed: datetime
+) -> None:
+    seconds = max((_utc(reviewed) - _utc(created)).total_seconds(), 0.0)
+    entry = lead_times[(environment, bisect_left(LEAD_TIME_BUCKETS, seconds))]
+    entry[0] += 1
+    entry[1] += seconds
+
+
+def _lead_time_rows(lead_times: LeadTimes) -> list[dict]:
+    return [
+        {"environment": environment, "bucket": bucket, "count": count, "total_seconds": total}
+        for (environment, bucket), (count, total) in lead_times.items()
+    ]
+
+
+async def record_created(
+    db: AsyncSession, requests: Iterable[tuple[int, ResourceType, str]]
+) -> None:
+    """Count new pending requests given as ``(requester_id, resource_type, environment)``."""
+    await _add_counts(db, Counter((*key, RequestStatus.PENDING) for key in requests))
+
+
+async def record_transitions(
+    db: AsyncSession, requests: Iterable[ResourceRequest], previous: RequestStatus
+) -> None:
+    """Move each request from ``previous`` to its current status in the counters."""
+    deltas: Counter[CounterKey] = Counter()
+    for req in requests:
+        deltas[(req.requester_id, req.resource_type, req.environment, previous)] -= 1
+        deltas[(req.requester_id, req.resource_type, req.environment, req.status)] += 1
+    await _add_counts(db, deltas)
+
+
+async def record_reviews(db: AsyncSession, requests: Sequence[ResourceRequest]) -> None:
+    """Count reviewed (formerly pending) requests and add their lead times."""
+    await record_transitions(db, requests, RequestStatus.PENDING)
+    lead_times = _lead_times()
+    for req in requests:
+        _observe(lead_times, req.environment, req.created_at, req.reviewed_at)
+    await _upsert_add(
+        db,
+        ReviewLeadTime,
+        ("environment", "bucket"),
+        ("count", "total_seconds"),
+        _lead_time_rows(lead_times),
+    )
+
+
+async def record_reopened(db: AsyncSession, requests: Sequence[ResourceRequest]) -> None:
+    """Undo ``record_reviews`` for requests about to go back to pending.
+
+    Call while the requests still carry their current status and review time.
+    """
+    deltas: Counter[CounterKey] = Counter()
+    lead_times = _lead_times()
+    for req in requests:
+        deltas[(req.requester_id, req.resource_type, req.environment, req.status)] -= 1
+        deltas[(req.requester_id, req.resource_type, req.environment, RequestStatus.PENDING)] += 1
+        _observe(lead_times, req.environment, req.created_at, req.reviewed_at)
+    await _add_counts(db, deltas)
+    await _upsert_add(
+        db,
+        ReviewLeadTime,
+        ("environment", "bucket"),
+        ("count", "total_seconds"),
+        [
+            {**row, "count": -row["count"], "total_seconds": -row["total_seconds"]}
+            for row in _lead_time_rows(lead_times)
+        ],
+    )
+
+
+async def get_stats(db: AsyncSession, requester_id: int | None = None) -> RequestStats:
+    """Counts (optionally for one requester) and the lead-time histograms."""
+    total = func.sum(RequestCounter.count).label("count")
+    query = (
+        select(
+            RequestCounter.resource_type,
+            RequestCounter.environment,
+            RequestCounter.status,
+            total,
+        )
+        .group_by(RequestCounter.resource_type, RequestCounter.environment, RequestCounter.status)
+        .having(total != 0)
+        .order_by(RequestCounter.resource_type, RequestCounter.environment, RequestCounter.status)
+    )
+    if requester_id is not None:
+        query = query.where(RequestCounter.requester_id == requester_id)
+    counts = [
+        StatusCount.model_validate(row, from_attributes=True) for row in await db.execute(query)
+    ]
+
+    totals = dict.fromkeys(RequestStatus, 0)
+    for count in counts:
+        totals[count.status] += count.count
+
+    bounds = (*LEAD_TIME_BUCKETS, None)
+    histograms: dict[str, LeadTimeHistogram] = {}
+    rows = await db.execute(
+        select(ReviewLeadTime).order_by(ReviewLeadTime.environment, ReviewLeadTime.bucket)
+    )
+    for row in rows.scalars():
+        histogram = histograms.get(row.environment)
+        if histogram is None:
+            histogram = histograms[row.environment] = LeadTimeHistogram(
+                environment=row.environment,
+                count=0,
+                mean_seconds=0.0,
+                buckets=[LeadTimeBucket(le_seconds=le, count=0) for le in bounds],
+            )
+        histogram.buckets[row.bucket].count += row.count
+        histogram.count += row.count
+        histogram.mean_seconds += row.total_seconds
+    for histogram in histograms.values():
+        if histogram.count:
+            histogram.mean_seconds /= histogram.count
+
+    return RequestStats(totals=totals, counts=counts, lead_times=list(histograms.values()))
+
+
+async def rebuild_stats(db: AsyncSession) -> StatsRebuildReport:
+    """Recompute both tables from ``resource_requests`` in one transaction.
+
+    Repairs drift (e.g. rows edited by hand) and backfills databases created before the
+    counters existed. Concurrent writers wait on SQLite's write lock; on other backends
+    run it while reviews are quiet.
+    """
+    await db.execute(delete(RequestCounter))
+    await db.execute(delete(ReviewLeadTime))
+    grouped = select(
+        ResourceRequest.requester_id,
+        ResourceRequest.resource_type,
+        ResourceRequest.environment,
+        ResourceRequest.status,
+        func.count(),
+    ).group_by(
+        ResourceRequest.requester_id,
+        ResourceRequest.resource_type,
+        ResourceRequest.environment,
+        ResourceRequest.status,
+    )
+    await db.execute(
+        insert(RequestCounter).from_select(
+            ["requester_id", "resource_type", "environment", "status", "count"], grouped
+        )
+    )
+
+    reviewed = 0
+    lead_times = _lead_times()
+    result = await db.stream(
+        select(ResourceRequest.environment, ResourceRequest.created_at, ResourceRequest.reviewed_at)
+        .where(ResourceRequest.reviewed_at.is_not(None))
+        .execution_options(yield_per=REBUILD_CHUNK_SIZE)
+    )
+    async for partition in result.partitions():
+        for row in partition:
+            _observe(lead_times, row.environment, row.created_at, row.reviewed_at)
+        reviewed += len(partition)
+    if lead_times:
+        await db.execute(insert(ReviewLeadTime), _lead_time_rows(lead_times))
+
+    requests = (await db.execute(select(func.count(ResourceRequest.id)))).scalar_one()
+    counter_rows = (await db.execute(select(func.count()).select_from(RequestCounter))).scalar_one()
+    await db.commit()
+    return StatsRebuildReport(requests=requests, reviewed=reviewed, counter_rows=counter_rows)
+
+
+async def ensure_stats(db: AsyncSession) -> StatsRebuildReport | None:
+    """Backfill the counters if requests exist but were never counted."""
+    has_requests = await db.scalar(select(ResourceRequest.id).limit(1))
+    has_counters = await db.scalar(select(RequestCounter.requester_id).limit(1))
+    if has_requests is not None and has_counters is None:
+        return await rebuild_stats(db)
+    return None
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager, contextmanager
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from platformhub.database import Base, get_db
+from platformhub.auth import principal_cache
+from platformhub.database import Base, get_db, get_read_db
 from platformhub.main import app
+from platformhub.services.query_stats import track_queries
 
 TEST_DB_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
@@ -33,6 +37,8 @@ async def client(db_session: AsyncSession):
         yield db_session
 
     app.dependency_overrides[get_db] = _override_db
+    app.dependency_overrides[get_read_db] = _override_db
+    principal_cache.clear()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -61,6 +67,56 @@ async def auth_headers(client: AsyncClient) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture
+async def other_dev_headers(client: AsyncClient) -> dict[str, str]:
+    """Register a second developer and return their auth headers."""
+    await client.post(
+        "/api/auth/register",
+        json={
+            "username": "otherdev",
+            "email": "other@test.com",
+            "password": "otherpass123",
+        },
+    )
+    res = await client.post(
+        "/api/auth/login",
+        data={
+            "username": "otherdev",
+            "password": "otherpass123",
+        },
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def create_request(client: AsyncClient):
+    """``await create_request(headers, name, ...)`` creates a request and returns its id."""
+
+    async def _create(
+        headers: dict[str, str],
+        name: str = "test-request",
+        *,
+        resource_type: str = "k8s_namespace",
+        environment: str = "dev",
+        parameters: dict[str, str] | None = None,
+    ) -> int:
+        res = await client.post(
+            "/api/requests/",
+            json={
+                "resource_type": resource_type,
+                "name": name,
+                "environment": environment,
+                "parameters": {"team": "platform"} if parameters is None else parameters,
+            },
+            headers=headers,
+        )
+        assert res.status_code == 201, res.text
+        return res.json()["id"]
+
+    return _create
+
+
 @pytest.fixture
 async def approver_headers(client: AsyncClient, db_session: AsyncSession) -> dict[str, str]:
     """Register an approver user and return auth headers."""
@@ -85,3 +141,61 @@ async def approver_headers(client: AsyncClient, db_session: AsyncSession) -> dic
     )
     token = res.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def admin_headers(client: AsyncClient, db_session: AsyncSession) -> dict[str, str]:
+    """Register an admin user and return auth headers."""
+    from platformhub.auth import hash_password
+    from platformhub.models import Role, User
+
+    user = User(
+        username="testadmin",
+        email="admin@test.com",
+        hashed_password=hash_password("adminpass123"),
+        role=Role.ADMIN,
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    res = await client.post(
+        "/api/auth/login",
+        data={
+            "username": "testadmin",
+            "password": "adminpass123",
+        },
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def render_pipeline(db_session: AsyncSession, monkeypatch):
+    """Switch approvals to background rendering, writing through the test session."""
+    from platformhub.config import settings
+    from platformhub.services.rendering import pipeline
+
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    monkeypatch.setattr(settings, "manifest_render_mode", "background")
+    monkeypatch.setattr(pipeline, "session_factory", _session)
+    await pipeline.start()
+    yield pipeline
+    await pipeline.stop()
+
+
+@pytest.fixture
+def query_budget():
+    """``with query_budget(n):`` fails if the block executes more than ``n`` SQL statements."""
+
+    @contextmanager
+    def _budget(limit: int):
+        with track_queries() as stats:
+            yield stats
+        if stats.count > limit:
+            statements = "\n".join(f"  {sql}" for sql in stats.statements)
+            pytest.fail(f"{stats.count} statements, budget is {limit}:\n{statements}")
+
+    return _budget
@@ -0,0 +1,245 @@
+"""Tests for the audit log writer."""
+
+import json
+import os
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.database import Base
+
+NAMESPACE = {
+    "resource_type": "k8s_namespace",
+    "name": "audited-ns",
+    "environment": "dev",
+    "parameters": {"team": "backend"},
+}
+
+
+@pytest.fixture
+async def buffered_sink(db_session: AsyncSession, tmp_path, monkeypatch):
+    """Run the audit sink in buffered mode, flushing through the test session."""
+    from platformhub.services.audit import audit_sink
+
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    monkeypatch.setattr(audit_sink, "session_factory", _session)
+    monkeypatch.setattr(audit_sink, "spool_path", tmp_path / "audit.spool.jsonl")
+    monkeypatch.setattr(audit_sink, "_flush_interval", 3600)
+    await audit_sink.start()
+    yield audit_sink
+    await audit_sink.stop()
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    """Point the shared audit archive at an empty directory."""
+    from platformhub.services.archive import audit_archive
+
+    directory = tmp_path / "archive"
+    monkeypatch.setattr(audit_archive, "directory", directory)
+    yield directory
+    audit_archive.close()
+
+
+@pytest.mark.asyncio
+class TestBufferedAudit:
+    async def test_entries_are_written_on_flush(
+        self, client: AsyncClient, auth_headers: dict, buffered_sink
+    ):
+        res = await client.post("/api/requests/", json=NAMESPACE, headers=auth_headers)
+        req_id = res.json()["id"]
+        assert buffered_sink.pending == 1
+
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        assert res.json() == []
+
+        assert await buffered_sink.flush() == 1
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        assert [log["action"] for log in res.json()] == ["created"]
+
+    async def test_failed_flush_spools_and_replays(
+        self, client: AsyncClient, auth_headers: dict, buffered_sink, db_session, monkeypatch
+    ):
+        res = await client.post("/api/requests/", json=NAMESPACE, headers=auth_headers)
+        req_id = res.json()["id"]
+
+        @asynccontextmanager
+        async def _broken():
+            raise ConnectionError("database unavailable")
+            yield
+
+        working = buffered_sink.session_factory
+        monkeypatch.setattr(buffered_sink, "session_factory", _broken)
+        assert await buffered_sink.flush() == 0
+        assert buffered_sink.own_spool.exists()
+        assert not buffered_sink.spool_path.exists()
+        assert buffered_sink.pending == 0
+
+        monkeypatch.setattr(buffered_sink, "session_factory", working)
+        assert await buffered_sink.flush() == 1
+        assert not buffered_sink.own_spool.exists()
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        assert [log["action"] for log in res.json()] == ["created"]
+
+    async def test_rejected_entries_are_quarantined(
+        self, client: AsyncClient, auth_headers: dict, buffered_sink
+    ):
+        from platformhub.services.audit import audit_entry
+
+        res = await client.post("/api/requests/", json=NAMESPACE, headers=auth_headers)
+        req_id = res.json()["id"]
+        # NOT NULL violation: this entry can never be written.
+        buffered_sink._enqueue([{**audit_entry(req_id, "noted", 1), "action": None}])
+
+        assert await buffered_sink.flush() == 1
+        assert not buffered_sink.own_spool.exists()
+        assert len(buffered_sink.quarantine_path.read_text().splitlines()) == 1
+        # Later entries are not held up behind it.
+        buffered_sink._enqueue([audit_entry(req_id, "noted", 1, "after the bad one")])
+        assert await buffered_sink.flush() == 1
+
+    async def test_replays_spools_of_exited_workers_only(
+        self, client: AsyncClient, auth_headers: dict, buffered_sink
+    ):
+        from platformhub.services.audit import _dump, audit_entry
+
+        res = await client.post("/api/requests/", json=NAMESPACE, headers=auth_headers)
+        req_id = res.json()["id"]
+        await buffered_sink.flush()
+
+        def spool(pid: int):
+            path = buffered_sink._sibling(str(pid))
+            path.write_text(_dump([audit_entry(req_id, "noted", 1, f"from {pid}")]))
+            return path
+
+        exited, running = spool(2**22 + 1), spool(os.getppid())
+        assert await buffered_sink.flush() == 1
+        assert not exited.exists()
+        assert running.exists()
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        assert [log["details"] for log in res.json()][-1] == f"from {2**22 + 1}"
+
+
+class TestAuditIndexes:
+    def test_audit_trail_lookup_uses_index(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.connect() as conn:
+            plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT * FROM audit_logs "
+                        "WHERE request_id = 1 ORDER BY created_at"
+                    )
+                )
+            )
+        assert "ix_audit_logs_request_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestAuditSegments:
+    def test_segment_index_finds_each_request(self, tmp_path):
+        from platformhub.services.archive import AuditArchive, write_segment
+
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        entries = [
+            {
+                "id": i,
+                "request_id": i % 50,
+                "action": "created",
+                "actor": "dev",
+                "details": f"entry {i}",
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(500)
+        ]
+        write_segment(tmp_path, 1, entries[:300])
+        write_segment(tmp_path, 2, entries[250:])
+
+        archive = AuditArchive(tmp_path)
+        [first, second] = archive.segments()
+        record = first.find(7)
+        assert record is not None
+        assert record.first_us < record.last_us
+        assert first.find(50) is None
+
+        found = archive.entries_for(7)
+        assert [entry["id"] for entry in found] == list(range(7, 500, 50))
+        assert archive.entries_for(999) == []
+
+        def micros(minutes: int) -> int:
+            return int((start + timedelta(minutes=minutes)).timestamp() * 1_000_000)
+
+        since, until = micros(280), micros(320)
+        assert not second.overlaps(None, micros(0))
+        assert first.overlaps(since, until) and second.overlaps(since, until)
+        window = first.entries_between(since, until)
+        assert [entry["id"] for entry in window] == list(range(280, 300))
+        assert archive.next_sequence() == 3
+        archive.close()
+
+
+@pytest.mark.asyncio
+class TestAuditArchival:
+    async def test_archived_entries_merge_with_hot_rows(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        admin_headers: dict,
+        archive_dir,
+    ):
+        res = await client.post("/api/requests/", json=NAMESPACE, headers=auth_headers)
+        req_id = res.json()["id"]
+
+        res = await client.post(
+            "/api/admin/audit/archive", params={"older_than_days": 0}, headers=admin_headers
+        )
+        assert res.status_code == 200
+        assert res.json()["archived_rows"] == 1
+        assert res.json()["segments"] == 1
+        assert list(archive_dir.glob("*.idx"))
+
+        res = await client.get("/api/admin/export/audit", headers=admin_headers)
+        [archived] = [json.loads(line) for line in res.text.splitlines()]
+        assert (archived["request_id"], archived["action"]) == (req_id, "created")
+        assert archived["actor"] == "testdev"
+
+        await client.post(
+            f"/api/admin/{req_id}/review",
+            json={"action": "approved", "comment": "LGTM"},
+            headers=approver_headers,
+        )
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        logs = res.json()
+        assert [log["action"] for log in logs] == ["created", "approved"]
+        assert logs[0]["actor"] == "testdev"
+
+        res = await client.get(
+            "/api/admin/export/audit", params={"format": "csv"}, headers=admin_headers
+        )
+        actions = [line.split(",")[2] for line in res.text.splitlines()]
+        assert actions == ["action", "created", "approved"]
+        res = await client.get(
+            "/api/admin/export/audit",
+            params={"since": logs[1]["created_at"]},
+            headers=admin_headers,
+        )
+        assert [json.loads(line)["action"] for line in res.text.splitlines()] == ["approved"]
+
+    async def test_archival_requires_directory(
+        self, client: AsyncClient, admin_headers: dict, monkeypatch
+    ):
+        from platformhub.services.archive import audit_archive
+
+        monkeypatch.setattr(audit_archive, "directory", None)
+        res = await client.post("/api/admin/audit/archive", headers=admin_headers)
+        assert res.status_code == 400
@@ -1,7 +1,14 @@
 """Tests for authentication endpoints."""
 
+import bcrypt
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platformhub.auth import Principal, PrincipalCache, hashing_pool
+from platformhub.config import settings
+from platformhub.models import Role, User
 
 
 @pytest.mark.asyncio
@@ -51,3 +58,72 @@ class TestAuth:
     async def test_protected_endpoint_no_token(self, client: AsyncClient):
         res = await client.get("/api/requests/")
         assert res.status_code == 401
+
+    async def test_login_rehashes_outdated_cost(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        old_hash = bcrypt.hashpw(b"securepass123", bcrypt.gensalt(rounds=4)).decode()
+        db_session.add(User(username="legacy", email="legacy@test.com", hashed_password=old_hash))
+        await db_session.commit()
+
+        res = await client.post("/api/auth/login", data={
+            "username": "legacy",
+            "password": "securepass123",
+        })
+        assert res.status_code == 200
+
+        result = await db_session.execute(select(User).where(User.username == "legacy"))
+        user = result.scalar_one()
+        assert user.hashed_password != old_hash
+        assert user.hashed_password.split("$")[2] == f"{settings.bcrypt_rounds:02d}"
+
+    async def test_register_saturated_hashing_pool(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(hashing_pool, "_queue_limit", 0)
+        res = await client.post("/api/auth/register", json={
+            "username": "busyuser",
+            "email": "busy@test.com",
+            "password": "securepass123",
+        })
+        assert res.status_code == 503
+        assert res.headers["Retry-After"] == "1"
+
+    async def test_role_change_invalidates_cached_principal(
+        self, client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+    ):
+        res = await client.get("/api/admin/pending", headers=auth_headers)
+        assert res.status_code == 403
+
+        result = await db_session.execute(select(User).where(User.username == "testdev"))
+        user = result.scalar_one()
+        user.role = Role.APPROVER
+        await db_session.commit()
+
+        res = await client.get("/api/admin/pending", headers=auth_headers)
+        assert res.status_code == 200
+
+    async def test_deleted_user_is_rejected(
+        self, client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+    ):
+        res = await client.get("/api/requests/", headers=auth_headers)
+        assert res.status_code == 200
+
+        result = await db_session.execute(select(User).where(User.username == "testdev"))
+        await db_session.delete(result.scalar_one())
+        await db_session.commit()
+
+        res = await client.get("/api/requests/", headers=auth_headers)
+        assert res.status_code == 401
+
+
+class TestPrincipalCache:
+    def test_lru_eviction(self):
+        cache = PrincipalCache(maxsize=2, ttl=60)
+        for i, name in enumerate(["a", "b", "c"]):
+            cache.put(Principal(id=i, username=name, role=Role.DEVELOPER))
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_ttl_expiry(self):
+        cache = PrincipalCache(maxsize=2, ttl=-1)
+        cache.put(Principal(id=1, username="a", role=Role.DEVELOPER))
+        assert cache.get("a") is None
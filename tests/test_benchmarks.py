@@ -0,0 +1,57 @@
+"""Tests for the benchmark suite's seeding, runner and regression gate."""
+
+import pytest
+
+from benchmarks.run import BenchConfig, compare, parse_size, run
+
+
+def _results(size: int = 10_000, **metrics) -> dict:
+    scenario = {
+        "count": 10,
+        "throughput_rps": 100.0,
+        "mean_ms": 10.0,
+        "p50_ms": 10.0,
+        "p99_ms": 20.0,
+    }
+    return {"meta": {"size": size}, "results": {"get": {**scenario, **metrics}}}
+
+
+class TestRegressionGate:
+    def test_within_tolerance_passes(self):
+        assert compare(_results(p99_ms=24.0, throughput_rps=81.0), _results(), 0.25) == []
+
+    def test_slower_latency_and_lower_throughput_are_reported(self):
+        regressions = compare(_results(p50_ms=13.0, throughput_rps=70.0), _results(), 0.25)
+        assert regressions == [
+            "get.p50_ms: 13.0 > 10.0 (baseline)",
+            "get.throughput_rps: 70.0 < 100.0 (baseline)",
+        ]
+
+    def test_new_scenarios_are_ignored(self):
+        current = _results()
+        current["results"]["render"] = current["results"]["get"]
+        assert compare(current, _results(), 0.25) == []
+
+    def test_size_mismatch_is_an_error(self):
+        with pytest.raises(ValueError, match="10000 rows"):
+            compare(_results(size=100_000), _results(), 0.25)
+
+    def test_parse_size(self):
+        assert parse_size("1M") == 1_000_000
+        assert parse_size("2500") == 2500
+        with pytest.raises(ValueError, match="Unknown size"):
+            parse_size("lots")
+
+
+@pytest.mark.asyncio
+async def test_smoke_run_reuses_seeded_database(tmp_path, monkeypatch):
+    from platformhub.config import settings
+
+    monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+    config = BenchConfig(size=30, db_path=tmp_path / "bench.db", iterations=5, concurrency=2)
+
+    # The second run only works if the first run's reviews and creates were undone.
+    for _ in range(2):
+        results = await run(config)
+        assert set(results["results"]) == set(config.scenarios)
+        assert all(r["count"] >= 5 for r in results["results"].values())
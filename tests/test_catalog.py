@@ -1,8 +1,13 @@
 """Tests for catalog endpoints."""
 
+import shutil
+
 import pytest
 from httpx import AsyncClient
 
+from platformhub.models import ResourceType
+from platformhub.services.catalog import CATALOG_DIR, CatalogRegistry
+
 
 @pytest.mark.asyncio
 class TestCatalog:
@@ -24,3 +29,35 @@ class TestCatalog:
     async def test_get_catalog_item_not_found(self, client: AsyncClient):
         res = await client.get("/api/catalog/nonexistent")
         assert res.status_code == 422
+
+    async def test_list_catalog_conditional_get(self, client: AsyncClient):
+        res = await client.get("/api/catalog/")
+        etag = res.headers["ETag"]
+        assert res.headers["Cache-Control"].startswith("public")
+
+        res = await client.get("/api/catalog/", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+
+
+class TestCatalogRegistry:
+    def test_hot_reload_swaps_snapshot(self, tmp_path):
+        for path in CATALOG_DIR.glob("*.yaml"):
+            shutil.copy(path, tmp_path / path.name)
+        registry = CatalogRegistry(tmp_path, reload_interval=0)
+        before = registry.snapshot()
+        assert len(before.items) == 3
+
+        (tmp_path / "s3_bucket.yaml").unlink()
+        after = registry.snapshot()
+        assert ResourceType.S3_BUCKET not in after.items
+        assert after.listing.etag != before.listing.etag
+
+    def test_broken_definition_keeps_previous_snapshot(self, tmp_path):
+        for path in CATALOG_DIR.glob("*.yaml"):
+            shutil.copy(path, tmp_path / path.name)
+        registry = CatalogRegistry(tmp_path, reload_interval=0)
+        before = registry.snapshot()
+
+        (tmp_path / "broken.yaml").write_text("resource_type: not_a_type\n")
+        assert registry.snapshot() is before
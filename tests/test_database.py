@@ -0,0 +1,72 @@
+"""Tests for schema initialization."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from platformhub.config import Settings
+from platformhub.database import _upgrade_existing_tables, build_engines
+
+BASELINE_RESOURCE_REQUESTS = """
+CREATE TABLE resource_requests (
+    id INTEGER PRIMARY KEY,
+    resource_type VARCHAR(13) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    environment VARCHAR(20) NOT NULL,
+    parameters TEXT NOT NULL,
+    status VARCHAR(8) NOT NULL,
+    generated_manifest TEXT,
+    requester_id INTEGER NOT NULL,
+    reviewer_id INTEGER,
+    review_comment TEXT,
+    created_at DATETIME NOT NULL,
+    reviewed_at DATETIME
+)
+"""
+
+
+class TestSchemaUpgrade:
+    def test_adds_new_columns_and_indexes_to_existing_tables(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text(BASELINE_RESOURCE_REQUESTS))
+            _upgrade_existing_tables(conn)
+            _upgrade_existing_tables(conn)
+            columns = {c["name"] for c in inspect(conn).get_columns("resource_requests")}
+            indexes = set(
+                conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                ).scalars()
+            )
+        assert {"manifest_digest", "version"} <= columns
+        assert {"ix_resource_requests_status_created", "ix_resource_requests_param_team"} <= indexes
+
+
+@pytest.mark.asyncio
+class TestStorageProfile:
+    async def test_default_profile_shares_one_engine(self, tmp_path):
+        writer, reader = build_engines(
+            Settings(database_url=f"sqlite+aiosqlite:///{tmp_path}/hub.db")
+        )
+        assert writer is reader
+        await writer.dispose()
+
+    async def test_production_profile_tunes_sqlite_and_splits_pools(self, tmp_path):
+        writer, reader = build_engines(
+            Settings(
+                database_url=f"sqlite+aiosqlite:///{tmp_path}/hub.db",
+                storage_profile="production",
+                sqlite_busy_timeout_ms=1234,
+            )
+        )
+        assert writer is not reader
+        assert writer.pool.size() == 1
+
+        async with writer.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 1234
+        async with reader.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+
+        await writer.dispose()
+        await reader.dispose()
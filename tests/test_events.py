@@ -0,0 +1,145 @@
+"""Tests for the request event bus and SSE encoding."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+
+from platformhub.auth import Principal
+from platformhub.models import RequestStatus, ResourceType, Role
+from platformhub.schemas import ResourceRequestSummary
+from platformhub.services.events import REQUEST_CREATED, REQUEST_UPDATED, EventBus
+
+DEVELOPER = Principal(id=1, username="dev", role=Role.DEVELOPER)
+OTHER = Principal(id=2, username="other", role=Role.DEVELOPER)
+APPROVER = Principal(id=3, username="approver", role=Role.APPROVER)
+
+
+def _summary(request_id: int, requester_id: int) -> ResourceRequestSummary:
+    return ResourceRequestSummary(
+        id=request_id,
+        resource_type=ResourceType.S3_BUCKET,
+        name=f"bucket-{request_id}",
+        environment="dev",
+        parameters={},
+        status=RequestStatus.PENDING,
+        requester_id=requester_id,
+        reviewer_id=None,
+        review_comment=None,
+        created_at=datetime.now(tz=UTC),
+        reviewed_at=None,
+    )
+
+
+def _frame(raw: bytes) -> dict:
+    fields = dict(line.split(": ", 1) for line in raw.decode().strip().splitlines())
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+@pytest.mark.asyncio
+class TestEventBus:
+    async def test_events_are_filtered_by_ownership(self):
+        bus = EventBus(history_size=10, queue_size=10, heartbeat=5)
+        mine, theirs, approver = (bus.subscribe(p) for p in (DEVELOPER, OTHER, APPROVER))
+
+        bus.publish(REQUEST_CREATED, [_summary(10, DEVELOPER.id)])
+
+        assert mine.queue.qsize() == 1
+        assert theirs.queue.qsize() == 0
+        assert approver.queue.qsize() == 1
+
+    async def test_stream_resumes_from_last_event_id(self):
+        bus = EventBus(history_size=10, queue_size=10, heartbeat=5)
+        bus.publish(REQUEST_CREATED, [_summary(i, DEVELOPER.id) for i in (1, 2, 3)])
+
+        sub = bus.subscribe(DEVELOPER, f"{bus.epoch}-1")
+        stream = bus.stream(sub)
+        assert (await anext(stream)).startswith(b"retry:")
+        replayed = [_frame(await anext(stream)) for _ in range(2)]
+        assert [frame["data"]["id"] for frame in replayed] == [2, 3]
+        assert replayed[-1]["id"] == f"{bus.epoch}-3"
+
+        bus.publish(REQUEST_UPDATED, [_summary(3, DEVELOPER.id)])
+        live = _frame(await anext(stream))
+        assert live["event"] == REQUEST_UPDATED
+        await stream.aclose()
+        assert bus.subscribers == 0
+
+    async def test_unknown_or_expired_id_asks_client_to_reset(self):
+        bus = EventBus(history_size=2, queue_size=10, heartbeat=5)
+        bus.publish(REQUEST_CREATED, [_summary(i, DEVELOPER.id) for i in range(5)])
+
+        for last_id in (f"{bus.epoch}-1", "previous-run-4"):
+            stream = bus.stream(bus.subscribe(DEVELOPER, last_id))
+            await anext(stream)
+            frame = _frame(await anext(stream))
+            assert frame["event"] == "reset"
+            assert frame["id"] == f"{bus.epoch}-5"
+            await stream.aclose()
+
+    async def test_heartbeat_when_idle(self):
+        bus = EventBus(history_size=10, queue_size=10, heartbeat=0.01)
+        stream = bus.stream(bus.subscribe(APPROVER))
+        await anext(stream)
+        assert await anext(stream) == b": heartbeat\n\n"
+        await stream.aclose()
+
+    async def test_slow_consumer_is_disconnected_after_draining(self):
+        bus = EventBus(history_size=10, queue_size=2, heartbeat=5)
+        sub = bus.subscribe(APPROVER)
+        bus.publish(REQUEST_CREATED, [_summary(i, DEVELOPER.id) for i in range(4)])
+        assert sub.overflowed
+        assert bus.subscribers == 0
+
+        frames = [frame async for frame in bus.stream(sub)]
+        assert len(frames) == 3  # retry hint + the two queued events
+
+
+@pytest.mark.asyncio
+class TestRequestEvents:
+    async def test_create_and_review_publish_events(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        from platformhub.services.events import event_bus
+
+        approver = event_bus.subscribe(APPROVER)
+        try:
+            res = await client.post(
+                "/api/requests/",
+                json={
+                    "resource_type": "s3_bucket",
+                    "name": "evented",
+                    "environment": "dev",
+                },
+                headers=auth_headers,
+            )
+            req_id = res.json()["id"]
+            await client.post(
+                f"/api/admin/{req_id}/review",
+                json={"action": "rejected", "comment": "no"},
+                headers=approver_headers,
+            )
+            await client.post(
+                "/api/requests/batch",
+                json={
+                    "requests": [
+                        {"resource_type": "s3_bucket", "name": "evented-2", "environment": "dev"},
+                    ]
+                },
+                headers=auth_headers,
+            )
+
+            events = [approver.queue.get_nowait() for _ in range(approver.queue.qsize())]
+        finally:
+            event_bus.unsubscribe(approver)
+
+        assert [e.type for e in events] == [REQUEST_CREATED, REQUEST_UPDATED, REQUEST_CREATED]
+        assert json.loads(events[1].data)["status"] == "rejected"
+        assert json.loads(events[2].data)["name"] == "evented-2"
+
+    async def test_event_stream_requires_auth(self, client: AsyncClient):
+        res = await client.get("/api/events")
+        assert res.status_code == 401
@@ -6,13 +6,25 @@ from httpx import AsyncClient
 
 @pytest.mark.asyncio
 class TestHealth:
-    async def test_health_check(self, client: AsyncClient):
+    async def test_health_check(self, client: AsyncClient, monkeypatch):
+        from platformhub.services.startup import Phase, readiness
+
+        monkeypatch.setattr(readiness, "phase", Phase.READY)
         res = await client.get("/health")
         assert res.status_code == 200
         data = res.json()
         assert data["status"] == "ok"
         assert "version" in data
 
+    async def test_health_fails_until_ready(self, client: AsyncClient, monkeypatch):
+        from platformhub.services.startup import Phase, readiness
+
+        for phase in (Phase.STARTING, Phase.STOPPING):
+            monkeypatch.setattr(readiness, "phase", phase)
+            res = await client.get("/health")
+            assert res.status_code == 503
+            assert res.json()["status"] == phase.value
+
     async def test_index_page(self, client: AsyncClient):
         res = await client.get("/")
         assert res.status_code == 200
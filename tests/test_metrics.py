@@ -0,0 +1,91 @@
+"""Tests for the Prometheus metrics registry and /metrics endpoint."""
+
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from platformhub.services.metrics import MetricsRegistry
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """Value of the sample ``name`` whose labels include ``labels`` (0 if absent)."""
+    for line in text.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        if match is None or match[1] != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match[2] or ""))
+        if all(found.get(k) == v for k, v in labels.items()):
+            return float(match[3])
+    return 0.0
+
+
+class TestRegistry:
+    def test_histogram_exposition(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("h_seconds", "Help.", ("path",), buckets=(0.1, 1.0))
+        child = histogram.labels('a"b')
+        for value in (0.05, 0.5, 5.0):
+            child.observe(value)
+
+        text = registry.render()
+        assert "# TYPE h_seconds histogram" in text
+        assert 'h_seconds_bucket{path="a\\"b",le="0.1"} 1' in text
+        assert 'h_seconds_bucket{path="a\\"b",le="1.0"} 2' in text
+        assert 'h_seconds_bucket{path="a\\"b",le="+Inf"} 3' in text
+        assert 'h_seconds_count{path="a\\"b"} 3' in text
+
+    def test_counter_and_label_arity(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("things", "Help.", ("kind",))
+        counter.labels("x").inc()
+        counter.labels("x").inc(2)
+        assert 'things_total{kind="x"} 3' in registry.render()
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("x", "y")
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    async def test_routes_stages_and_counters(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        before = (await client.get("/metrics")).text
+
+        res = await client.post(
+            "/api/requests/",
+            json={
+                "resource_type": "k8s_namespace",
+                "name": "metered",
+                "environment": "dev",
+                "parameters": {"team": "payments"},
+            },
+            headers=auth_headers,
+        )
+        req_id = res.json()["id"]
+        await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        await client.get("/no-such-page")
+        await client.post(
+            f"/api/admin/{req_id}/review", json={"action": "approved"}, headers=approver_headers
+        )
+
+        res = await client.get("/metrics")
+        assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+        after = res.text
+
+        def delta(name: str, **labels: str) -> float:
+            return _sample(after, name, **labels) - _sample(before, name, **labels)
+
+        route = "platformhub_http_request_duration_seconds_count"
+        assert delta(route, route="/api/requests/{request_id}", status="200") == 1
+        assert delta(route, route="<unmatched>", status="404") == 1
+        assert delta("platformhub_requests_created_total", resource_type="k8s_namespace") == 1
+        assert delta("platformhub_requests_reviewed_total", action="approved") == 1
+
+        stage = "platformhub_stage_duration_seconds_count"
+        assert delta(stage, stage="jwt_decode") >= 3
+        assert delta(stage, stage="render") == 1
+        assert delta(stage, stage="db_execute") > 0
+        assert delta(stage, stage="db_commit") >= 2
+        # Login hashing happens in the fixtures, before the first scrape.
+        assert _sample(after, stage, stage="hashing") >= 2
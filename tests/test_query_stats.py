@@ -0,0 +1,75 @@
+"""Per-endpoint SQL statement budgets and the debug Server-Timing header."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from platformhub.main import app
+from platformhub.services.query_stats import ServerTimingMiddleware
+
+
+@pytest.mark.asyncio
+class TestQueryBudgets:
+    async def test_create_and_read(
+        self, client: AsyncClient, auth_headers: dict, query_budget, create_request
+    ):
+        # INSERT request, INSERT audit, counter upsert, search row, principal lookup on a
+        # cold cache.
+        with query_budget(5):
+            req_id = await create_request(auth_headers, "budgeted")
+        with query_budget(1):
+            await client.get("/api/requests/", headers=auth_headers)
+        with query_budget(1):
+            await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        # Version check + audit rows joined with their actors, however many entries.
+        with query_budget(2):
+            await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+
+    async def test_review(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        query_budget,
+        create_request,
+    ):
+        ids = [await create_request(auth_headers, f"budgeted-{i}") for i in range(4)]
+        await client.get("/api/admin/pending", headers=approver_headers)  # warm principal
+
+        # SELECT request, blob INSERT + SELECT, one UPDATE, audit INSERT, two stats upserts,
+        # search index UPDATE.
+        with query_budget(8):
+            res = await client.post(
+                f"/api/admin/{ids[0]}/review",
+                json={"action": "approved"},
+                headers=approver_headers,
+            )
+        assert res.status_code == 200
+
+        # One UPDATE per request; everything else is shared by the batch.
+        with query_budget(7 + len(ids[1:])):
+            res = await client.post(
+                "/api/admin/review",
+                json={"request_ids": ids[1:], "action": "approved"},
+                headers=approver_headers,
+            )
+        assert all(item["ok"] for item in res.json())
+
+    async def test_exceeding_the_budget_fails(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        query_budget,
+        create_request,
+    ):
+        with pytest.raises(pytest.fail.Exception, match="budget is 1"), query_budget(1):
+            await create_request(auth_headers, "budgeted")
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient, auth_headers: dict):
+    transport = ASGITransport(app=ServerTimingMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as debug_client:
+        await debug_client.get("/api/requests/", headers=auth_headers)  # warm principal
+        res = await debug_client.get("/api/requests/", headers=auth_headers)
+    assert res.headers["Server-Timing"].startswith("db;dur=")
+    assert res.headers["Server-Timing"].endswith('desc="1 queries"')
@@ -54,6 +54,7 @@ class TestRequests:
             "resource_type": "k8s_namespace",
             "name": "audit-test",
             "environment": "dev",
+            "parameters": {"team": "backend"},
         }, headers=auth_headers)
         req_id = create_res.json()["id"]
 
@@ -62,3 +63,236 @@ class TestRequests:
         logs = res.json()
         assert len(logs) >= 1
         assert logs[0]["action"] == "created"
+
+    async def test_list_requests_paginates_with_cursor(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        for i in range(5):
+            await client.post("/api/requests/", json={
+                "resource_type": "s3_bucket",
+                "name": f"bucket-{i}",
+                "environment": "dev",
+            }, headers=auth_headers)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            res = await client.get("/api/requests/", params=params, headers=auth_headers)
+            assert res.status_code == 200
+            seen.extend(r["name"] for r in res.json())
+            cursor = res.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert seen == [f"bucket-{i}" for i in reversed(range(5))]
+
+    async def test_list_requests_filters(self, client: AsyncClient, auth_headers: dict):
+        await client.post("/api/requests/", json={
+            "resource_type": "s3_bucket",
+            "name": "logs-bucket",
+            "environment": "staging",
+        }, headers=auth_headers)
+        await client.post("/api/requests/", json={
+            "resource_type": "k8s_namespace",
+            "name": "payments",
+            "environment": "production",
+            "parameters": {"team": "payments"},
+        }, headers=auth_headers)
+
+        res = await client.get(
+            "/api/requests/",
+            params={"resource_type": "k8s_namespace", "status": "pending"},
+            headers=auth_headers,
+        )
+        assert [r["name"] for r in res.json()] == ["payments"]
+
+        res = await client.get(
+            "/api/requests/", params={"environment": "staging"}, headers=auth_headers
+        )
+        assert [r["name"] for r in res.json()] == ["logs-bucket"]
+
+    async def test_list_requests_invalid_cursor(self, client: AsyncClient, auth_headers: dict):
+        res = await client.get(
+            "/api/requests/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+        assert res.status_code == 400
+
+    async def test_create_batch(self, client: AsyncClient, auth_headers: dict):
+        payload = {"requests": [
+            {
+                "resource_type": "k8s_namespace",
+                "name": f"team-ns-{i}",
+                "environment": "dev",
+                "parameters": {"team": "backend"},
+            }
+            for i in range(3)
+        ]}
+        res = await client.post("/api/requests/batch", json=payload, headers=auth_headers)
+        assert res.status_code == 201
+        results = res.json()
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert [r["name"] for r in results] == ["team-ns-0", "team-ns-1", "team-ns-2"]
+        assert all(r["status"] == "pending" for r in results)
+
+        res = await client.get(f"/api/requests/{results[1]['id']}/audit", headers=auth_headers)
+        assert [log["action"] for log in res.json()] == ["created"]
+
+    async def test_create_batch_invalid_item_creates_nothing(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        res = await client.post("/api/requests/batch", json={"requests": [
+            {"resource_type": "s3_bucket", "name": "good-bucket", "environment": "dev"},
+            {"resource_type": "s3_bucket", "name": "Bad Name", "environment": "dev"},
+        ]}, headers=auth_headers)
+        assert res.status_code == 422
+        assert res.json()["detail"][0]["loc"][:3] == ["body", "requests", 1]
+
+        res = await client.get("/api/requests/", headers=auth_headers)
+        assert res.json() == []
+
+    async def test_list_requests_filters_on_parameters(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        for name, team in [("pay-ns", "payments"), ("web-ns", "frontend")]:
+            await client.post("/api/requests/", json={
+                "resource_type": "k8s_namespace",
+                "name": name,
+                "environment": "dev",
+                "parameters": {"team": team, "cpu_limit": "1"},
+            }, headers=auth_headers)
+
+        res = await client.get(
+            "/api/requests/", params={"param": "team:payments"}, headers=auth_headers
+        )
+        assert res.status_code == 200
+        items = res.json()
+        assert [r["name"] for r in items] == ["pay-ns"]
+        assert items[0]["parameters"] == {
+            "team": "payments",
+            "cpu_limit": "1",
+            "memory_limit": "1Gi",
+        }
+
+        res = await client.get(
+            "/api/requests/",
+            params=[("param", "team:payments"), ("param", "cpu_limit:2")],
+            headers=auth_headers,
+        )
+        assert res.json() == []
+
+        res = await client.get(
+            "/api/requests/", params={"param": "no-colon"}, headers=auth_headers
+        )
+        assert res.status_code == 400
+
+    async def test_create_request_fills_parameter_defaults(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        res = await client.post("/api/requests/", json={
+            "resource_type": "rds_database",
+            "name": "billing-db",
+            "environment": "dev",
+            "parameters": {"engine_version": "16", "instance_class": "db.t3.small",
+                           "multi_az": "TRUE"},
+        }, headers=auth_headers)
+        assert res.status_code == 201
+        params = res.json()["parameters"]
+        assert params["storage_gb"] == "20"
+        assert params["multi_az"] == "true"
+
+    async def test_create_request_rejects_invalid_parameters(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        res = await client.post("/api/requests/", json={
+            "resource_type": "k8s_namespace",
+            "name": "bad-params",
+            "environment": "dev",
+            "parameters": {"cpu_limit": "64", "colour": "blue"},
+        }, headers=auth_headers)
+        assert res.status_code == 422
+        locs = {tuple(e["loc"]) for e in res.json()["detail"]}
+        assert locs == {
+            ("body", "parameters", "cpu_limit"),
+            ("body", "parameters", "colour"),
+            ("body", "parameters", "team"),
+        }
+
+        res = await client.post("/api/requests/batch", json={"requests": [
+            {"resource_type": "s3_bucket", "name": "ok-bucket", "environment": "dev"},
+            {"resource_type": "rds_database", "name": "bad-db", "environment": "dev",
+             "parameters": {"engine_version": "16", "instance_class": "db.t3.small",
+                            "storage_gb": "lots"}},
+        ]}, headers=auth_headers)
+        assert res.status_code == 422
+        assert res.json()["detail"][0]["loc"] == [
+            "body", "requests", 1, "parameters", "storage_gb"
+        ]
+
+        res = await client.get("/api/requests/", headers=auth_headers)
+        assert res.json() == []
+
+    async def test_conditional_get_request_and_audit(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        res = await client.post("/api/requests/", json={
+            "resource_type": "s3_bucket", "name": "polled-bucket", "environment": "dev",
+        }, headers=auth_headers)
+        req_id = res.json()["id"]
+
+        res = await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        etag = res.headers["etag"]
+        res = await client.get(
+            f"/api/requests/{req_id}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert res.status_code == 304
+        assert res.content == b""
+
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        audit_etag = res.headers["etag"]
+        assert audit_etag != etag
+        res = await client.get(
+            f"/api/requests/{req_id}/audit",
+            headers={**auth_headers, "If-None-Match": audit_etag},
+        )
+        assert res.status_code == 304
+
+        await client.post(
+            f"/api/admin/{req_id}/review",
+            json={"action": "approved", "comment": ""},
+            headers=approver_headers,
+        )
+        res = await client.get(
+            f"/api/requests/{req_id}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert res.status_code == 200
+        assert res.json()["status"] == "approved"
+        assert res.headers["etag"] != etag
+        res = await client.get(
+            f"/api/requests/{req_id}/audit",
+            headers={**auth_headers, "If-None-Match": audit_etag},
+        )
+        assert [log["action"] for log in res.json()] == ["created", "approved"]
+
+    async def test_list_items_match_response_model_serialization(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        from platformhub.main import app
+        from platformhub.schemas import ResourceRequestSummary
+
+        res = await client.post("/api/requests/", json={
+            "resource_type": "rds_database",
+            "name": "parity-db",
+            "environment": "dev",
+            "parameters": {"engine_version": "16", "instance_class": "db.t3.small"},
+        }, headers=auth_headers)
+        detail = (await client.get(f"/api/requests/{res.json()['id']}", headers=auth_headers))
+
+        [item] = (await client.get("/api/requests/", headers=auth_headers)).json()
+        assert item == {key: detail.json()[key] for key in ResourceRequestSummary.model_fields}
+
+        schema = app.openapi()["paths"]["/api/requests/"]["get"]["responses"]["200"]
+        items = schema["content"]["application/json"]["schema"]["items"]
+        assert items == {"$ref": "#/components/schemas/ResourceRequestSummary"}
@@ -0,0 +1,192 @@
+"""Tests for full-text request search."""
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _search(client: AsyncClient, headers: dict, q: str, **params) -> list[dict]:
+    res = await client.get("/api/requests/search", params={"q": q, **params}, headers=headers)
+    assert res.status_code == 200
+    return res.json()
+
+
+@pytest.mark.asyncio
+class TestSearch:
+    async def test_finds_names_parameters_and_prefixes(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        create_request,
+    ):
+        payments = await create_request(
+            auth_headers, "payments-api", parameters={"team": "checkout"}
+        )
+        ledger = await create_request(auth_headers, "ledger-api", parameters={"team": "payments"})
+
+        hits = await _search(client, auth_headers, "payments")
+        # Both match; the name match outranks the parameter match.
+        assert [h["id"] for h in hits] == [payments, ledger]
+        assert hits[0]["score"] > hits[1]["score"]
+        assert "[payments]" in hits[0]["snippet"]
+        assert hits[0]["name"] == "payments-api"
+
+        assert [h["id"] for h in await _search(client, auth_headers, "check")] == [payments]
+        assert [h["id"] for h in await _search(client, auth_headers, "ledger api")] == [ledger]
+        assert await _search(client, auth_headers, "ledger checkout") == []
+
+    async def test_indexes_reviews_and_audit_details(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        create_request,
+    ):
+        first = await create_request(auth_headers, "search-reviewed")
+        second = await create_request(auth_headers, "search-bulk")
+        await client.post(
+            f"/api/admin/{first}/review",
+            json={"action": "rejected", "comment": "duplicate of the shared cluster"},
+            headers=approver_headers,
+        )
+        await client.post(
+            "/api/admin/review",
+            json={"request_ids": [second], "action": "rejected", "comment": "quota exceeded"},
+            headers=approver_headers,
+        )
+
+        assert [h["id"] for h in await _search(client, auth_headers, "duplicate")] == [first]
+        assert [h["id"] for h in await _search(client, auth_headers, "quota")] == [second]
+        # Audit details: the "created" entry names the resource type.
+        hits = await _search(client, auth_headers, "requested k8s_namespace")
+        assert {h["id"] for h in hits} == {first, second}
+
+    async def test_developers_only_find_their_own_requests(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        create_request,
+        other_dev_headers,
+    ):
+        mine = await create_request(auth_headers, "scoped-mine")
+        theirs = await create_request(other_dev_headers, "scoped-theirs")
+
+        assert [h["id"] for h in await _search(client, auth_headers, "scoped")] == [mine]
+        assert [h["id"] for h in await _search(client, other_dev_headers, "scoped")] == [theirs]
+        hits = await _search(client, approver_headers, "scoped")
+        assert {h["id"] for h in hits} == {mine, theirs}
+
+    async def test_paginates_with_cursor(self, client: AsyncClient, auth_headers: dict):
+        res = await client.post(
+            "/api/requests/batch",
+            json={
+                "requests": [
+                    {
+                        "resource_type": "k8s_namespace",
+                        "name": f"paged-{i}",
+                        "environment": "dev",
+                        "parameters": {"team": "platform"},
+                    }
+                    for i in range(5)
+                ]
+            },
+            headers=auth_headers,
+        )
+        assert res.status_code == 201
+
+        seen, pages, cursor = [], 0, None
+        while True:
+            pages += 1
+            params = {"q": "paged", "limit": 2, **({"cursor": cursor} if cursor else {})}
+            res = await client.get("/api/requests/search", params=params, headers=auth_headers)
+            assert res.status_code == 200
+            seen.extend(h["id"] for h in res.json())
+            cursor = res.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        assert pages == 3
+        assert len(seen) == len(set(seen)) == 5
+
+    async def test_broad_queries_come_newest_first(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        monkeypatch,
+        create_request,
+    ):
+        from platformhub.services import search
+
+        ids = [await create_request(auth_headers, f"broad-{i}") for i in range(3)]
+        monkeypatch.setattr(search, "RANKED_MATCH_LIMIT", 2)
+        hits = await _search(client, auth_headers, "broad")
+        assert [h["id"] for h in hits] == ids[::-1]
+        assert all(h["score"] is None for h in hits)
+
+        monkeypatch.setattr(search, "RANKED_MATCH_LIMIT", 3)
+        hits = await _search(client, auth_headers, "broad")
+        assert all(h["score"] is not None for h in hits)
+
+    async def test_broadness_counts_only_the_callers_requests(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        monkeypatch,
+        create_request,
+    ):
+        from platformhub.services import search
+
+        for i in range(3):
+            await create_request(approver_headers, f"shared-{i}")
+        mine = await create_request(auth_headers, "shared-mine")
+        monkeypatch.setattr(search, "RANKED_MATCH_LIMIT", 2)
+
+        [hit] = await _search(client, auth_headers, "shared")
+        assert hit["id"] == mine
+        assert hit["score"] is not None
+        hits = await _search(client, approver_headers, "shared")
+        assert len(hits) == 4
+        assert all(h["score"] is None for h in hits)
+
+    async def test_query_syntax_is_treated_as_text(
+        self, client: AsyncClient, auth_headers: dict, create_request
+    ):
+        req_id = await create_request(auth_headers, "syntax-check")
+        for q in ['syntax"', "(syntax)", "syntax*", "-syntax", "syntax:check", "^check"]:
+            assert [h["id"] for h in await _search(client, auth_headers, q)] == [req_id]
+        # Operators are plain words that have to match too.
+        assert await _search(client, auth_headers, "syntax OR check") == []
+        assert await _search(client, auth_headers, "* ( )") == []
+
+        res = await client.get(
+            "/api/requests/search", params={"q": "x", "cursor": "bogus"}, headers=auth_headers
+        )
+        assert res.status_code == 400
+
+    async def test_rebuild_and_startup_backfill(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        admin_headers: dict,
+        db_session,
+        create_request,
+    ):
+        from sqlalchemy import text
+
+        from platformhub.services.search import ensure_search_index
+
+        req_id = await create_request(auth_headers, "search-backfill")
+        await db_session.execute(text("DELETE FROM request_search"))
+        await db_session.commit()
+        assert await _search(client, auth_headers, "backfill") == []
+
+        report = await ensure_search_index(db_session)
+        assert report is not None and report.indexed == 1
+        assert await ensure_search_index(db_session) is None
+        assert [h["id"] for h in await _search(client, auth_headers, "backfill")] == [req_id]
+
+        res = await client.post("/api/admin/search/rebuild", headers=admin_headers)
+        assert res.json() == {"indexed": 1}
+        assert [h["id"] for h in await _search(client, auth_headers, "platform")] == [req_id]
+        res = await client.post("/api/admin/search/rebuild", headers=auth_headers)
+        assert res.status_code == 403
@@ -0,0 +1,85 @@
+"""Tests for coordinated schema initialization and worker warm-up."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from platformhub.models import SchemaVersion
+from platformhub.services import startup
+from platformhub.services.query_stats import track_queries
+
+
+@pytest.fixture
+async def file_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'startup.db'}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestPrepareDatabase:
+    async def test_initializes_once_then_takes_the_fast_path(self, file_engine):
+        assert await startup.prepare_database(file_engine) is True
+        async with file_engine.connect() as conn:
+            stored = await conn.scalar(select(SchemaVersion.fingerprint))
+            assert await conn.scalar(text("SELECT count(*) FROM request_search")) == 0
+        assert stored == startup.schema_fingerprint(file_engine.dialect)
+
+        with track_queries() as stats:
+            assert await startup.prepare_database(file_engine) is False
+        assert stats.count == 1
+
+    async def test_concurrent_workers_initialize_once(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'workers.db'}"
+        engines = [create_async_engine(url) for _ in range(4)]
+        try:
+            results = await asyncio.gather(*(startup.prepare_database(e) for e in engines))
+            assert sorted(results) == [False, False, False, True]
+            async with engines[0].connect() as conn:
+                assert await conn.scalar(select(func.count()).select_from(SchemaVersion)) == 1
+        finally:
+            for engine in engines:
+                await engine.dispose()
+
+    async def test_schema_change_reruns_init_and_backfills(self, file_engine, monkeypatch):
+        from platformhub.auth import hash_password
+        from platformhub.models import RequestCounter, ResourceRequest, ResourceType, User
+
+        await startup.prepare_database(file_engine)
+        async with file_engine.begin() as conn:
+            user_id = (
+                await conn.execute(
+                    User.__table__.insert().values(
+                        username="old",
+                        email="old@test.com",
+                        hashed_password=hash_password("x"),
+                    )
+                )
+            ).inserted_primary_key[0]
+            await conn.execute(
+                ResourceRequest.__table__.insert().values(
+                    resource_type=ResourceType.S3_BUCKET,
+                    name="before-counters",
+                    environment="dev",
+                    parameters={},
+                    requester_id=user_id,
+                )
+            )
+
+        monkeypatch.setattr(startup, "SCHEMA_REVISION", startup.SCHEMA_REVISION + 1)
+        assert await startup.schema_is_current(file_engine) is False
+        assert await startup.prepare_database(file_engine) is True
+        async with file_engine.connect() as conn:
+            assert await conn.scalar(select(func.sum(RequestCounter.count))) == 1
+            assert await conn.scalar(text("SELECT count(*) FROM request_search")) == 1
+        assert await startup.schema_is_current(file_engine) is True
+
+
+@pytest.mark.asyncio
+async def test_warm_up_compiles_templates_and_fills_the_pool(file_engine):
+    from platformhub.main import templates
+
+    await startup.warm_up((file_engine, file_engine), templates.env)
+    assert file_engine.pool.checkedin() == file_engine.pool.size()
@@ -0,0 +1,143 @@
+"""Tests for the incrementally maintained dashboard statistics."""
+
+import pytest
+from httpx import AsyncClient
+
+# Buckets have no required parameters, so none are sent.
+BUCKET = {"resource_type": "s3_bucket", "parameters": {}}
+
+
+def _counts(stats: dict) -> dict[tuple[str, str, str], int]:
+    return {
+        (c["resource_type"], c["environment"], c["status"]): c["count"] for c in stats["counts"]
+    }
+
+
+@pytest.mark.asyncio
+class TestStats:
+    async def test_counts_follow_creates_and_reviews(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        create_request,
+    ):
+        first = await create_request(auth_headers, "stats-one", **BUCKET)
+        second = await create_request(auth_headers, "stats-two", environment="production", **BUCKET)
+        await client.post(
+            "/api/requests/batch",
+            json={
+                "requests": [
+                    {"resource_type": "s3_bucket", "name": f"stats-batch-{i}", "environment": "dev"}
+                    for i in range(3)
+                ]
+            },
+            headers=auth_headers,
+        )
+        await client.post(
+            f"/api/admin/{first}/review", json={"action": "approved"}, headers=approver_headers
+        )
+        await client.post(
+            "/api/admin/review",
+            json={"request_ids": [second], "action": "rejected"},
+            headers=approver_headers,
+        )
+
+        stats = (await client.get("/api/stats", headers=auth_headers)).json()
+        assert stats["totals"] == {"pending": 3, "rendering": 0, "approved": 1, "rejected": 1}
+        assert _counts(stats) == {
+            ("s3_bucket", "dev", "pending"): 3,
+            ("s3_bucket", "dev", "approved"): 1,
+            ("s3_bucket", "production", "rejected"): 1,
+        }
+        lead_times = {h["environment"]: h for h in stats["lead_times"]}
+        assert lead_times["dev"]["count"] == 1
+        assert lead_times["dev"]["buckets"][0] == {"le_seconds": 300, "count": 1}
+        assert lead_times["dev"]["buckets"][-1]["le_seconds"] is None
+        assert lead_times["production"]["count"] == 1
+
+    async def test_developers_only_see_their_own_counts(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        create_request,
+        other_dev_headers,
+    ):
+        await create_request(auth_headers, "stats-mine", **BUCKET)
+
+        res = await client.get("/api/stats", headers=other_dev_headers)
+        assert res.json()["totals"]["pending"] == 0
+        res = await client.get("/api/stats", headers=approver_headers)
+        assert res.json()["totals"]["pending"] == 1
+
+    async def test_render_pipeline_moves_rendering_to_approved(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        render_pipeline,
+        create_request,
+    ):
+        req_id = await create_request(auth_headers, "stats-rendered", **BUCKET)
+        await client.post(
+            f"/api/admin/{req_id}/review", json={"action": "approved"}, headers=approver_headers
+        )
+        stats = (await client.get("/api/stats", headers=auth_headers)).json()
+        assert stats["totals"]["rendering"] == 1
+
+        await render_pipeline.join()
+        stats = (await client.get("/api/stats", headers=auth_headers)).json()
+        assert stats["totals"]["rendering"] == 0
+        assert stats["totals"]["approved"] == 1
+
+    async def test_rebuild_matches_incremental_counters(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        admin_headers: dict,
+        create_request,
+    ):
+        ids = [await create_request(auth_headers, f"stats-rebuild-{i}", **BUCKET) for i in range(4)]
+        await client.post(
+            "/api/admin/review",
+            json={"request_ids": ids[:2], "action": "approved"},
+            headers=approver_headers,
+        )
+        before = (await client.get("/api/stats", headers=approver_headers)).json()
+
+        res = await client.post("/api/admin/stats/rebuild", headers=admin_headers)
+        assert res.json() == {"requests": 4, "reviewed": 2, "counter_rows": 2}
+        after = (await client.get("/api/stats", headers=approver_headers)).json()
+        assert after["totals"] == before["totals"]
+        assert after["counts"] == before["counts"]
+        assert after["lead_times"][0]["buckets"] == before["lead_times"][0]["buckets"]
+
+        res = await client.post("/api/admin/stats/rebuild", headers=approver_headers)
+        assert res.status_code == 403
+
+    async def test_startup_backfills_missing_counters(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db_session,
+        create_request,
+    ):
+        from sqlalchemy import delete
+
+        from platformhub.models import RequestCounter
+        from platformhub.services.stats import ensure_stats
+
+        await create_request(auth_headers, "stats-backfill", **BUCKET)
+        await db_session.execute(delete(RequestCounter))
+        await db_session.commit()
+
+        report = await ensure_stats(db_session)
+        assert report is not None and report.requests == 1
+        assert await ensure_stats(db_session) is None
+        res = await client.get("/api/stats", headers=auth_headers)
+        assert res.json()["totals"]["pending"] == 1
+
+    async def test_stats_require_auth(self, client: AsyncClient):
+        assert (await client.get("/api/stats")).status_code == 401
@@ -103,6 +103,149 @@ class TestWorkflow:
         assert res.status_code == 200
         assert len(res.json()) >= 1
 
+    async def test_pending_list_pagination_oldest_first(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        first = await self._create_request(client, auth_headers)
+        second = await self._create_request(client, auth_headers)
+        third = await self._create_request(client, auth_headers)
+
+        res = await client.get("/api/admin/pending", params={"limit": 2}, headers=approver_headers)
+        assert [r["id"] for r in res.json()] == [first, second]
+        cursor = res.headers["X-Next-Cursor"]
+
+        res = await client.get(
+            "/api/admin/pending",
+            params={"limit": 2, "cursor": cursor},
+            headers=approver_headers,
+        )
+        assert [r["id"] for r in res.json()] == [third]
+        assert "X-Next-Cursor" not in res.headers
+
+    async def test_bulk_review_reports_per_item(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        first = await self._create_request(client, auth_headers)
+        second = await self._create_request(client, auth_headers)
+        await client.post(
+            f"/api/admin/{second}/review",
+            json={"action": "rejected", "comment": ""},
+            headers=approver_headers,
+        )
+        third = await self._create_request(client, auth_headers)
+
+        res = await client.post(
+            "/api/admin/review",
+            json={"request_ids": [first, second, third, 9999], "action": "approved"},
+            headers=approver_headers,
+        )
+        assert res.status_code == 200
+        results = {r["request_id"]: r for r in res.json()}
+        assert results[first]["ok"] and results[third]["ok"]
+        assert results[second] == {
+            "request_id": second,
+            "ok": False,
+            "status": "rejected",
+            "error": "Request is already rejected",
+        }
+        assert results[9999]["error"] == "Request not found"
+
+        res = await client.get(f"/api/requests/{third}", headers=approver_headers)
+        assert res.json()["status"] == "approved"
+        assert "team-api-staging" in res.json()["generated_manifest"]
+
+        res = await client.get(f"/api/requests/{first}/audit", headers=approver_headers)
+        assert [log["action"] for log in res.json()] == ["created", "approved"]
+
+    async def test_bulk_review_reports_conflicts_per_item(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict, monkeypatch
+    ):
+        from sqlalchemy import update
+
+        from platformhub.models import ResourceRequest
+        from platformhub.services import approval
+
+        first = await self._create_request(client, auth_headers)
+        second = await self._create_request(client, auth_headers)
+        store_manifests = approval.store_manifests
+
+        async def _edited_meanwhile(db, texts):
+            # Someone else changes ``second`` after the bulk review has read it.
+            await db.execute(
+                update(ResourceRequest)
+                .where(ResourceRequest.id == second)
+                .values(version=ResourceRequest.version + 1)
+            )
+            return await store_manifests(db, texts)
+
+        monkeypatch.setattr(approval, "store_manifests", _edited_meanwhile)
+        res = await client.post(
+            "/api/admin/review",
+            json={"request_ids": [first, second], "action": "approved"},
+            headers=approver_headers,
+        )
+        assert res.status_code == 200
+        results = {r["request_id"]: r for r in res.json()}
+        assert results[first]["ok"]
+        assert (results[second]["ok"], results[second]["error"]) == (False, "conflict")
+
+        res = await client.get(f"/api/requests/{second}", headers=approver_headers)
+        assert res.json()["status"] == "pending"
+        res = await client.get(f"/api/requests/{second}/audit", headers=approver_headers)
+        assert [log["action"] for log in res.json()] == ["created"]
+
+    async def test_bulk_review_rejects_invalid_action(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        req_id = await self._create_request(client, auth_headers)
+        res = await client.post(
+            "/api/admin/review",
+            json={"request_ids": [req_id], "action": "pending"},
+            headers=approver_headers,
+        )
+        assert res.status_code == 400
+
+    async def test_list_responses_omit_manifest(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        req_id = await self._create_request(client, auth_headers)
+        await client.post(
+            f"/api/admin/{req_id}/review",
+            json={"action": "approved", "comment": ""},
+            headers=approver_headers,
+        )
+
+        res = await client.get("/api/requests/", headers=auth_headers)
+        assert res.json()[0]["status"] == "approved"
+        assert "generated_manifest" not in res.json()[0]
+
+    async def test_manifest_endpoint_etag(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        req_id = await self._create_request(client, auth_headers)
+        res = await client.get(f"/api/requests/{req_id}/manifest", headers=auth_headers)
+        assert res.status_code == 404
+
+        await client.post(
+            f"/api/admin/{req_id}/review",
+            json={"action": "approved", "comment": ""},
+            headers=approver_headers,
+        )
+
+        res = await client.get(f"/api/requests/{req_id}/manifest", headers=auth_headers)
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("application/yaml")
+        assert "ResourceQuota" in res.text
+        etag = res.headers["ETag"]
+
+        res = await client.get(
+            f"/api/requests/{req_id}/manifest",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert res.status_code == 304
+        assert res.content == b""
+        assert res.headers["ETag"] == etag
+
 
 @pytest.mark.asyncio
 class TestManifestGeneration:
@@ -165,3 +308,391 @@ class TestManifestGeneration:
         assert "aws_db_instance" in manifest
         assert "orders-db-dev" in manifest
         assert "storage_encrypted" in manifest
+
+
+@pytest.mark.asyncio
+class TestBackgroundRendering:
+    async def _approve(self, client, auth_headers, approver_headers):
+        res = await client.post(
+            "/api/requests/",
+            json={
+                "resource_type": "k8s_namespace",
+                "name": "team-api",
+                "environment": "staging",
+                "parameters": {"team": "api"},
+            },
+            headers=auth_headers,
+        )
+        req_id = res.json()["id"]
+        res = await client.post(
+            f"/api/admin/{req_id}/review",
+            json={"action": "approved", "comment": "LGTM"},
+            headers=approver_headers,
+        )
+        return req_id, res
+
+    async def test_approval_renders_in_background(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict, render_pipeline
+    ):
+        req_id, res = await self._approve(client, auth_headers, approver_headers)
+        assert res.status_code == 200
+        assert res.json()["status"] == "rendering"
+        assert res.json()["generated_manifest"] is None
+
+        await render_pipeline.join()
+
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        assert res.json()["status"] == "succeeded"
+        assert res.json()["attempts"] == 1
+
+        res = await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        assert res.json()["status"] == "approved"
+        assert "team-api-staging" in res.json()["generated_manifest"]
+
+    async def test_no_session_is_held_while_rendering(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        render_pipeline,
+        monkeypatch,
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+        from contextlib import asynccontextmanager
+
+        from platformhub.services import rendering
+
+        factory = render_pipeline.session_factory
+        render = rendering.render_manifest
+        open_sessions = 0
+        seen = []
+
+        @asynccontextmanager
+        async def _counted():
+            nonlocal open_sessions
+            open_sessions += 1
+            try:
+                async with factory() as db:
+                    yield db
+            finally:
+                open_sessions -= 1
+
+        def _render(*args):
+            seen.append(open_sessions)
+            return render(*args)
+
+        await render_pipeline.stop()
+        monkeypatch.setattr(rendering, "render_manifest", _render)
+        monkeypatch.setattr(render_pipeline, "session_factory", _counted)
+        monkeypatch.setattr(render_pipeline, "executor_factory", ThreadPoolExecutor)
+        await render_pipeline.start()
+
+        req_id, _ = await self._approve(client, auth_headers, approver_headers)
+        await render_pipeline.join()
+
+        assert seen == [0]
+        res = await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        assert res.json()["status"] == "approved"
+
+    async def test_job_status_follows_the_worker(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        render_pipeline,
+        monkeypatch,
+    ):
+        import asyncio
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from platformhub.services import rendering
+
+        render = rendering.render_manifest
+        calls = 0
+        started = threading.Event()
+        release = threading.Event()
+
+        def _flaky(*args):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("transient")
+            started.set()
+            release.wait(timeout=10)
+            return render(*args)
+
+        await render_pipeline.stop()
+        monkeypatch.setattr(rendering, "render_manifest", _flaky)
+        monkeypatch.setattr(render_pipeline, "_backoff", 60)
+        monkeypatch.setattr(render_pipeline, "executor_factory", ThreadPoolExecutor)
+        await render_pipeline.start()
+
+        req_id, _ = await self._approve(client, auth_headers, approver_headers)
+        for _ in range(200):
+            res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+            if res.json()["error"]:
+                break
+            await asyncio.sleep(0.01)
+        # The first attempt failed and the worker is sleeping before the next one.
+        job = res.json()
+        assert (job["status"], job["attempts"], job["started_at"]) == ("queued", 1, None)
+
+        # A restart cancels the backoff and re-queues the job.
+        await render_pipeline.stop()
+        await render_pipeline.start()
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 10)
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        assert res.json()["status"] == "running"
+        assert res.json()["started_at"] is not None
+
+        release.set()
+        await render_pipeline.join()
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        assert res.json()["status"] == "succeeded"
+
+    async def test_render_failure_is_retried_then_recorded(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        render_pipeline,
+        monkeypatch,
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from platformhub.services import rendering
+
+        def _broken(*_args):
+            raise RuntimeError("template exploded")
+
+        await render_pipeline.stop()
+        monkeypatch.setattr(rendering, "render_manifest", _broken)
+        monkeypatch.setattr(render_pipeline, "_backoff", 0)
+        monkeypatch.setattr(render_pipeline, "executor_factory", ThreadPoolExecutor)
+        await render_pipeline.start()
+
+        req_id, res = await self._approve(client, auth_headers, approver_headers)
+        assert res.status_code == 200
+        await render_pipeline.join()
+
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        job = res.json()
+        assert job["status"] == "failed"
+        assert job["attempts"] == 3
+        assert job["error"] == "template exploded"
+
+        res = await client.get(f"/api/requests/{req_id}/audit", headers=auth_headers)
+        assert [log["action"] for log in res.json()] == ["created", "approved", "render_failed"]
+
+        # Back to pending, so it can be approved again.
+        res = await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        assert res.json()["status"] == "pending"
+        assert res.json()["reviewer_id"] is None
+        res = await client.get("/api/stats", headers=approver_headers)
+        assert res.json()["totals"]["pending"] == 1
+        assert res.json()["totals"]["rendering"] == 0
+
+    async def test_start_requeues_requests_left_rendering(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        approver_headers: dict,
+        render_pipeline,
+        db_session,
+    ):
+        from datetime import UTC, datetime
+
+        from sqlalchemy import select
+
+        from platformhub.models import ResourceRequest
+        from platformhub.services.rendering import mark_queued
+
+        await render_pipeline.stop()
+        res = await client.post(
+            "/api/requests/",
+            json={
+                "resource_type": "k8s_namespace",
+                "name": "team-web",
+                "environment": "dev",
+                "parameters": {"team": "web"},
+            },
+            headers=auth_headers,
+        )
+        req_id = res.json()["id"]
+        # As if the process that approved it died before rendering.
+        req = await db_session.scalar(select(ResourceRequest).where(ResourceRequest.id == req_id))
+        mark_queued(req, datetime.now(tz=UTC))
+        await db_session.commit()
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        assert res.json()["status"] == "queued"
+
+        await render_pipeline.start()
+        await render_pipeline.join()
+
+        res = await client.get(f"/api/requests/{req_id}/render", headers=auth_headers)
+        assert res.json()["status"] == "succeeded"
+        res = await client.get(f"/api/requests/{req_id}", headers=auth_headers)
+        assert res.json()["status"] == "approved"
+
+
+class TestTemplateRegistry:
+    def test_identical_renders_are_memoized(self):
+        from platformhub.models import ResourceType
+        from platformhub.services.generator import TEMPLATE_MAP, TemplateRegistry, _env
+
+        registry = TemplateRegistry(_env, cache_size=8)
+        registry.compile_all()
+        assert set(registry._templates) == set(TEMPLATE_MAP)
+
+        params = {"region": "eu-west-1", "versioning": "true"}
+        first = registry.render(ResourceType.S3_BUCKET, "assets", "dev", params)
+        reordered = dict(reversed(params.items()))
+        second = registry.render(ResourceType.S3_BUCKET, "assets", "dev", reordered)
+        assert first == second
+        assert (registry.hits, registry.misses) == (1, 1)
+
+        registry.render(ResourceType.S3_BUCKET, "assets", "staging", params)
+        assert registry.misses == 2
+
+
+@pytest.mark.asyncio
+class TestManifestStore:
+    async def test_identical_manifests_share_one_blob(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict, db_session
+    ):
+        from sqlalchemy import func, select
+
+        from platformhub.models import ManifestBlob
+
+        ids = []
+        for _ in range(2):
+            res = await client.post(
+                "/api/requests/",
+                json={
+                    "resource_type": "s3_bucket",
+                    "name": "shared-assets",
+                    "environment": "dev",
+                    "parameters": {"region": "eu-west-1"},
+                },
+                headers=auth_headers,
+            )
+            ids.append(res.json()["id"])
+
+        res = await client.post(
+            "/api/admin/review",
+            json={"request_ids": ids, "action": "approved"},
+            headers=approver_headers,
+        )
+        assert all(item["ok"] for item in res.json())
+
+        count = await db_session.scalar(select(func.count()).select_from(ManifestBlob))
+        assert count == 1
+
+        res = await client.get(f"/api/requests/{ids[1]}", headers=auth_headers)
+        assert "shared-assets-dev" in res.json()["generated_manifest"]
+
+    async def test_migrate_inline_manifests(self, db_session):
+        from platformhub.models import ResourceRequest, ResourceType, User
+        from platformhub.services.manifest_store import migrate_inline_manifests
+
+        user = User(username="legacy", email="legacy@test.com", hashed_password="!")  # noqa: S106
+        db_session.add(user)
+        await db_session.flush()
+        manifest = "apiVersion: v1\nkind: Namespace\n" * 50
+        for i in range(3):
+            db_session.add(
+                ResourceRequest(
+                    resource_type=ResourceType.K8S_NAMESPACE,
+                    name=f"legacy-{i}",
+                    environment="dev",
+                    requester_id=user.id,
+                    inline_manifest=manifest,
+                )
+            )
+        await db_session.commit()
+
+        report = await migrate_inline_manifests(db_session, batch_size=2)
+        assert report.migrated_rows == 3
+        assert report.distinct_manifests == 1
+        assert report.inline_bytes == 3 * len(manifest)
+        assert 0 < report.stored_bytes < len(manifest)
+        assert report.saved_bytes == report.inline_bytes - report.stored_bytes
+
+        again = await migrate_inline_manifests(db_session)
+        assert again.migrated_rows == 0
+
+
+@pytest.mark.asyncio
+class TestExport:
+    async def _create(self, client, auth_headers, count):
+        await client.post(
+            "/api/requests/batch",
+            json={
+                "requests": [
+                    {"resource_type": "s3_bucket", "name": f"export-{i}", "environment": "dev"}
+                    for i in range(count)
+                ]
+            },
+            headers=auth_headers,
+        )
+
+    async def test_export_requests_ndjson_and_csv(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict, monkeypatch
+    ):
+        import csv
+        import json
+
+        from platformhub.services import export
+
+        monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 2)
+        await self._create(client, auth_headers, 5)
+
+        res = await client.get("/api/admin/export/requests", headers=admin_headers)
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in res.text.splitlines()]
+        assert [row["name"] for row in rows] == [f"export-{i}" for i in range(5)]
+        assert rows[0]["status"] == "pending"
+        assert rows[0]["parameters"]["versioning"] == "true"
+
+        res = await client.get(
+            "/api/admin/export/requests", params={"format": "csv"}, headers=admin_headers
+        )
+        assert res.headers["content-type"].startswith("text/csv")
+        assert 'filename="requests.csv"' in res.headers["content-disposition"]
+        table = list(csv.DictReader(res.text.splitlines()))
+        assert [row["name"] for row in table] == [f"export-{i}" for i in range(5)]
+        assert table[0]["reviewer_id"] == ""
+
+    async def test_export_audit_time_range(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict
+    ):
+        import json
+        from datetime import UTC, datetime, timedelta
+
+        await self._create(client, auth_headers, 3)
+
+        res = await client.get("/api/admin/export/audit", headers=admin_headers)
+        rows = [json.loads(line) for line in res.text.splitlines()]
+        assert [row["action"] for row in rows] == ["created"] * 3
+        assert rows[0]["actor"] == "testdev"
+
+        future = (datetime.now(tz=UTC) + timedelta(hours=1)).isoformat()
+        res = await client.get(
+            "/api/admin/export/audit", params={"since": future}, headers=admin_headers
+        )
+        assert res.text == ""
+
+        res = await client.get(
+            "/api/admin/export/audit",
+            params={"until": future, "format": "csv"},
+            headers=admin_headers,
+        )
+        assert len(res.text.splitlines()) == 4
+
+    async def test_export_requires_admin(
+        self, client: AsyncClient, auth_headers: dict, approver_headers: dict
+    ):
+        res = await client.get("/api/admin/export/requests", headers=approver_headers)
+        assert res.status_code == 403